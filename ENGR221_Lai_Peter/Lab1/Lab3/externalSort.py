@@ -0,0 +1,178 @@
+"""
+Name: Peter Lai
+externalSort.py
+Description: External merge sort for files that do not fit in memory.
+The input is read in chunks that fit in the memory budget, each chunk is
+sorted and written to a temporary run file, and the runs are merged with a
+buffered k-way merge into the output file.
+
+Two file formats are supported:
+    - text files with one integer per line (record_format=None)
+    - binary files of fixed-width records described by a struct format,
+      e.g. '<qd' for an 8 byte int followed by an 8 byte float. These are
+      read through mmap and sorted by the field at key_field.
+"""
+
+import argparse, mmap, os, struct, sys, tempfile
+
+from .sorting_tests import hybridMergeSort, kWayMerge
+
+# Default memory budget for sorting (bytes)
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+# Most run files merged at once; more runs are merged in several passes
+MERGE_FANIN = 64
+# Smallest read/write buffer per file during a merge (bytes)
+MIN_BUFFER = 64 * 1024
+
+# Returns an estimate of the memory (bytes) one record takes in a chunk:
+# the list slot, the object itself, and its fields for tuples
+def _recordSize(record) -> int:
+    size = 8 + sys.getsizeof(record)
+    if isinstance(record, tuple):
+        size += sum(sys.getsizeof(field) for field in record)
+    return size
+
+# Sorts one chunk of records by key (or by the records themselves)
+def _sortChunk(chunk:list, key, chunk_sort) -> list:
+    if key is None:
+        return chunk_sort(chunk)
+    return chunk_sort(chunk, key=key)
+
+#####
+# Reading and writing records
+#####
+
+# Yields the integers in a text file, one per line
+def _readTextRecords(path:str, buffer_size:int):
+    with open(path, 'r', buffering=buffer_size) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield int(line)
+
+# Yields the records of a binary file of fixed-width records, reading the
+# input through a memory map, block by block
+def _readMappedRecords(path:str, record_format:str, block_size:int):
+    record_size = struct.calcsize(record_format)
+    with open(path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size % record_size != 0:
+            raise ValueError("{} is not a whole number of {} byte records".format(path, record_size))
+        if file_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            block_size = max(record_size, block_size - block_size % record_size)
+            for start in range(0, file_size, block_size):
+                block = memoryview(mm)[start:start + block_size]
+                try:
+                    yield from struct.iter_unpack(record_format, block)
+                finally:
+                    block.release()
+
+# Yields the records of a binary run file, reading buffer_size bytes at a time
+def _readBinaryRecords(path:str, record_format:str, buffer_size:int):
+    record_size = struct.calcsize(record_format)
+    buffer_size = max(record_size, buffer_size - buffer_size % record_size)
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(buffer_size)
+            if not block:
+                return
+            yield from struct.iter_unpack(record_format, block)
+
+# Writes records to path as text lines or packed binary records
+def _writeRecords(path:str, records, record_format:str, buffer_size:int) -> None:
+    if record_format is None:
+        with open(path, 'w', buffering=buffer_size) as f:
+            for record in records:
+                f.write("{}\n".format(record))
+    else:
+        pack = struct.Struct(record_format).pack
+        with open(path, 'wb', buffering=buffer_size) as f:
+            for record in records:
+                f.write(pack(*record))
+
+# Yields the records of a run file
+def _readRun(path:str, record_format:str, buffer_size:int):
+    if record_format is None:
+        return _readTextRecords(path, buffer_size)
+    return _readBinaryRecords(path, record_format, buffer_size)
+
+#####
+# Sorting
+#####
+
+# Splits the input into sorted run files in temp_dir, each made from as many
+# records as fit in memory_budget. Returns the run file paths in input order.
+def makeRuns(input_path:str, temp_dir:str, memory_budget:int=DEFAULT_MEMORY_BUDGET,
+             record_format:str=None, key=None, chunk_sort=hybridMergeSort) -> list:
+    if record_format is None:
+        records = _readTextRecords(input_path, MIN_BUFFER)
+    else:
+        records = _readMappedRecords(input_path, record_format, MIN_BUFFER)
+    runs = []
+    chunk = []
+    used = 0
+    for record in records:
+        chunk.append(record)
+        used += _recordSize(record)
+        if used >= memory_budget:
+            runs.append(_writeRun(chunk, temp_dir, len(runs), record_format, key, chunk_sort))
+            chunk = []
+            used = 0
+    if chunk or not runs:
+        runs.append(_writeRun(chunk, temp_dir, len(runs), record_format, key, chunk_sort))
+    return runs
+
+# Sorts one chunk and writes it to a new run file. Returns the file path.
+def _writeRun(chunk:list, temp_dir:str, number:int, record_format:str, key, chunk_sort) -> str:
+    path = os.path.join(temp_dir, "run{:06d}".format(number))
+    _writeRecords(path, _sortChunk(chunk, key, chunk_sort), record_format, MIN_BUFFER)
+    return path
+
+# Merges sorted run files into output_path, splitting memory_budget between
+# the read buffers of the runs and the output buffer
+def mergeRuns(runs:list, output_path:str, memory_budget:int=DEFAULT_MEMORY_BUDGET,
+              record_format:str=None, key=None) -> None:
+    buffer_size = max(MIN_BUFFER, memory_budget // (len(runs) + 1))
+    readers = [_readRun(path, record_format, buffer_size) for path in runs]
+    _writeRecords(output_path, kWayMerge(readers, key), record_format, buffer_size)
+
+# Sorts the records in input_path into output_path using at most about
+# memory_budget bytes of memory for records. Binary files of fixed-width
+# records are described by record_format (a struct format) and sorted by the
+# field at key_field (or by the whole record if key_field is None).
+# The sort is stable.
+def externalSort(input_path:str, output_path:str, memory_budget:int=DEFAULT_MEMORY_BUDGET,
+                 record_format:str=None, key_field:int=0, temp_dir:str=None,
+                 chunk_sort=hybridMergeSort) -> None:
+    key = None
+    if record_format is not None and key_field is not None:
+        key = lambda record: record[key_field]
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        runs = makeRuns(input_path, work_dir, memory_budget, record_format, key, chunk_sort)
+        # Merge at most MERGE_FANIN runs at a time until few enough are left
+        merge_pass = 0
+        while len(runs) > MERGE_FANIN:
+            merged = []
+            for start in range(0, len(runs), MERGE_FANIN):
+                path = os.path.join(work_dir, "pass{}_{:06d}".format(merge_pass, len(merged)))
+                mergeRuns(runs[start:start + MERGE_FANIN], path, memory_budget, record_format, key)
+                merged.append(path)
+            for path in runs:
+                os.remove(path)
+            runs = merged
+            merge_pass += 1
+        mergeRuns(runs, output_path, memory_budget, record_format, key)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Sort a file larger than memory.")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--memory", type=int, default=DEFAULT_MEMORY_BUDGET,
+                        help="memory budget in bytes")
+    parser.add_argument("--format", dest="record_format",
+                        help="struct format of fixed-width binary records")
+    parser.add_argument("--key-field", type=int, default=0)
+    args = parser.parse_args()
+    externalSort(args.input, args.output, args.memory, args.record_format, args.key_field)
@@ -0,0 +1,303 @@
+"""
+Name: Peter Lai
+sortBenchmark.py
+Description: Benchmark runner for the sorting algorithms. Times every sort
+with several warmup runs and repeated trials over different input
+distributions, saves the results as JSON and compares them to a baseline.
+
+Run from the Lab1 folder:
+    python -m Lab3.sortBenchmark --sizes 1000 10000 --output results.json
+    python -m Lab3.sortBenchmark --baseline results.json
+    python -m Lab3.sortBenchmark --count --sizes 1000 2000 4000
+    python -m Lab3.sortBenchmark --distributions nicknames --sizes 1000000 \
+        --functions hybridMergeSort msdRadixSort
+"""
+
+import argparse, gc, json, math, os, platform, random, sys, time
+
+from .sorting_tests import adaptiveSort, bubbleSort, countingSort, hybridMergeSort, insertionSort, \
+                           introSort, msdRadixSort, radixSort, vectorizedSort
+from .sortInstrumentation import fitGrowthExponent, instrumentSort
+
+# Sorting functions the runner knows about, by name
+SORTS = {
+    "insertionSort": insertionSort,
+    "bubbleSort": bubbleSort,
+    "hybridMergeSort": hybridMergeSort,
+    "introSort": introSort,
+    "countingSort": countingSort,
+    "radixSort": radixSort,
+    "vectorizedSort": vectorizedSort,
+    "adaptiveSort": adaptiveSort,
+    "msdRadixSort": msdRadixSort,
+}
+
+# Quadratic sorts are skipped above this size
+QUADRATIC_SORTS = {"insertionSort", "bubbleSort"}
+QUADRATIC_LIMIT = 10000
+# Sorts that only take integers, or only strings
+INTEGER_SORTS = {"countingSort", "radixSort"}
+STRING_SORTS = {"msdRadixSort"}
+# Sorts that look at the type of their values, so comparisons cannot be
+# counted by wrapping the values
+TYPED_SORTS = INTEGER_SORTS | STRING_SORTS | {"vectorizedSort", "adaptiveSort"}
+
+# Nickname vocabulary used for the string benchmarks
+ENTRIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "..", "..", "Lab7", "entries.txt")
+
+# Default slowdown (fraction of the baseline median) that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+#####
+# Input distributions
+#####
+
+# Random integers with few repeats
+def randomInput(length:int, rng:random.Random) -> list:
+    return [rng.randrange(max(100, length)) for _ in range(length)]
+
+# Already sorted
+def sortedInput(length:int, rng:random.Random) -> list:
+    return list(range(length))
+
+# Sorted in descending order
+def reversedInput(length:int, rng:random.Random) -> list:
+    return list(range(length, 0, -1))
+
+# Sorted, except for about 1% of the values swapped to random positions
+def nearlySortedInput(length:int, rng:random.Random) -> list:
+    values = list(range(length))
+    for _ in range(max(1, length // 100)):
+        i, j = rng.randrange(length), rng.randrange(length)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+# Only about 10 distinct values
+def manyDuplicatesInput(length:int, rng:random.Random) -> list:
+    return [rng.randrange(10) for _ in range(length)]
+
+# Ascending then descending, like the pipes of an organ
+def organPipeInput(length:int, rng:random.Random) -> list:
+    half = length // 2
+    return list(range(half)) + list(range(length - half, 0, -1))
+
+# Nicknames from Lab7/entries.txt, scaled up to any length by adding a
+# numeric suffix, so many keys share a long prefix
+def nicknameInput(length:int, rng:random.Random) -> list:
+    with open(ENTRIES_PATH, 'r') as f:
+        vocabulary = [line.split()[0] for line in f if line.strip()]
+    return [rng.choice(vocabulary) + str(rng.randrange(max(100, length)))
+            for _ in range(length)]
+
+DISTRIBUTIONS = {
+    "random": randomInput,
+    "sorted": sortedInput,
+    "reversed": reversedInput,
+    "nearly_sorted": nearlySortedInput,
+    "many_duplicates": manyDuplicatesInput,
+    "organ_pipe": organPipeInput,
+    "nicknames": nicknameInput,
+}
+# Distributions made of strings rather than integers
+STRING_DISTRIBUTIONS = {"nicknames"}
+
+#####
+# Timing
+#####
+
+# Returns the value at the given percentile (0-100) of the samples,
+# using the nearest-rank method
+def percentile(samples:list, pct:float) -> int:
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+# Returns a summary (ns) of a list of timing samples
+def summarize(samples:list) -> dict:
+    return {
+        "min_ns": min(samples),
+        "median_ns": percentile(samples, 50),
+        "p95_ns": percentile(samples, 95),
+        "mean_ns": sum(samples) // len(samples),
+        "trials": len(samples),
+    }
+
+# Returns a list of trials timings (ns) for function_to_run on copies of values,
+# after running it warmup times untimed. Copying the input is not timed.
+def timeSort(function_to_run, values:list, trials:int=5, warmup:int=1) -> list:
+    for _ in range(warmup):
+        function_to_run(list(values))
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    # Keep the garbage collector from adding noise to the samples
+    gc.disable()
+    try:
+        for _ in range(trials):
+            list_to_sort = list(values)
+            start_time = time.perf_counter_ns()
+            function_to_run(list_to_sort)
+            samples.append(time.perf_counter_ns() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+# Benchmarks every function in functions (name -> function) on every
+# distribution and size. Returns the results as a JSON-ready dict.
+# If count is True, each case is also run once, untimed, through
+# instrumentSort to record comparisons, moves and peak memory, and the
+# growth exponents of the counts and times across sizes are added.
+def runBenchmarks(functions:dict, sizes:list, distributions:list=None,
+                  trials:int=5, warmup:int=1, seed:int=0, count:bool=False) -> dict:
+    if distributions is None:
+        distributions = list(DISTRIBUTIONS)
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            # Every function sorts the same input
+            values = DISTRIBUTIONS[distribution](size, random.Random(seed))
+            for name, function_to_run in functions.items():
+                if name in QUADRATIC_SORTS and size > QUADRATIC_LIMIT:
+                    continue
+                # Skip sorts that cannot take this kind of value
+                strings = distribution in STRING_DISTRIBUTIONS
+                if (strings and name in INTEGER_SORTS) or (not strings and name in STRING_SORTS):
+                    continue
+                entry = {"function": name, "distribution": distribution, "size": size}
+                entry.update(summarize(timeSort(function_to_run, values, trials, warmup)))
+                if count:
+                    _, counters = instrumentSort(function_to_run, values,
+                                                 count_comparisons=name not in TYPED_SORTS)
+                    entry.update(counters.asDict())
+                results.append(entry)
+    benchmark = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "trials": trials,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "results": results,
+    }
+    if count:
+        benchmark["growth"] = growthExponents(results)
+    return benchmark
+
+# Returns the fitted growth exponent (see fitGrowthExponent) of the median
+# time and of each count, for every function and distribution measured at
+# two or more sizes. Counts that were not taken (None) get no exponent.
+def growthExponents(results:list) -> list:
+    cases = {}
+    for r in results:
+        cases.setdefault((r["function"], r["distribution"]), []).append(r)
+    growth = []
+    for (name, distribution), entries in cases.items():
+        sizes = [r["size"] for r in entries]
+        if len(set(sizes)) < 2:
+            continue
+        entry = {"function": name, "distribution": distribution}
+        for measure in ("median_ns", "comparisons", "moves", "peak_bytes"):
+            if all(r.get(measure) is not None for r in entries):
+                exponent = fitGrowthExponent(sizes, [r[measure] for r in entries])
+                entry[measure] = None if exponent is None else round(exponent, 3)
+        growth.append(entry)
+    return growth
+
+#####
+# Result files
+#####
+
+# Writes benchmark results to a JSON file
+def saveResults(results:dict, path:str) -> None:
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+# Reads benchmark results from a JSON file
+def loadResults(path:str) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Compares two sets of results by median time. Returns a list of the
+# (function, distribution, size) cases that got slower by more than threshold,
+# with the baseline and current medians and their ratio.
+def compareResults(baseline:dict, current:dict, threshold:float=DEFAULT_THRESHOLD) -> list:
+    old = {(r["function"], r["distribution"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        case = (r["function"], r["distribution"], r["size"])
+        if case not in old:
+            continue
+        ratio = r["median_ns"] / max(1, old[case]["median_ns"])
+        if ratio > 1 + threshold:
+            regressions.append({
+                "function": case[0],
+                "distribution": case[1],
+                "size": case[2],
+                "baseline_median_ns": old[case]["median_ns"],
+                "median_ns": r["median_ns"],
+                "ratio": round(ratio, 3),
+            })
+    return regressions
+
+# Returns a growth exponent as text, or "-" if that measure has none
+def _showExponent(growth:dict, measure:str) -> str:
+    return "-" if growth.get(measure) is None else str(growth[measure])
+
+# Prints results as a table, with medians and p95s in milliseconds
+def printResults(results:dict) -> None:
+    print("{:<16} {:<16} {:>9} {:>12} {:>12}".format(
+        "function", "distribution", "size", "median ms", "p95 ms"))
+    for r in results["results"]:
+        print("{:<16} {:<16} {:>9} {:>12.3f} {:>12.3f}".format(
+            r["function"], r["distribution"], r["size"],
+            r["median_ns"] / 1e6, r["p95_ns"] / 1e6))
+    if "growth" in results:
+        print("\nGrowth exponents (measure ~ size ** k)")
+        print("{:<16} {:<16} {:>8} {:>12} {:>8} {:>8}".format(
+            "function", "distribution", "time", "comparisons", "moves", "memory"))
+        for g in results["growth"]:
+            print("{:<16} {:<16} {:>8} {:>12} {:>8} {:>8}".format(
+                g["function"], g["distribution"], _showExponent(g, "median_ns"),
+                _showExponent(g, "comparisons"), _showExponent(g, "moves"), _showExponent(g, "peak_bytes")))
+
+# Command line entry point. Returns 1 if a regression was found, 0 otherwise.
+def main(argv:list=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms.")
+    parser.add_argument("--functions", nargs="+", choices=list(SORTS), default=list(SORTS))
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS),
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown fraction that counts as a regression")
+    parser.add_argument("--count", action="store_true",
+                        help="also count comparisons, moves and peak memory, "
+                             "and fit growth exponents across sizes")
+    args = parser.parse_args(argv)
+
+    functions = {name: SORTS[name] for name in args.functions}
+    results = runBenchmarks(functions, args.sizes, args.distributions,
+                            args.trials, args.warmup, args.seed, args.count)
+    printResults(results)
+    if args.output:
+        saveResults(results, args.output)
+
+    if args.baseline:
+        regressions = compareResults(loadResults(args.baseline), results, args.threshold)
+        for r in regressions:
+            print("SLOWER: {} on {} ({} items): {:.3f} ms -> {:.3f} ms (x{})".format(
+                r["function"], r["distribution"], r["size"],
+                r["baseline_median_ns"] / 1e6, r["median_ns"] / 1e6, r["ratio"]))
+        if regressions:
+            return 1
+        print("No regressions against", args.baseline)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
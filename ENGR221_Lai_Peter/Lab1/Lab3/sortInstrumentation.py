@@ -0,0 +1,121 @@
+"""
+Name: Peter Lai
+sortInstrumentation.py
+Description: Opt-in instrumentation for the sorting algorithms. Counts the
+comparisons and element moves a sort makes and the peak memory it allocates,
+without changing the sorts themselves: instrumentSort wraps the values and
+the list before handing them to the sort, so there is no cost when it is not
+used.
+"""
+
+import math, tracemalloc
+
+# Counts collected while a sort runs
+class SortCounters():
+    def __init__(self):
+        self.comparisons = 0    # Comparisons between values (None if not counted)
+        self.moves = 0          # Values written into the list being sorted (None if not counted)
+        self.peak_bytes = 0     # Peak memory allocated while sorting
+
+    # Return the counts as a dict
+    def asDict(self) -> dict:
+        return {"comparisons": self.comparisons, "moves": self.moves,
+                "peak_bytes": self.peak_bytes}
+
+    def __str__(self):
+        return "comparisons: {}, moves: {}, peak_bytes: {}".format(
+            self.comparisons, self.moves, self.peak_bytes)
+
+# A value that counts every comparison made with it
+class CountedValue():
+    __slots__ = ('value', 'counters')
+
+    def __init__(self, value, counters:SortCounters):
+        self.value = value
+        self.counters = counters
+
+    def __lt__(self, other):
+        self.counters.comparisons += 1
+        return self.value < _unwrap(other)
+
+    def __le__(self, other):
+        self.counters.comparisons += 1
+        return self.value <= _unwrap(other)
+
+    def __gt__(self, other):
+        self.counters.comparisons += 1
+        return self.value > _unwrap(other)
+
+    def __ge__(self, other):
+        self.counters.comparisons += 1
+        return self.value >= _unwrap(other)
+
+    def __eq__(self, other):
+        self.counters.comparisons += 1
+        return self.value == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return "CountedValue({!r})".format(self.value)
+
+# Return the plain value inside a CountedValue
+def _unwrap(value):
+    return value.value if type(value) is CountedValue else value
+
+# A list that counts the values written into it
+class CountingList(list):
+    def __init__(self, values, counters:SortCounters):
+        super().__init__(values)
+        self.counters = counters
+
+    def __setitem__(self, idx, value):
+        if isinstance(idx, slice):
+            if not hasattr(value, '__len__'):
+                value = list(value)
+            self.counters.moves += len(value)
+        else:
+            self.counters.moves += 1
+        super().__setitem__(idx, value)
+
+# Sorts a copy of values with sort_function while counting its comparisons,
+# moves and peak memory. Sorts that look at the type of their values (radix,
+# counting, vectorized...) need count_comparisons=False, which leaves the
+# values unwrapped and only counts memory. Their moves are left as None too:
+# they do their work in buckets and arrays of their own, so the writes into
+# the list would always be one per value whatever the input.
+# Returns the sorted values and the SortCounters.
+def instrumentSort(sort_function, values, count_comparisons:bool=True) -> tuple:
+    counters = SortCounters()
+    if count_comparisons:
+        values = [CountedValue(v, counters) for v in values]
+    list_to_sort = CountingList(values, counters)
+    # Only count memory allocated by the sort itself
+    tracemalloc.start()
+    try:
+        result = sort_function(list_to_sort)
+        _, counters.peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if count_comparisons:
+        result = [_unwrap(v) for v in result]
+    else:
+        result = list(result)
+        counters.comparisons = counters.moves = None
+    return result, counters
+
+# Returns the exponent k that best fits measurements ~ c * size ** k,
+# by least squares on log(size) and log(measurement). About 1 for linear,
+# 1.1 for n log n at these sizes, and 2 for quadratic growth.
+# Returns None if there are fewer than two usable points.
+def fitGrowthExponent(sizes:list, measurements:list):
+    points = [(math.log(n), math.log(m)) for n, m in zip(sizes, measurements) if n > 0 and m > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
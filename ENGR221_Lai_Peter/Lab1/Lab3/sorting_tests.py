@@ -4,9 +4,61 @@ sortingFunctions.py
 Descrption: Implementation of sorting algorithms.
 """
 
-import time, random
+import time, random, bisect, functools, heapq, logging, math, os, tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from multiprocessing import shared_memory
+
+# NumPy is optional, vectorizedSort falls back to hybridMergeSort without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Returns the order (list of indices) that stably sorts keys, by sorting
+# (key, index) pairs with sort_function. The index breaks ties, so equal keys
+# keep their order even in unstable sorts and the values are never compared.
+def _comparisonArgsort(sort_function, keys:list, *args, **kwargs) -> list:
+    pairs = sort_function([(k, i) for i, k in enumerate(keys)], *args, **kwargs)
+    return [i for _, i in pairs]
+
+# Decorator that adds key= and reverse= arguments to a sort, like list.sort.
+# Without them the sort runs unchanged. With them, key is called exactly once
+# per value, argsort(keys, ...) finds the order that sorts the keys, and the
+# values are rearranged in that order. Sorting is stable both ways: for
+# reverse=True the values are reversed before and after an ascending sort.
+# Lists are rearranged in place; any other sequence (array.array, buffers...)
+# is left alone and a new sorted list is returned.
+# argsort defaults to sorting (key, index) pairs with the sort itself.
+def _keyedSort(argsort=None):
+    def decorate(sort_function):
+        order_of = argsort or functools.partial(_comparisonArgsort, sort_function)
+
+        @functools.wraps(sort_function)
+        def keyed(list_to_sort, *args, key=None, reverse=False, **kwargs):
+            if key is None and not reverse:
+                return sort_function(list_to_sort, *args, **kwargs)
+            values = list(list_to_sort)
+            if reverse:
+                values.reverse()
+            keys = values if key is None else [key(value) for value in values]
+            order = order_of(keys, *args, **kwargs)
+            if reverse:
+                order.reverse()
+            if not isinstance(list_to_sort, list):
+                return [values[i] for i in order]
+            list_to_sort[:] = [values[i] for i in order]
+            return list_to_sort
+
+        keyed.argsort = order_of
+        return keyed
+    return decorate
 
 # Implementation of insertionSort algorithm
+@_keyedSort()
 def insertionSort(list_to_sort:list) -> list:
     for i in range (1, len(list_to_sort)):
         key = list_to_sort[i]
@@ -18,6 +70,7 @@ def insertionSort(list_to_sort:list) -> list:
     return list_to_sort
 
 # implementation of bubbleSort algorithm
+@_keyedSort()
 def bubbleSort(list_to_sort: list) -> list:
     n = len(list_to_sort)
     for i in range(n - 1):
@@ -26,6 +79,925 @@ def bubbleSort(list_to_sort: list) -> list:
                 list_to_sort[j], list_to_sort[j + 1] = list_to_sort[j + 1], list_to_sort[j]
     return list_to_sort
 
+# Runs shorter than this are extended with insertion sort
+# before merging (same threshold as CPython's timsort)
+MIN_MERGE = 32
+# Number of consecutive wins by one run before a merge
+# switches into galloping mode
+MIN_GALLOP = 7
+
+# Returns the minimum run length for a list of length n, so that
+# the number of runs is a power of two (or slightly less)
+def _minRunLength(n:int) -> int:
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+# Finds the natural run starting at lo, reversing it in place if it
+# is strictly descending, and returns its length
+def _countRun(list_to_sort:list, lo:int, hi:int) -> int:
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    # Strictly descending (strict so that reversing keeps stability)
+    if list_to_sort[run_hi] < list_to_sort[lo]:
+        run_hi += 1
+        while run_hi < hi and list_to_sort[run_hi] < list_to_sort[run_hi - 1]:
+            run_hi += 1
+        list_to_sort[lo:run_hi] = list_to_sort[lo:run_hi][::-1]
+    # Non-descending
+    else:
+        while run_hi < hi and not list_to_sort[run_hi] < list_to_sort[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+# Sorts list_to_sort[lo:hi] with binary insertion sort,
+# given that list_to_sort[lo:start] is already sorted
+def _binaryInsertionSort(list_to_sort:list, lo:int, hi:int, start:int) -> None:
+    for i in range(start, hi):
+        key = list_to_sort[i]
+        # bisect_right keeps equal elements in their original order
+        pos = bisect.bisect_right(list_to_sort, key, lo, i)
+        list_to_sort[pos + 1:i + 1] = list_to_sort[pos:i]
+        list_to_sort[pos] = key
+
+# Returns the first index in run[start:end] whose value is greater than key,
+# probing exponentially from start before binary searching
+def _gallopRight(key, run:list, start:int, end:int) -> int:
+    last, offset = start, 1
+    probe = start
+    while probe < end and not key < run[probe]:
+        last = probe + 1
+        offset <<= 1
+        probe = start + offset - 1
+    return bisect.bisect_right(run, key, last, min(probe, end))
+
+# Returns the first index in run[start:end] whose value is not less than key,
+# probing exponentially from start before binary searching
+def _gallopLeft(key, run:list, start:int, end:int) -> int:
+    last, offset = start, 1
+    probe = start
+    while probe < end and run[probe] < key:
+        last = probe + 1
+        offset <<= 1
+        probe = start + offset - 1
+    return bisect.bisect_left(run, key, last, min(probe, end))
+
+# Merges the adjacent sorted runs list_to_sort[lo:mid] and list_to_sort[mid:hi]
+# in place. gallop holds the adaptive galloping threshold shared across merges.
+def _mergeRuns(list_to_sort:list, lo:int, mid:int, hi:int, gallop:list) -> None:
+    a = list_to_sort
+    # Left run elements that are <= the first right element are already in place
+    lo = _gallopRight(a[mid], a, lo, mid)
+    if lo == mid:
+        return
+    # Right run elements that are >= the last left element are already in place
+    hi = _gallopLeft(a[mid - 1], a, mid, hi)
+    # Only the (trimmed) left run needs a temporary copy
+    left = a[lo:mid]
+    n_left = len(left)
+    i, j, k = 0, mid, lo
+    min_gallop = gallop[0]
+    while i < n_left and j < hi:
+        # One element at a time until one run wins min_gallop times in a row
+        left_wins = right_wins = 0
+        while i < n_left and j < hi:
+            if a[j] < left[i]:
+                a[k] = a[j]
+                j += 1
+                right_wins += 1
+                left_wins = 0
+            else:
+                a[k] = left[i]
+                i += 1
+                left_wins += 1
+                right_wins = 0
+            k += 1
+            if left_wins >= min_gallop or right_wins >= min_gallop:
+                break
+        # Galloping: copy whole blocks found by exponential search
+        while i < n_left and j < hi:
+            end = _gallopRight(a[j], left, i, n_left)
+            count_left = end - i
+            a[k:k + count_left] = left[i:end]
+            k += count_left
+            i = end
+            if i == n_left:
+                break
+            end = _gallopLeft(left[i], a, j, hi)
+            count_right = end - j
+            a[k:k + count_right] = a[j:end]
+            k += count_right
+            j = end
+            # Galloping stopped paying off, go back to one at a time
+            if count_left < MIN_GALLOP and count_right < MIN_GALLOP:
+                min_gallop += 1
+                break
+            min_gallop = max(1, min_gallop - 1)
+    # Whatever is left of the right run is already in place
+    if i < n_left:
+        a[k:k + n_left - i] = left[i:]
+    gallop[0] = min_gallop
+
+# Merges the runs at index i and i + 1 on the run stack
+def _mergeAt(list_to_sort:list, runs:list, i:int, gallop:list) -> None:
+    start, length = runs[i]
+    length2 = runs[i + 1][1]
+    _mergeRuns(list_to_sort, start, start + length, start + length + length2, gallop)
+    runs[i][1] = length + length2
+    del runs[i + 1]
+
+# Merges runs on the stack until the run lengths satisfy the timsort invariants,
+# keeping merges balanced
+def _mergeCollapse(list_to_sort:list, runs:list, gallop:list) -> None:
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+           (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _mergeAt(list_to_sort, runs, n, gallop)
+
+# Merges every remaining run on the stack
+def _mergeForceCollapse(list_to_sort:list, runs:list, gallop:list) -> None:
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        _mergeAt(list_to_sort, runs, n, gallop)
+
+# Implementation of a hybrid, run-adaptive merge sort (timsort).
+# Stable, O(n log n) worst case and O(n) on already sorted input.
+@_keyedSort()
+def hybridMergeSort(list_to_sort:list) -> list:
+    n = len(list_to_sort)
+    if n < 2:
+        return list_to_sort
+    min_run = _minRunLength(n)
+    runs = []               # Stack of [start, length] of pending runs
+    gallop = [MIN_GALLOP]   # Galloping threshold, adapted as merges run
+    lo = 0
+    while lo < n:
+        # Find the next natural run
+        run_len = _countRun(list_to_sort, lo, n)
+        # Extend short runs to min_run with insertion sort
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binaryInsertionSort(list_to_sort, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append([lo, run_len])
+        _mergeCollapse(list_to_sort, runs, gallop)
+        lo += run_len
+    _mergeForceCollapse(list_to_sort, runs, gallop)
+    return list_to_sort
+
+# Partitions of this size or smaller are finished with insertion sort
+INTRO_THRESHOLD = 16
+
+# Insertion sorts list_to_sort[lo:hi] in place
+def _insertionSortRange(list_to_sort:list, lo:int, hi:int) -> None:
+    for i in range(lo + 1, hi):
+        key = list_to_sort[i]
+        j = i - 1
+        while j >= lo and key < list_to_sort[j]:
+            list_to_sort[j + 1] = list_to_sort[j]
+            j -= 1
+        list_to_sort[j + 1] = key
+
+# Moves the value at root down the max-heap stored in list_to_sort[lo:lo + size]
+def _siftDown(list_to_sort:list, lo:int, root:int, size:int) -> None:
+    value = list_to_sort[lo + root]
+    child = 2 * root + 1
+    while child < size:
+        # Pick the larger child
+        if child + 1 < size and list_to_sort[lo + child] < list_to_sort[lo + child + 1]:
+            child += 1
+        if not value < list_to_sort[lo + child]:
+            break
+        list_to_sort[lo + root] = list_to_sort[lo + child]
+        root = child
+        child = 2 * root + 1
+    list_to_sort[lo + root] = value
+
+# Heap sorts list_to_sort[lo:hi] in place
+def _heapSortRange(list_to_sort:list, lo:int, hi:int) -> None:
+    size = hi - lo
+    # Build the max-heap
+    for root in range(size // 2 - 1, -1, -1):
+        _siftDown(list_to_sort, lo, root, size)
+    # Repeatedly move the max to the end of the unsorted part
+    for end in range(size - 1, 0, -1):
+        list_to_sort[lo], list_to_sort[lo + end] = list_to_sort[lo + end], list_to_sort[lo]
+        _siftDown(list_to_sort, lo, 0, end)
+
+# Hoare partition of list_to_sort[lo:hi] around a median-of-three pivot.
+# Returns p such that everything in [lo, p) <= pivot <= everything in [p, hi).
+def _partition(list_to_sort:list, lo:int, hi:int) -> int:
+    a = list_to_sort
+    mid = (lo + hi - 1) // 2
+    last = hi - 1
+    # Order the first, middle and last values so the middle is the median
+    if a[mid] < a[lo]:
+        a[lo], a[mid] = a[mid], a[lo]
+    if a[last] < a[mid]:
+        a[mid], a[last] = a[last], a[mid]
+        if a[mid] < a[lo]:
+            a[lo], a[mid] = a[mid], a[lo]
+    pivot = a[mid]
+    i, j = lo - 1, hi
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        a[i], a[j] = a[j], a[i]
+
+# Introsorts list_to_sort[lo:hi], switching to heap sort once depth runs out
+def _introSortRange(list_to_sort:list, lo:int, hi:int, depth:int) -> None:
+    while hi - lo > INTRO_THRESHOLD:
+        if depth == 0:
+            _heapSortRange(list_to_sort, lo, hi)
+            return
+        depth -= 1
+        p = _partition(list_to_sort, lo, hi)
+        # Recurse on the smaller side and loop on the larger one,
+        # so the stack stays O(log n)
+        if p - lo < hi - p:
+            _introSortRange(list_to_sort, lo, p, depth)
+            lo = p
+        else:
+            _introSortRange(list_to_sort, p, hi, depth)
+            hi = p
+    _insertionSortRange(list_to_sort, lo, hi)
+
+# Implementation of in-place introsort: median-of-three quicksort that falls
+# back to heap sort on bad pivots and insertion sort on small partitions.
+# O(n log n) worst case, O(log n) extra memory. Not stable on its own, but
+# stable with key= or reverse= since ties are broken by position.
+@_keyedSort()
+def introSort(list_to_sort:list) -> list:
+    n = len(list_to_sort)
+    if n > 1:
+        _introSortRange(list_to_sort, 0, n, 2 * int(math.log2(n)))
+    return list_to_sort
+
+# Digit widths (bits) the radix sort chooses from
+RADIX_WIDTHS = (8, 11, 16)
+# Integer lists whose range is at most this many times their length
+# go to counting sort; wider ones are radix sorted
+COUNTING_RANGE_FACTOR = 2
+
+# Raises a TypeError unless every value in list_to_sort is an int
+def _checkIntegers(list_to_sort:list, name:str) -> None:
+    for value in list_to_sort:
+        if not isinstance(value, int):
+            raise TypeError("{} only sorts integers, got {!r}".format(name, value))
+
+# Returns the smallest key and how many times each key from it up to the
+# largest appears (counts[key - lo]). Shared by countingSort and its argsort.
+# Returns None if the keys span more than COUNTING_RANGE_FACTOR times their
+# number, where the counts would cost more than a radix sort.
+def _countKeys(keys:list):
+    _checkIntegers(keys, "countingSort")
+    lo, hi = min(keys), max(keys)
+    if hi - lo > COUNTING_RANGE_FACTOR * len(keys):
+        return None
+    counts = [0] * (hi - lo + 1)
+    for key in keys:
+        counts[key - lo] += 1
+    return lo, counts
+
+# Returns the order that stably sorts integer keys, by counting sort
+# (or radix sort, for keys spread over a wide range)
+def _countingArgsort(keys:list) -> list:
+    if len(keys) < 2:
+        return list(range(len(keys)))
+    counted = _countKeys(keys)
+    if counted is None:
+        return _radixArgsort(keys)
+    lo, counts = counted
+    # Turn the counts into the first position of each key
+    position = 0
+    for offset, count in enumerate(counts):
+        counts[offset] = position
+        position += count
+    order = [0] * len(keys)
+    for i, key in enumerate(keys):
+        order[counts[key - lo]] = i
+        counts[key - lo] += 1
+    return order
+
+# Implementation of counting sort for integers.
+# O(n + k) time and O(k) extra memory, where k = max - min + 1.
+# Lists whose range is too wide for that are radix sorted instead.
+@_keyedSort(_countingArgsort)
+def countingSort(list_to_sort:list) -> list:
+    if len(list_to_sort) < 2:
+        return list_to_sort
+    counted = _countKeys(list_to_sort)
+    if counted is None:
+        return radixSort(list_to_sort)
+    lo, counts = counted
+    # Write each value back as many times as it appeared
+    pos = 0
+    for offset, count in enumerate(counts):
+        if count:
+            list_to_sort[pos:pos + count] = [offset + lo] * count
+            pos += count
+    return list_to_sort
+
+# Returns the digit width (bits) that needs the least work to radix sort
+# length keys spanning bits bits: each pass costs length + 2 ** width
+def _radixWidth(length:int, bits:int) -> int:
+    best, best_cost = RADIX_WIDTHS[0], None
+    for width in RADIX_WIDTHS:
+        passes = max(1, -(-bits // width))
+        cost = passes * (length + (1 << min(width, bits)))
+        if best_cost is None or cost < best_cost:
+            best, best_cost = width, cost
+    return best
+
+# Returns the non-negative int keys sorted by their bits from low_bit up to
+# bits, by LSD radix sort. Keys that match in those bits keep their order.
+# Shared by radixSort and its argsort.
+def _radixPasses(keys:list, low_bit:int, bits:int) -> list:
+    width = _radixWidth(len(keys), bits - low_bit)
+    mask = (1 << width) - 1
+    for shift in range(low_bit, bits, width):
+        # Distribute the keys by the current digit, keeping their order
+        buckets = [[] for _ in range(min(mask, (1 << (bits - shift)) - 1) + 1)]
+        add = [bucket.append for bucket in buckets]
+        for key in keys:
+            add[(key >> shift) & mask](key)
+        keys = list(chain.from_iterable(buckets))
+    return keys
+
+# Returns the order that stably sorts integer keys, by LSD radix sort.
+# Each index is packed below its offset key, so sorting by the key bits
+# alone carries the indices along in order.
+def _radixArgsort(keys:list) -> list:
+    order = list(range(len(keys)))
+    if len(keys) < 2:
+        return order
+    _checkIntegers(keys, "radixSort")
+    lo = min(keys)
+    bits = (max(keys) - lo).bit_length()
+    if bits == 0:
+        return order
+    index_bits = (len(keys) - 1).bit_length()
+    index_mask = (1 << index_bits) - 1
+    packed = [(key - lo) << index_bits | i for i, key in enumerate(keys)]
+    return [p & index_mask for p in _radixPasses(packed, index_bits, index_bits + bits)]
+
+# Implementation of LSD radix sort for integers (including negatives).
+# Values are offset by the minimum so every key is non-negative, then
+# bucketed one digit at a time, least significant digit first.
+# Stable, O(n * passes) where passes depends on the range of the values.
+@_keyedSort(_radixArgsort)
+def radixSort(list_to_sort:list) -> list:
+    if len(list_to_sort) < 2:
+        return list_to_sort
+    _checkIntegers(list_to_sort, "radixSort")
+    lo = min(list_to_sort)
+    bits = (max(list_to_sort) - lo).bit_length()
+    # Every value is the same
+    if bits == 0:
+        return list_to_sort
+    keys = _radixPasses([value - lo for value in list_to_sort], 0, bits)
+    list_to_sort[:] = [key + lo for key in keys]
+    return list_to_sort
+
+# Range of values that fit in a signed 64 bit integer
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+# Returns the array typecode ('q' or 'd') that holds every value in the list
+# without loss, or None if the list is not all ints or all floats
+def _numericTypecode(values:list):
+    if not values:
+        return None
+    first = type(values[0])
+    if first is int:
+        if all(type(v) is int for v in values) and \
+           INT64_MIN <= min(values) and max(values) <= INT64_MAX:
+            return 'q'
+    elif first is float:
+        if all(type(v) is float for v in values):
+            return 'd'
+    return None
+
+# Returns the order that stably sorts keys, with NumPy's stable argsort when
+# the keys are all ints or all floats, or hybridMergeSort otherwise
+def _vectorizedArgsort(keys:list, return_array:bool=False) -> list:
+    typecode = _numericTypecode(keys)
+    if np is None or typecode is None:
+        return hybridMergeSort.argsort(keys)
+    values = np.array(keys, dtype=np.int64 if typecode == 'q' else np.float64)
+    return np.argsort(values, kind='stable').tolist()
+
+# Sorts numeric data with NumPy. Lists of all ints or all floats are copied
+# into a NumPy array once; array.array and other buffer objects are viewed
+# without copying and sorted in place. Returns the sorted list (or the given
+# buffer), or the NumPy array if return_array is True.
+# Anything else, or any input when NumPy is missing, goes to hybridMergeSort.
+# With key= or reverse=, the keys are argsorted and a list is always returned:
+# the given list sorted in place, or a new list for any other input.
+@_keyedSort(_vectorizedArgsort)
+def vectorizedSort(list_to_sort, return_array:bool=False):
+    if np is not None and not isinstance(list_to_sort, list):
+        # Buffer protocol objects (array.array, memoryview, NumPy arrays...)
+        try:
+            view = np.frombuffer(list_to_sort, dtype=memoryview(list_to_sort).format)
+        except (TypeError, ValueError):
+            view = None
+        if view is not None and view.dtype.kind in 'iuf' and view.flags.writeable:
+            view.sort()
+            return view if return_array else list_to_sort
+    typecode = _numericTypecode(list_to_sort) if isinstance(list_to_sort, list) else None
+    if np is None or typecode is None:
+        return hybridMergeSort(list_to_sort)
+    values = np.array(list_to_sort, dtype=np.int64 if typecode == 'q' else np.float64)
+    values.sort()
+    if return_array:
+        return values
+    list_to_sort[:] = values.tolist()
+    return list_to_sort
+
+# Lists shorter than this are not worth starting worker processes for
+PARALLEL_THRESHOLD = 200000
+
+# Head of one run in kWayMerge's heap. Ordered by key, then by run index,
+# using only < on the keys (like the sorts above).
+class _MergeHead():
+    __slots__ = ('key', 'value', 'index', 'iterator')
+
+    def __init__(self, key, value, index:int, iterator):
+        self.key = key
+        self.value = value
+        self.index = index
+        self.iterator = iterator
+
+    def __lt__(self, other):
+        if self.key < other.key:
+            return True
+        if other.key < self.key:
+            return False
+        return self.index < other.index
+
+# Merges any number of sorted iterables into one sorted iterator using a heap
+# of the current head of each run. O(n log k) for k runs. Stable: equal values
+# come out in the order of the runs they came from. If key is given, runs are
+# sorted by key(value) and key is called once per value.
+def kWayMerge(runs, key=None):
+    heap = []
+    for index, run in enumerate(runs):
+        iterator = iter(run)
+        for value in iterator:
+            heap.append(_MergeHead(value if key is None else key(value), value, index, iterator))
+            break
+    heapq.heapify(heap)
+    while len(heap) > 1:
+        head = heap[0]
+        yield head.value
+        # Replace the head with the next value of the same run, if any
+        for value in head.iterator:
+            head.key = value if key is None else key(value)
+            head.value = value
+            heapq.heapreplace(heap, head)
+            break
+        else:
+            heapq.heappop(heap)
+    # Only one run left, no more comparisons needed
+    if heap:
+        yield heap[0].value
+        yield from heap[0].iterator
+
+# Worker: sorts a pickled chunk and sends it back
+def _sortChunk(chunk:list, chunk_sort) -> list:
+    return chunk_sort(chunk)
+
+# Worker: sorts values[start:stop] of a numeric array in shared memory in place
+def _sortSharedChunk(name:str, typecode:str, start:int, stop:int, chunk_sort) -> None:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        view[start:stop] = array(typecode, chunk_sort(view[start:stop].tolist()))
+        view.release()
+    finally:
+        shm.close()
+
+# Implementation of a parallel sort: splits the list into one chunk per worker,
+# sorts the chunks in a process pool and merges them with kWayMerge.
+# Lists of all ints or all floats are shared with the workers through shared
+# memory instead of being pickled. Lists shorter than threshold are sorted
+# serially with chunk_sort.
+@_keyedSort()
+def parallelSort(list_to_sort:list, workers:int=None, threshold:int=PARALLEL_THRESHOLD,
+                 chunk_sort=hybridMergeSort) -> list:
+    n = len(list_to_sort)
+    workers = workers or os.cpu_count() or 1
+    if n < threshold or workers < 2:
+        return chunk_sort(list_to_sort)
+    step = -(-n // workers)
+    bounds = [(start, min(start + step, n)) for start in range(0, n, step)]
+    typecode = _numericTypecode(list_to_sort)
+
+    with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+        if typecode is None:
+            chunks = [list_to_sort[start:stop] for start, stop in bounds]
+            runs = list(pool.map(_sortChunk, chunks, repeat(chunk_sort)))
+            list_to_sort[:] = kWayMerge(runs)
+            return list_to_sort
+
+        # Numeric data: copy it into shared memory once, workers sort in place
+        data = array(typecode, list_to_sort)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+        try:
+            view = shm.buf.cast(typecode)
+            view[:n] = data
+            del data
+            futures = [pool.submit(_sortSharedChunk, shm.name, typecode, start, stop, chunk_sort)
+                       for start, stop in bounds]
+            for future in futures:
+                future.result()
+            runs = [view[start:stop] for start, stop in bounds]
+            list_to_sort[:] = kWayMerge(runs)
+            for run in runs:
+                run.release()
+            view.release()
+        finally:
+            shm.close()
+            shm.unlink()
+    return list_to_sort
+
+# Heap entry for topK when keeping the smallest values.
+# a < b means a is a worse candidate than b: a bigger key, or the
+# same key seen later (so ties keep the earliest values).
+class _SmallestItem():
+    __slots__ = ('key', 'value', 'index')
+
+    def __init__(self, key, value, index:int):
+        self.key = key
+        self.value = value
+        self.index = index
+
+    def __lt__(self, other):
+        if other.key < self.key:
+            return True
+        if self.key < other.key:
+            return False
+        return other.index < self.index
+
+# Heap entry for topK when keeping the largest values.
+# a < b means a is a worse candidate than b: a smaller key, or the
+# same key seen later.
+class _LargestItem(_SmallestItem):
+    __slots__ = ()
+
+    def __lt__(self, other):
+        if self.key < other.key:
+            return True
+        if other.key < self.key:
+            return False
+        return other.index < self.index
+
+# Wraps a key so that it sorts in descending order, using only <
+class _Descending():
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return not (self.key < other.key or other.key < self.key)
+
+# Returns the k smallest (or largest) values of any iterable, best first.
+# Only a heap of k values is kept, so generators are consumed one value at a
+# time and never stored: O(n log k) time and O(k) memory.
+# Equal values are returned in the order they were seen. If key is given,
+# values are ranked by key(value), computed once per value.
+def topK(iterable, k:int, largest:bool=False, key=None) -> list:
+    if k <= 0:
+        return []
+    item = _LargestItem if largest else _SmallestItem
+    heap = []   # The worst kept value is at heap[0]
+    for index, value in enumerate(iterable):
+        value_key = value if key is None else key(value)
+        if len(heap) < k:
+            heapq.heappush(heap, item(value_key, value, index))
+        elif heap[0].key < value_key if largest else value_key < heap[0].key:
+            heapq.heapreplace(heap, item(value_key, value, index))
+    # Worst first, then flip so the best value comes first
+    return [entry.value for entry in reversed(hybridMergeSort(heap))]
+
+# Three-way partitions list_to_sort[lo:hi] around pivot. Returns (lt, gt) such
+# that [lo, lt) < pivot, [lt, gt) == pivot and [gt, hi) > pivot.
+def _threeWayPartition(list_to_sort:list, lo:int, hi:int, pivot) -> tuple:
+    a = list_to_sort
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        value = a[i]
+        if value < pivot:
+            a[lt], a[i] = value, a[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            gt -= 1
+            a[i], a[gt] = a[gt], value
+        else:
+            i += 1
+    return lt, gt
+
+# Returns a pivot for list_to_sort[lo:hi] that is guaranteed to have at least
+# 30% of the values on each side: the median of the medians of groups of 5
+def _medianOfMedians(list_to_sort:list, lo:int, hi:int):
+    groups = 0
+    for start in range(lo, hi, 5):
+        end = min(start + 5, hi)
+        _insertionSortRange(list_to_sort, start, end)
+        # Gather the group medians at the front of the range
+        median = (start + end - 1) // 2
+        list_to_sort[lo + groups], list_to_sort[median] = list_to_sort[median], list_to_sort[lo + groups]
+        groups += 1
+    return _select(list_to_sort, lo, lo + groups, lo + (groups - 1) // 2, 0)
+
+# Rearranges list_to_sort[lo:hi] so that index k holds the value it would have
+# if sorted. Uses median-of-three pivots while depth lasts, then median of
+# medians, so the worst case stays O(n).
+def _select(list_to_sort:list, lo:int, hi:int, k:int, depth:int):
+    a = list_to_sort
+    while hi - lo > INTRO_THRESHOLD:
+        if depth > 0:
+            depth -= 1
+            x, y, z = a[lo], a[(lo + hi) // 2], a[hi - 1]
+            # Median of the three values
+            if y < x:
+                x, y = y, x
+            if z < y:
+                y = x if z < x else z
+            pivot = y
+        else:
+            pivot = _medianOfMedians(a, lo, hi)
+        lt, gt = _threeWayPartition(a, lo, hi, pivot)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return a[k]
+    _insertionSortRange(a, lo, hi)
+    return a[k]
+
+# Returns the k-th smallest value (0-based) of list_to_sort, rearranging the
+# list in place so smaller values come before index k and larger after it.
+# O(n) on average and in the worst case. If key is given, values are
+# ranked by key(value), computed once per value.
+def quickSelect(list_to_sort:list, k:int, key=None):
+    n = len(list_to_sort)
+    if not 0 <= k < n:
+        raise IndexError("k is out of range")
+    depth = 2 * int(math.log2(n)) if n > 1 else 0
+    if key is None:
+        return _select(list_to_sort, 0, n, k, depth)
+    # Select among (key, index) pairs, then move the values to match
+    pairs = [(key(value), i) for i, value in enumerate(list_to_sort)]
+    _select(pairs, 0, n, k, depth)
+    list_to_sort[:] = [list_to_sort[i] for _, i in pairs]
+    return list_to_sort[k]
+
+# Rearranges list_to_sort in place so that its first k values are the k
+# smallest, in sorted order. The rest are left in no particular order.
+# O(n + k log k). With reverse=True the first k are the largest, and with a
+# key values are ranked by key(value); either way ties keep their order.
+def partialSort(list_to_sort:list, k:int, key=None, reverse:bool=False) -> list:
+    k = min(k, len(list_to_sort))
+    if k <= 0:
+        return list_to_sort
+    if key is not None or reverse:
+        keys = list_to_sort if key is None else [key(value) for value in list_to_sort]
+        pairs = [(_Descending(value_key) if reverse else value_key, i)
+                 for i, value_key in enumerate(keys)]
+        partialSort(pairs, k)
+        list_to_sort[:] = [list_to_sort[i] for _, i in pairs]
+        return list_to_sort
+    quickSelect(list_to_sort, k - 1)
+    _introSortRange(list_to_sort, 0, k - 1, 2 * int(math.log2(k)) if k > 1 else 0)
+    return list_to_sort
+
+# Buckets this small are finished with insertion sort by msdRadixSort
+MSD_CUTOFF = 32
+
+# Raises a TypeError unless every value in list_to_sort is a str
+def _checkStrings(list_to_sort:list) -> None:
+    for value in list_to_sort:
+        if not isinstance(value, str):
+            raise TypeError("msdRadixSort only sorts strings, got {!r}".format(value))
+
+# Returns a new list of the strings in sorted order, by MSD radix sort.
+# Shared by msdRadixSort and its argsort.
+def _msdSorted(strings:list) -> list:
+    result = []
+    # Buckets still to sort with their depth; the top of the stack
+    # holds the smallest strings
+    stack = [(strings[:], 0)]
+    while stack:
+        bucket, depth = stack.pop()
+        if len(bucket) <= MSD_CUTOFF:
+            _insertionSortRange(bucket, 0, len(bucket))
+            result.extend(bucket)
+            continue
+        # Strings that end at this depth come before all longer ones
+        ended = []
+        buckets = {}
+        for value in bucket:
+            if len(value) == depth:
+                ended.append(value)
+            else:
+                char = value[depth]
+                if char in buckets:
+                    buckets[char].append(value)
+                else:
+                    buckets[char] = [value]
+        result.extend(ended)
+        for char in sorted(buckets, reverse=True):
+            stack.append((buckets[char], depth + 1))
+    return result
+
+# Returns the order that stably sorts string keys: the distinct keys are
+# MSD radix sorted, then the keys' ranks among them are counting sorted
+def _msdArgsort(keys:list) -> list:
+    _checkStrings(keys)
+    ranks = {key: rank for rank, key in enumerate(_msdSorted(list(set(keys))))}
+    return _countingArgsort([ranks[key] for key in keys])
+
+# Implementation of MSD (most significant digit first) radix sort for strings.
+# Strings are bucketed by their character at the current depth, so a shared
+# prefix is only looked at once per bucket instead of once per comparison.
+# Small buckets are finished with insertion sort. Stable.
+@_keyedSort(_msdArgsort)
+def msdRadixSort(list_to_sort:list) -> list:
+    _checkStrings(list_to_sort)
+    list_to_sort[:] = _msdSorted(list_to_sort)
+    return list_to_sort
+
+# Number of values (or value pairs) adaptiveSort looks at to measure its input
+SAMPLE_SIZE = 1024
+# Lists this short always go to insertion sort
+INSERTION_LIMIT = 32
+# Lists up to this long go to insertion sort if they have at most
+# INSERTION_INVERSIONS inversions per value
+INSERTION_MAX_LENGTH = 4096
+INSERTION_INVERSIONS = 4
+# Inputs with fewer adjacent pairs out of order than this are treated as
+# presorted and go to the run-adaptive merge sort
+PRESORTED_DESCENTS = 0.05
+# Numeric lists this long or longer are worth converting for NumPy
+VECTORIZE_MIN_LENGTH = 256
+
+# Returns cheap statistics about list_to_sort, from samples of at most
+# sample_size values:
+#   descent_ratio   - fraction of adjacent pairs out of order, in a few
+#                     contiguous windows (0 for sorted input)
+#   inversion_ratio - fraction of random pairs out of order (about 0.5
+#                     for random input, 1 for reversed input)
+#   inversions      - estimated total number of inversions
+#   duplicate_ratio - fraction of sampled values that are repeats
+#   key_type        - 'int', 'float', 'str' or 'mixed'
+#   key_range       - max - min of the sampled values, for numbers
+def measurePresortedness(list_to_sort:list, sample_size:int=SAMPLE_SIZE,
+                         rng:random.Random=None) -> dict:
+    n = len(list_to_sort)
+    rng = rng or random.Random(n)
+    stats = {"length": n, "descent_ratio": 0.0, "inversion_ratio": 0.0, "inversions": 0,
+             "duplicate_ratio": 0.0, "key_type": None, "key_range": None}
+    if n < 2:
+        return stats
+    sample_size = min(sample_size, n)
+    # Descents in up to 8 contiguous windows spread over the list
+    window = max(2, min(n, sample_size // 8))
+    pairs = descents = 0
+    for start in range(0, n - window + 1, max(1, (n - window) // 7)):
+        for i in range(start + 1, start + window):
+            pairs += 1
+            if list_to_sort[i] < list_to_sort[i - 1]:
+                descents += 1
+    stats["descent_ratio"] = descents / pairs
+    # Inversions among random pairs i < j
+    inversions = 0
+    for _ in range(sample_size):
+        i, j = rng.randrange(n), rng.randrange(n)
+        if i > j:
+            i, j = j, i
+        if list_to_sort[j] < list_to_sort[i]:
+            inversions += 1
+    stats["inversion_ratio"] = inversions / sample_size
+    stats["inversions"] = int(stats["inversion_ratio"] * n * (n - 1) / 2)
+    # Duplicates and key type among random values
+    sample = [list_to_sort[rng.randrange(n)] for _ in range(min(n, sample_size))]
+    try:
+        stats["duplicate_ratio"] = 1 - len(set(sample)) / len(sample)
+    except TypeError:
+        pass    # Unhashable values
+    types = {type(v) for v in sample}
+    if len(types) == 1 and types.pop() in (int, float, str):
+        stats["key_type"] = type(sample[0]).__name__
+    else:
+        stats["key_type"] = "mixed"
+    if stats["key_type"] in ("int", "float"):
+        stats["key_range"] = max(sample) - min(sample)
+    return stats
+
+# Returns the name of the sort adaptiveSort would use for a list with these
+# statistics (see measurePresortedness)
+def chooseSort(stats:dict) -> str:
+    n = stats["length"]
+    if n <= INSERTION_LIMIT:
+        return "insertionSort"
+    if n <= INSERTION_MAX_LENGTH and stats["inversions"] <= INSERTION_INVERSIONS * n:
+        return "insertionSort"
+    # Long ascending or descending runs: the merge sort only merges them
+    if stats["descent_ratio"] < PRESORTED_DESCENTS or \
+       stats["descent_ratio"] > 1 - PRESORTED_DESCENTS:
+        return "hybridMergeSort"
+    if stats["key_type"] in ("int", "float") and np is not None and n >= VECTORIZE_MIN_LENGTH:
+        return "vectorizedSort"
+    if stats["key_type"] == "int":
+        # The sampled range is a lower bound, countingSort checks the real one
+        if stats["key_range"] <= COUNTING_RANGE_FACTOR * n:
+            return "countingSort"
+        return "radixSort"
+    if stats["key_type"] == "str":
+        return "msdRadixSort"
+    return "hybridMergeSort"
+
+# Returns the order that stably sorts keys, using the sort adaptiveSort
+# would pick for the keys themselves
+def _adaptiveArgsort(keys:list) -> list:
+    if len(keys) <= INSERTION_LIMIT:
+        return insertionSort.argsort(keys)
+    name = _chooseCheckedSort(keys, measurePresortedness(keys))
+    return ADAPTIVE_SORTS[name].argsort(keys)
+
+# Returns the sort chooseSort picks for these statistics, after checking that
+# every value (not just the sampled ones) has the type that sort needs
+def _chooseCheckedSort(list_to_sort:list, stats:dict) -> str:
+    name = chooseSort(stats)
+    if name == "msdRadixSort" and not all(type(v) is str for v in list_to_sort):
+        name = "hybridMergeSort"
+    if name in DISTRIBUTION_SORTS:
+        typecode = _numericTypecode(list_to_sort)
+        if typecode is None or (typecode == 'd' and name != "vectorizedSort"):
+            name = "hybridMergeSort"
+        elif name == "countingSort" and \
+             max(list_to_sort) - min(list_to_sort) > COUNTING_RANGE_FACTOR * len(list_to_sort):
+            name = "radixSort"
+    return name
+
+# Implementation of an adaptive sort: measures how presorted the list is and
+# what its values look like, then hands it to the sort that suits it best.
+# Logs the decision and the time spent measuring and sorting.
+# With key= or reverse=, the decision is made on the keys.
+@_keyedSort(_adaptiveArgsort)
+def adaptiveSort(list_to_sort:list) -> list:
+    # Measuring would cost more than sorting
+    if len(list_to_sort) <= INSERTION_LIMIT:
+        return insertionSort(list_to_sort)
+    start_time = time.perf_counter()
+    stats = measurePresortedness(list_to_sort)
+    # The sample only suggests the values' type, check all of them
+    name = _chooseCheckedSort(list_to_sort, stats)
+    measured_time = time.perf_counter()
+    ADAPTIVE_SORTS[name](list_to_sort)
+    end_time = time.perf_counter()
+    logger.info("adaptiveSort: %d items -> %s (descents %.3f, inversions %.3f, "
+                "duplicates %.3f, type %s); measure %.3f ms, sort %.3f ms",
+                stats["length"], name, stats["descent_ratio"], stats["inversion_ratio"],
+                stats["duplicate_ratio"], stats["key_type"],
+                (measured_time - start_time) * 1000, (end_time - measured_time) * 1000)
+    return list_to_sort
+
+# Sorts adaptiveSort can pick from, by name
+ADAPTIVE_SORTS = {
+    "insertionSort": insertionSort,
+    "hybridMergeSort": hybridMergeSort,
+    "countingSort": countingSort,
+    "radixSort": radixSort,
+    "vectorizedSort": vectorizedSort,
+    "msdRadixSort": msdRadixSort,
+}
+# Sorts that only work on numbers
+DISTRIBUTION_SORTS = {"countingSort", "radixSort", "vectorizedSort"}
+
 # Returns a random list of the given length
 def createRandomList(length:int) -> list:
     return random.sample(range(max(100, length)), length)
@@ -36,14 +1008,33 @@ def getRuntime(function_to_run, list_length) -> float:
     # Create a new list to sort
     list_to_sort = createRandomList(list_length)
     # Get the time before running
-    start_time = time.time()
+    # (perf_counter is monotonic and much finer grained than time.time;
+    # use sortBenchmark for repeated trials)
+    start_time = time.perf_counter()
     # Sort the given list
     function_to_run(list_to_sort)
     # Get the time after running
-    end_time = time.time()
+    end_time = time.perf_counter()
     # Return the difference
     return end_time - start_time
 
+# Returns the peak memory (bytes) that the function_to_run allocated
+# on top of its input while sorting a list of length list_length
+def getPeakMemory(function_to_run, list_length) -> int:
+    # Create a new list to sort
+    list_to_sort = createRandomList(list_length)
+    # Only count allocations made while sorting
+    tracemalloc.start()
+    try:
+        # Sort the given list
+        function_to_run(list_to_sort)
+        # Get the highest traced memory use
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Return the peak
+    return peak
+
 if __name__ == '__main__':
     print ("Insertion sort runtime")
     print ("100 items: ", getRuntime(insertionSort, 100))
@@ -53,4 +1044,36 @@ if __name__ == '__main__':
     print ("\nBubblesort runtime")
     print ("100 items: ", getRuntime(bubbleSort, 100))
     print ("1,00 items: ", getRuntime(bubbleSort, 10000))
-    print ("10,000 items: ", getRuntime(bubbleSort, 10000))
\ No newline at end of file
+    print ("10,000 items: ", getRuntime(bubbleSort, 10000))
+
+    print ("\nHybrid merge sort runtime")
+    print ("10,000 items: ", getRuntime(hybridMergeSort, 10000))
+    print ("1,000,000 items: ", getRuntime(hybridMergeSort, 1000000))
+
+    print ("\nIntrosort runtime")
+    print ("10,000 items: ", getRuntime(introSort, 10000))
+    print ("1,000,000 items: ", getRuntime(introSort, 1000000))
+
+    print ("\nCounting sort runtime")
+    print ("1,000,000 items: ", getRuntime(countingSort, 1000000))
+
+    print ("\nRadix sort runtime")
+    print ("10,000 items: ", getRuntime(radixSort, 10000))
+    print ("1,000,000 items: ", getRuntime(radixSort, 1000000))
+
+    print ("\nVectorized sort runtime ({})".format("NumPy" if np is not None else "no NumPy, merge sort"))
+    print ("10,000 items: ", getRuntime(vectorizedSort, 10000))
+    print ("1,000,000 items: ", getRuntime(vectorizedSort, 1000000))
+
+    print ("\nMSD radix sort runtime, 100,000 strings")
+    strings = [str(v) for v in createRandomList(100000)]
+    start_time = time.perf_counter()
+    msdRadixSort(strings)
+    print ("100,000 items: ", time.perf_counter() - start_time)
+
+    print ("\nParallel sort runtime ({} workers)".format(os.cpu_count()))
+    print ("1,000,000 items: ", getRuntime(parallelSort, 1000000))
+
+    print ("\nPeak extra memory (bytes), 100,000 items")
+    print ("Hybrid merge sort: ", getPeakMemory(hybridMergeSort, 100000))
+    print ("Introsort: ", getPeakMemory(introSort, 100000))
\ No newline at end of file
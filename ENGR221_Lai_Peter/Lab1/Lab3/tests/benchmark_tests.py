@@ -0,0 +1,38 @@
+import pytest, random
+
+from ..sortBenchmark import DISTRIBUTIONS, compareResults, loadResults, \
+                            percentile, runBenchmarks, saveResults, timeSort
+from ..sorting_tests import hybridMergeSort, introSort
+
+@pytest.mark.benchmark
+def test_distributions_lengths():
+    for name, make in DISTRIBUTIONS.items():
+        assert len(make(101, random.Random(0))) == 101, name
+
+@pytest.mark.benchmark
+def test_percentile():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50 and percentile(samples, 95) == 95
+
+@pytest.mark.benchmark
+def test_time_sort_trials():
+    samples = timeSort(introSort, list(range(100, 0, -1)), trials=4, warmup=2)
+    assert len(samples) == 4 and all(s > 0 for s in samples)
+
+@pytest.mark.benchmark
+def test_run_save_load(tmp_path):
+    results = runBenchmarks({"hybridMergeSort": hybridMergeSort}, [50, 100],
+                            ["random", "organ_pipe"], trials=3, warmup=0)
+    assert len(results["results"]) == 4
+    path = str(tmp_path / "results.json")
+    saveResults(results, path)
+    assert loadResults(path) == results
+
+@pytest.mark.benchmark
+def test_compare_flags_slowdown():
+    case = {"function": "introSort", "distribution": "random", "size": 10, "median_ns": 100}
+    baseline = {"results": [case]}
+    slower = {"results": [dict(case, median_ns=150)]}
+    same = {"results": [dict(case, median_ns=105)]}
+    assert len(compareResults(baseline, slower, 0.10)) == 1
+    assert compareResults(baseline, same, 0.10) == []
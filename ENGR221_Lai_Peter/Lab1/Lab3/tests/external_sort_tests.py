@@ -0,0 +1,56 @@
+import pytest, random, struct
+
+from .. import externalSort as ext
+
+# Writes the integers to a text file, one per line
+def writeInts(path, values):
+    with open(path, 'w') as f:
+        f.write("".join("{}\n".format(v) for v in values))
+
+# Reads the integers back from a text file
+def readInts(path):
+    with open(path) as f:
+        return [int(line) for line in f]
+
+@pytest.mark.external_sort
+def test_external_sort_text(tmp_path):
+    values = [random.randint(-10 ** 6, 10 ** 6) for _ in range(5000)]
+    writeInts(tmp_path / "in.txt", values)
+    # A tiny budget forces many runs
+    ext.externalSort(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"), memory_budget=20000)
+    assert readInts(tmp_path / "out.txt") == sorted(values)
+
+@pytest.mark.external_sort
+def test_external_sort_multi_pass(tmp_path, monkeypatch):
+    # Only merge 3 runs at a time so several merge passes are needed
+    monkeypatch.setattr(ext, "MERGE_FANIN", 3)
+    values = [random.randint(0, 1000) for _ in range(3000)]
+    writeInts(tmp_path / "in.txt", values)
+    ext.externalSort(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"), memory_budget=5000)
+    assert readInts(tmp_path / "out.txt") == sorted(values)
+
+@pytest.mark.external_sort
+def test_external_sort_empty(tmp_path):
+    writeInts(tmp_path / "in.txt", [])
+    ext.externalSort(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"))
+    assert readInts(tmp_path / "out.txt") == []
+
+@pytest.mark.external_sort
+def test_external_sort_binary_records_stable(tmp_path):
+    # (key, sequence number) records, sorted by key only
+    records = [(random.randint(0, 20), i) for i in range(4000)]
+    with open(tmp_path / "in.bin", 'wb') as f:
+        for record in records:
+            f.write(struct.pack('<iq', *record))
+    ext.externalSort(str(tmp_path / "in.bin"), str(tmp_path / "out.bin"),
+                     memory_budget=30000, record_format='<iq', key_field=0)
+    with open(tmp_path / "out.bin", 'rb') as f:
+        result = list(struct.iter_unpack('<iq', f.read()))
+    assert result == sorted(records, key=lambda record: record[0])
+
+@pytest.mark.external_sort
+def test_external_sort_bad_record_size(tmp_path):
+    with open(tmp_path / "in.bin", 'wb') as f:
+        f.write(b'12345')
+    with pytest.raises(ValueError):
+        ext.externalSort(str(tmp_path / "in.bin"), str(tmp_path / "out.bin"), record_format='<i')
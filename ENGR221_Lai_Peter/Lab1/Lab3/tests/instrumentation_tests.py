@@ -0,0 +1,57 @@
+import pytest
+
+from ..sortBenchmark import runBenchmarks
+from ..sortInstrumentation import fitGrowthExponent, instrumentSort
+from ..sorting_tests import createRandomList, hybridMergeSort, insertionSort, radixSort
+
+@pytest.mark.instrumentation
+def test_count_insertion_sorted():
+    # Sorted input: one comparison per value after the first, nothing moves
+    result, counters = instrumentSort(insertionSort, list(range(100)))
+    assert result == list(range(100))
+    assert counters.comparisons == 99 and counters.moves == 0
+
+@pytest.mark.instrumentation
+def test_count_insertion_reversed():
+    result, counters = instrumentSort(insertionSort, list(range(100, 0, -1)))
+    assert result == list(range(1, 101))
+    assert counters.comparisons == 100 * 99 // 2
+
+@pytest.mark.instrumentation
+def test_count_merge_sort_memory():
+    values = createRandomList(5000)
+    result, counters = instrumentSort(hybridMergeSort, values)
+    assert result == sorted(values)
+    assert counters.comparisons > 0 and counters.moves > 0 and counters.peak_bytes > 0
+
+@pytest.mark.instrumentation
+def test_count_radix_memory_only():
+    # Radix sort works in its own buckets, so only its memory is counted
+    values = createRandomList(1000)
+    result, counters = instrumentSort(radixSort, values, count_comparisons=False)
+    assert result == sorted(values)
+    assert counters.comparisons is None and counters.moves is None
+    assert counters.peak_bytes > 0
+
+@pytest.mark.instrumentation
+def test_fit_growth_exponent():
+    sizes = [100, 200, 400, 800]
+    assert fitGrowthExponent(sizes, [n * n for n in sizes]) == pytest.approx(2)
+    assert fitGrowthExponent(sizes, [3 * n for n in sizes]) == pytest.approx(1)
+    assert fitGrowthExponent([100], [5]) is None
+
+@pytest.mark.instrumentation
+def test_benchmark_growth():
+    results = runBenchmarks({"insertionSort": insertionSort}, [100, 200, 400],
+                            ["reversed"], trials=1, warmup=0, count=True)
+    assert "comparisons" in results["results"][0]
+    assert results["growth"][0]["comparisons"] == pytest.approx(2, abs=0.05)
+
+@pytest.mark.instrumentation
+def test_benchmark_growth_typed_sort():
+    # No move or comparison exponent is fitted for a sort that was not counted
+    results = runBenchmarks({"radixSort": radixSort}, [1000, 2000],
+                            ["random"], trials=1, warmup=0, count=True)
+    assert results["results"][0]["moves"] is None
+    growth = results["growth"][0]
+    assert "moves" not in growth and "comparisons" not in growth and "peak_bytes" in growth
@@ -0,0 +1,344 @@
+import pytest
+from array import array
+
+from ..sorting_tests import adaptiveSort, bubbleSort, chooseSort, countingSort, \
+                            createRandomList, getPeakMemory, hybridMergeSort, insertionSort, \
+                            introSort, kWayMerge, measurePresortedness, msdRadixSort, \
+                            parallelSort, partialSort, quickSelect, radixSort, topK, \
+                            vectorizedSort
+
+# Pairs that compare only by their first item, to check stability
+class Pair():
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+#####
+# Hybrid merge sort tests
+#####
+
+@pytest.mark.merge_sort
+def test_merge_sort_empty():
+    assert hybridMergeSort([]) == []
+
+@pytest.mark.merge_sort
+def test_merge_sort_random():
+    values = createRandomList(5000)
+    assert hybridMergeSort(list(values)) == sorted(values)
+
+@pytest.mark.merge_sort
+def test_merge_sort_runs():
+    # Ascending and descending runs of different lengths
+    values = list(range(500)) + list(range(300, 0, -1)) + list(range(100, 900))
+    assert hybridMergeSort(list(values)) == sorted(values)
+
+@pytest.mark.merge_sort
+def test_merge_sort_stable():
+    values = [Pair(i % 5, i) for i in range(1000)]
+    result = hybridMergeSort(values)
+    assert [(p.key, p.tag) for p in result] == \
+           sorted((i % 5, i) for i in range(1000))
+
+#####
+# Introsort tests
+#####
+
+@pytest.mark.intro_sort
+def test_intro_sort_random():
+    values = createRandomList(5000)
+    assert introSort(list(values)) == sorted(values)
+
+@pytest.mark.intro_sort
+def test_intro_sort_duplicates():
+    values = [i % 3 for i in range(2000)]
+    assert introSort(list(values)) == sorted(values)
+
+@pytest.mark.intro_sort
+def test_intro_sort_organ_pipe():
+    # Organ-pipe input is a classic bad case for median-of-three pivots
+    values = list(range(1000)) + list(range(1000, 0, -1))
+    assert introSort(list(values)) == sorted(values)
+
+@pytest.mark.intro_sort
+def test_intro_sort_peak_memory():
+    # Introsort sorts in place, the merge sort needs a buffer
+    assert getPeakMemory(introSort, 20000) < getPeakMemory(hybridMergeSort, 20000)
+
+#####
+# Counting and radix sort tests
+#####
+
+@pytest.mark.radix_sort
+def test_counting_sort_random():
+    values = createRandomList(5000)
+    assert countingSort(list(values)) == sorted(values)
+
+@pytest.mark.radix_sort
+def test_counting_sort_negative():
+    values = [3, -1, 0, -7, 3, 2, -1]
+    assert countingSort(list(values)) == sorted(values)
+
+@pytest.mark.radix_sort
+def test_counting_sort_wide_range():
+    # Counting would need 10**12 counts, so these are radix sorted
+    values = [0, 10 ** 9, 5, -10 ** 12, 5, 10 ** 9]
+    records = [(v, i) for i, v in enumerate(values)]
+    assert (countingSort(list(values)) == sorted(values)
+            and countingSort(list(records), key=lambda r: r[0]) == sorted(records))
+
+@pytest.mark.radix_sort
+def test_radix_sort_random():
+    values = createRandomList(5000)
+    assert radixSort(list(values)) == sorted(values)
+
+@pytest.mark.radix_sort
+def test_radix_sort_negative_wide():
+    # Values spanning more than one digit on both sides of zero
+    values = [2 ** 40, -2 ** 35, 0, 17, -17, 123456789, -1, 2 ** 40]
+    assert radixSort(list(values)) == sorted(values)
+
+@pytest.mark.radix_sort
+def test_radix_sort_rejects_floats():
+    with pytest.raises(TypeError):
+        radixSort([1, 2.5, 3])
+
+#####
+# Vectorized sort tests
+#####
+
+@pytest.mark.vectorized_sort
+def test_vectorized_sort_ints():
+    values = createRandomList(5000)
+    result = vectorizedSort(list(values))
+    assert result == sorted(values) and all(type(v) is int for v in result)
+
+@pytest.mark.vectorized_sort
+def test_vectorized_sort_mixed_falls_back():
+    assert vectorizedSort([3, 1.5, 2]) == [1.5, 2, 3]
+
+@pytest.mark.vectorized_sort
+def test_vectorized_sort_strings_fall_back():
+    assert vectorizedSort(['b', 'c', 'a']) == ['a', 'b', 'c']
+
+@pytest.mark.vectorized_sort
+def test_vectorized_sort_array_in_place():
+    np = pytest.importorskip("numpy")
+    values = array('d', [3.0, -1.0, 2.5])
+    result = vectorizedSort(values, return_array=True)
+    # The NumPy result is a view over the array.array, not a copy
+    assert list(values) == [-1.0, 2.5, 3.0] and np.shares_memory(result, np.frombuffer(values))
+
+#####
+# Parallel sort tests
+#####
+
+@pytest.mark.parallel_sort
+def test_kway_merge():
+    runs = [[1, 3, 5], [], [2, 2, 6], [0]]
+    assert list(kWayMerge(runs)) == [0, 1, 2, 2, 3, 5, 6]
+
+@pytest.mark.parallel_sort
+def test_kway_merge_stable():
+    runs = [[Pair(1, 'a'), Pair(2, 'a')], [Pair(1, 'b')], [Pair(1, 'c')]]
+    assert [p.tag for p in kWayMerge(runs)] == ['a', 'b', 'c', 'a']
+
+@pytest.mark.parallel_sort
+def test_parallel_sort_shared_memory():
+    values = createRandomList(20000)
+    assert parallelSort(list(values), workers=3, threshold=1000) == sorted(values)
+
+@pytest.mark.parallel_sort
+def test_parallel_sort_pickled():
+    values = [str(v) for v in createRandomList(5000)]
+    assert parallelSort(list(values), workers=2, threshold=1000) == sorted(values)
+
+@pytest.mark.parallel_sort
+def test_parallel_sort_below_threshold():
+    values = createRandomList(500)
+    assert parallelSort(list(values), workers=4) == sorted(values)
+
+#####
+# Partial sort tests
+#####
+
+@pytest.mark.partial_sort
+def test_top_k_smallest():
+    values = createRandomList(2000)
+    assert topK(values, 10) == sorted(values)[:10]
+
+@pytest.mark.partial_sort
+def test_top_k_largest_generator():
+    # The input is a generator, it is never stored as a list
+    values = (v * 7 % 1000 for v in range(1000))
+    assert topK(values, 5, largest=True) == [999, 998, 997, 996, 995]
+
+@pytest.mark.partial_sort
+def test_top_k_stable():
+    values = [Pair(1, 'a'), Pair(0, 'b'), Pair(1, 'c'), Pair(1, 'd')]
+    assert [p.tag for p in topK(values, 3)] == ['b', 'a', 'c']
+
+@pytest.mark.partial_sort
+def test_quick_select():
+    values = createRandomList(3000)
+    result = list(values)
+    assert quickSelect(result, 1234) == sorted(values)[1234]
+    assert max(result[:1234]) <= result[1234] <= min(result[1235:])
+
+@pytest.mark.partial_sort
+def test_quick_select_duplicates():
+    values = [i % 4 for i in range(1000)]
+    assert quickSelect(list(values), 600) == 2
+
+@pytest.mark.partial_sort
+def test_quick_select_out_of_range():
+    with pytest.raises(IndexError):
+        quickSelect([1, 2, 3], 3)
+
+@pytest.mark.partial_sort
+def test_partial_sort():
+    values = createRandomList(2000)
+    result = partialSort(list(values), 50)
+    assert result[:50] == sorted(values)[:50] and sorted(result) == sorted(values)
+
+#####
+# Adaptive sort tests
+#####
+
+@pytest.mark.adaptive_sort
+def test_measure_sorted():
+    stats = measurePresortedness(list(range(10000)))
+    assert stats["descent_ratio"] == 0 and stats["inversions"] == 0 and stats["key_type"] == "int"
+
+@pytest.mark.adaptive_sort
+def test_measure_reversed():
+    stats = measurePresortedness(list(range(10000, 0, -1)))
+    assert stats["descent_ratio"] == 1 and stats["inversion_ratio"] == 1
+
+@pytest.mark.adaptive_sort
+def test_choose_nearly_sorted_small():
+    values = list(range(1000))
+    values[10], values[11] = values[11], values[10]
+    assert chooseSort(measurePresortedness(values)) == "insertionSort"
+
+@pytest.mark.adaptive_sort
+def test_choose_presorted_large():
+    values = list(range(50000)) + list(range(50000))
+    assert chooseSort(measurePresortedness(values)) == "hybridMergeSort"
+
+@pytest.mark.adaptive_sort
+def test_choose_random_strings():
+    values = [str(v) for v in createRandomList(5000)]
+    assert chooseSort(measurePresortedness(values)) == "msdRadixSort"
+
+@pytest.mark.adaptive_sort
+def test_adaptive_sort_logs(caplog):
+    values = createRandomList(5000)
+    with caplog.at_level("INFO"):
+        result = adaptiveSort(list(values))
+    assert result == sorted(values) and "adaptiveSort: 5000 items" in caplog.text
+
+@pytest.mark.adaptive_sort
+def test_adaptive_sort_mixed_numbers():
+    # The sample may only see ints, the full check must catch the floats
+    values = list(range(3000, 0, -1)) + [0.5]
+    assert adaptiveSort(list(values)) == sorted(values)
+
+#####
+# MSD radix sort tests
+#####
+
+@pytest.mark.msd_radix_sort
+def test_msd_radix_sort_prefixes():
+    values = ["Sparky", "Spark", "Sparky1", "", "S", "Mimey", "Sparky", "Growlie", "spark"]
+    assert msdRadixSort(list(values)) == sorted(values)
+
+@pytest.mark.msd_radix_sort
+def test_msd_radix_sort_random():
+    values = [str(v) for v in createRandomList(5000)]
+    assert msdRadixSort(list(values)) == sorted(values)
+
+@pytest.mark.msd_radix_sort
+def test_msd_radix_sort_unicode():
+    values = ["é", "e", "z", "ä", "a", "ab", "aé"]
+    assert msdRadixSort(list(values)) == sorted(values)
+
+@pytest.mark.msd_radix_sort
+def test_msd_radix_sort_large_alphabet():
+    # 40000 distinct characters from U+4E00 (CJK) on make 40000 buckets
+    # at the first depth
+    values = [chr(0x4E00 + v) + "x" for v in createRandomList(40000)]
+    assert (msdRadixSort(list(values)) == sorted(values)
+            and msdRadixSort(list(values), reverse=True) == sorted(values, reverse=True))
+
+@pytest.mark.msd_radix_sort
+def test_msd_radix_sort_rejects_ints():
+    with pytest.raises(TypeError):
+        msdRadixSort(["a", 1])
+
+#####
+# key= and reverse= tests
+#####
+
+# Sorts that take key= and reverse=, with integer keys
+KEYED_SORTS = [insertionSort, bubbleSort, hybridMergeSort, introSort, countingSort,
+               radixSort, vectorizedSort, adaptiveSort]
+
+@pytest.mark.key_sort
+@pytest.mark.parametrize("sort_function", KEYED_SORTS)
+def test_key_called_once_per_value(sort_function):
+    records = [(v % 17, v) for v in createRandomList(500)]
+    calls = []
+    def key(record):
+        calls.append(record)
+        return record[0]
+    result = sort_function(list(records), key=key)
+    assert result == sorted(records, key=lambda r: r[0]) and len(calls) == 500
+
+@pytest.mark.key_sort
+@pytest.mark.parametrize("sort_function", KEYED_SORTS)
+def test_reverse_stable(sort_function):
+    records = [(i % 3, i) for i in range(300)]
+    result = sort_function(list(records), key=lambda r: r[0], reverse=True)
+    assert result == sorted(records, key=lambda r: r[0], reverse=True)
+
+@pytest.mark.key_sort
+def test_reverse_without_key():
+    values = createRandomList(1000)
+    assert radixSort(list(values), reverse=True) == sorted(values, reverse=True)
+
+@pytest.mark.key_sort
+def test_key_array_returns_list():
+    values = array('d', [2.5, -1.0, 3.0, 0.5])
+    result = vectorizedSort(values, key=abs)
+    assert (result == [0.5, -1.0, 2.5, 3.0] and values == array('d', [2.5, -1.0, 3.0, 0.5]))
+
+@pytest.mark.key_sort
+def test_reverse_buffer_returns_list():
+    values = array('q', [3, 1, 2])
+    assert (vectorizedSort(values, reverse=True) == [3, 2, 1]
+            and vectorizedSort(memoryview(values), reverse=True) == [3, 2, 1]
+            and values == array('q', [3, 1, 2]))
+
+@pytest.mark.key_sort
+def test_msd_radix_sort_key():
+    words = ["bb", "a", "ccc", "B", "", "Ab"]
+    assert msdRadixSort(list(words), key=str.lower) == sorted(words, key=str.lower)
+
+@pytest.mark.key_sort
+def test_partial_sort_key_reverse():
+    records = [(v % 50, v) for v in createRandomList(1000)]
+    result = partialSort(list(records), 20, key=lambda r: r[0], reverse=True)
+    assert result[:20] == sorted(records, key=lambda r: r[0], reverse=True)[:20]
+
+@pytest.mark.key_sort
+def test_top_k_key():
+    words = ["kiwi", "fig", "banana", "apple", "date"]
+    assert topK(words, 2, key=len) == ["fig", "kiwi"]
+
+@pytest.mark.key_sort
+def test_quick_select_key():
+    words = ["kiwi", "fig", "banana", "apple", "date"]
+    assert quickSelect(list(words), 4, key=len) == "banana"
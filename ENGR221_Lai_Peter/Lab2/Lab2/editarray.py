@@ -0,0 +1,328 @@
+"""
+Author: Peter Lai
+Filename: editarray.py
+Description: Variants of MyArray for editing in the middle of the array.
+MyArray moves every value after the edit position, so each positional
+insert or delete takes O(n) time.
+
+GapMyArray keeps an unused gap in its list at the cursor (the last edit
+position). Edits at the cursor take O(1) amortized time, and moving the
+cursor costs the distance it moves.
+
+ChunkedMyArray keeps the values in about sqrt(n) chunks of about sqrt(n)
+values, so any positional insert or delete takes O(sqrt n) time.
+
+Run this file to benchmark them against MyArray.
+"""
+
+import math
+from itertools import chain
+
+# Smallest gap left after a GapMyArray grows
+MIN_GAP = 16
+# Smallest chunk size of a ChunkedMyArray
+MIN_CHUNK = 64
+
+# An array stored in a list with a gap at the cursor
+class GapMyArray():
+    # Constructor
+    # initialSizeOrValues: the capacity to start with (int) or the values (list)
+    def __init__(self, initialSizeOrValues):
+        if type(initialSizeOrValues) == list:
+            self.__buf = initialSizeOrValues + [None] * MIN_GAP
+            self.__gapStart = len(initialSizeOrValues) # The gap starts after the values
+        elif type(initialSizeOrValues) == int:
+            self.__buf = [None] * max(initialSizeOrValues, MIN_GAP)
+            self.__gapStart = 0
+        else:
+            print("Invalid") # error message
+            return
+        self.__gapEnd = len(self.__buf)
+
+    # Return the position in the list of index idx
+    def __position(self, idx):
+        return idx if idx < self.__gapStart else idx + self.__gapEnd - self.__gapStart
+
+    # Move the gap so it starts at index idx, moving the values in between
+    def __moveGap(self, idx):
+        start, end = self.__gapStart, self.__gapEnd
+        if idx < start:
+            count = start - idx
+            self.__buf[end - count:end] = self.__buf[idx:start]
+            # Clear the slots that moved into the gap
+            freed = min(start, end - count) - idx
+            self.__buf[idx:idx + freed] = [None] * freed
+            self.__gapStart, self.__gapEnd = idx, end - count
+        elif idx > start:
+            count = idx - start
+            self.__buf[start:idx] = self.__buf[end:end + count]
+            freed = end + count - max(end, idx)
+            self.__buf[end + count - freed:end + count] = [None] * freed
+            self.__gapStart, self.__gapEnd = idx, end + count
+
+    # Make the gap hold at least count values, doubling the list if needed
+    def __reserveGap(self, count):
+        gap = self.__gapEnd - self.__gapStart
+        if gap < count:
+            grow = max(len(self.__buf), count - gap + MIN_GAP)
+            self.__buf[self.__gapEnd:self.__gapEnd] = [None] * grow
+            self.__gapEnd += grow
+
+    ########
+    # Methods
+    ########
+
+    # Return the current length of the array
+    def length(self):
+        return len(self.__buf) - (self.__gapEnd - self.__gapStart)
+
+    # Return a list of the current array values
+    def values(self):
+        return self.__buf[:self.__gapStart] + self.__buf[self.__gapEnd:]
+
+    # Return the cursor: the index where the gap is
+    def cursor(self):
+        return self.__gapStart
+
+    # Return the value at index idx
+    # Otherwise, do not return anything
+    def get(self, idx):
+        if 0 <= idx and idx < self.length(): # Check if idx is in bounds
+            return self.__buf[self.__position(idx)]
+
+    # Set the value at index idx
+    def set(self, idx, value):
+        if 0 <= idx and idx < self.length(): # Check if idx is in bounds
+            self.__buf[self.__position(idx)] = value
+
+    # Insert value to the end of the array
+    def insert(self, value):
+        self.insertAt(self.length(), [value])
+
+    # Insert values (a list) starting at index idx, moving the cursor there.
+    # idx may be length to insert at the end.
+    def insertAt(self, idx, values):
+        if 0 <= idx and idx <= self.length(): # Check if idx is in bounds
+            self.__moveGap(idx)
+            self.__reserveGap(len(values))
+            self.__buf[idx:idx + len(values)] = values
+            self.__gapStart += len(values)
+
+    # Delete count values starting at index idx, moving the cursor there.
+    # Returns the number of values deleted.
+    def deleteAt(self, idx, count=1):
+        length = self.length()
+        if 0 <= idx and idx < length and count > 0: # Check if idx is in bounds
+            count = min(count, length - idx)
+            self.__moveGap(idx)
+            # Widen the gap over the deleted values
+            self.__buf[self.__gapEnd:self.__gapEnd + count] = [None] * count
+            self.__gapEnd += count
+            return count
+        return 0
+
+    # Return the index of value in the array,
+    # or -1 if value is not in the array
+    def search(self, value):
+        try:
+            return self.__buf.index(value, 0, self.__gapStart)
+        except ValueError:
+            pass
+        try:
+            return self.__buf.index(value, self.__gapEnd) - (self.__gapEnd - self.__gapStart)
+        except ValueError:
+            return -1
+
+    # Delete every occurrence of value in the array, in one pass
+    # Returns True if value was deleted, False otherwise
+    def delete(self, value):
+        if self.search(value) == -1:
+            return False
+        kept = [v for v in self.values() if v != value]
+        self.__buf = kept + [None] * max(MIN_GAP, len(self.__buf) - len(kept))
+        self.__gapStart = len(kept)
+        self.__gapEnd = len(self.__buf)
+        return True
+
+    # Print all items in the list
+    def traverse(self):
+        for value in self.values():
+            print(value)
+
+# An array stored as a list of chunks of about sqrt(n) values
+class ChunkedMyArray():
+    # Constructor
+    # initialSizeOrValues: the capacity to start with (int) or the values (list)
+    def __init__(self, initialSizeOrValues):
+        if type(initialSizeOrValues) == list:
+            self.__rebuild(initialSizeOrValues)
+        elif type(initialSizeOrValues) == int:
+            self.__rebuild([]) # Chunks are allocated as values arrive
+        else:
+            print("Invalid") # error message
+
+    # Return the chunk size for the current length
+    def __chunkSize(self):
+        return max(MIN_CHUNK, math.isqrt(self.__length))
+
+    # Split values into chunks of the chunk size
+    def __rebuild(self, values):
+        self.__length = len(values)
+        size = self.__chunkSize()
+        self.__chunks = [values[i:i + size] for i in range(0, len(values), size)]
+
+    # Rebuild the chunks if deletes left too many small ones
+    def __rebalance(self):
+        if len(self.__chunks) > 2 * (self.__length // self.__chunkSize() + 1):
+            self.__rebuild(self.values())
+
+    # Split chunk number ci if it has grown past twice the chunk size
+    def __splitChunk(self, ci):
+        chunk = self.__chunks[ci]
+        size = self.__chunkSize()
+        if len(chunk) > 2 * size:
+            self.__chunks[ci:ci + 1] = [chunk[i:i + size] for i in range(0, len(chunk), size)]
+
+    # Return (chunk number, offset in the chunk) of index idx.
+    # Index length is past the end of the last chunk.
+    def __locate(self, idx):
+        for ci, chunk in enumerate(self.__chunks):
+            if idx < len(chunk):
+                return ci, idx
+            idx -= len(chunk)
+        return len(self.__chunks) - 1, len(self.__chunks[-1]) + idx
+
+    ########
+    # Methods
+    ########
+
+    # Return the current length of the array
+    def length(self):
+        return self.__length
+
+    # Return a list of the current array values
+    def values(self):
+        return list(chain.from_iterable(self.__chunks))
+
+    # Return the number of chunks
+    def chunkCount(self):
+        return len(self.__chunks)
+
+    # Return the value at index idx
+    # Otherwise, do not return anything
+    def get(self, idx):
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds
+            ci, offset = self.__locate(idx)
+            return self.__chunks[ci][offset]
+
+    # Set the value at index idx
+    def set(self, idx, value):
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds
+            ci, offset = self.__locate(idx)
+            self.__chunks[ci][offset] = value
+
+    # Insert value to the end of the array
+    def insert(self, value):
+        if not self.__chunks:
+            self.__chunks.append([])
+        self.__chunks[-1].append(value)
+        self.__length += 1
+        self.__splitChunk(len(self.__chunks) - 1)
+
+    # Insert values (a list) starting at index idx.
+    # idx may be length to insert at the end.
+    def insertAt(self, idx, values):
+        if 0 <= idx and idx <= self.__length and values: # Check if idx is in bounds
+            if not self.__chunks:
+                self.__chunks.append([])
+            ci, offset = self.__locate(idx)
+            self.__chunks[ci][offset:offset] = values
+            self.__length += len(values)
+            self.__splitChunk(ci)
+
+    # Delete count values starting at index idx.
+    # Returns the number of values deleted.
+    def deleteAt(self, idx, count=1):
+        if 0 <= idx and idx < self.__length and count > 0: # Check if idx is in bounds
+            count = min(count, self.__length - idx)
+            ci, offset = self.__locate(idx)
+            remaining = count
+            while remaining > 0:
+                chunk = self.__chunks[ci]
+                taken = min(remaining, len(chunk) - offset)
+                del chunk[offset:offset + taken]
+                remaining -= taken
+                if chunk:
+                    ci += 1
+                else:
+                    del self.__chunks[ci] # Drop empty chunks
+                offset = 0
+            self.__length -= count
+            self.__rebalance()
+            return count
+        return 0
+
+    # Return the index of value in the array,
+    # or -1 if value is not in the array
+    def search(self, value):
+        start = 0
+        for chunk in self.__chunks:
+            try:
+                return start + chunk.index(value)
+            except ValueError:
+                start += len(chunk)
+        return -1
+
+    # Delete every occurrence of value in the array, in one pass
+    # Returns True if value was deleted, False otherwise
+    def delete(self, value):
+        if self.search(value) == -1:
+            return False
+        chunks = [[v for v in chunk if v != value] for chunk in self.__chunks]
+        self.__chunks = [chunk for chunk in chunks if chunk]
+        self.__length = sum(len(chunk) for chunk in self.__chunks)
+        self.__rebalance()
+        return True
+
+    # Print all items in the list
+    def traverse(self):
+        for chunk in self.__chunks:
+            for value in chunk:
+                print(value)
+
+#####
+# Benchmark
+#####
+
+# Edits clustered around a cursor that drifts through the array:
+# each step inserts two values and deletes one near the cursor
+def cursorEdits(array, edits, rng):
+    cursor = array.length() // 2
+    for _ in range(edits):
+        cursor = min(max(0, cursor + rng.randint(-4, 4)), array.length())
+        array.insertAt(cursor, [cursor, cursor])
+        array.deleteAt(cursor)
+
+# Inserts and deletes at random positions
+def randomEdits(array, edits, rng):
+    for _ in range(edits):
+        array.insertAt(rng.randint(0, array.length()), [0])
+        array.deleteAt(rng.randrange(array.length()))
+
+if __name__ == '__main__':
+    import random, sys, time
+    from myarray import MyArray
+
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    print("{} values, {} edits (seconds)".format(length, edits))
+    print("{:<16} {:>12} {:>12}".format("array", "cursor", "random"))
+    for name, make in (("MyArray", MyArray), ("GapMyArray", GapMyArray),
+                       ("ChunkedMyArray", ChunkedMyArray)):
+        times = []
+        for workload in (cursorEdits, randomEdits):
+            array = make(list(range(length)))
+            start_time = time.perf_counter()
+            workload(array, edits, random.Random(0))
+            times.append(time.perf_counter() - start_time)
+        print("{:<16} {:>12.4f} {:>12.4f}".format(name, *times))
@@ -0,0 +1,220 @@
+"""
+Author: Peter Lai
+Filename: mappedarray.py
+Description: A MyArray of fixed-width values stored in a file and accessed
+through mmap, so the values survive the process and opening a large array
+does not read it. The file is a 32 byte header (magic, typecode, length,
+capacity) followed by capacity values of the typecode's size. get and set
+go straight to the mapped memory. The file grows by truncating it to the
+new size and mapping it again. Any number of processes can open the same
+file read-only at once.
+"""
+
+import mmap, os, struct
+from array import array
+
+# Header: magic, typecode, padding, length, capacity, padding to 32 bytes
+HEADER = struct.Struct('<4sc3xqq8x')
+MAGIC = b'MYAR'
+# Values read at a time by search and delete
+BLOCK_SIZE = 64 * 1024
+
+class MappedMyArray():
+    # Constructor
+    # path: file holding the array; it is created if it does not exist
+    # typecode: array.array typecode of the values (default 'q'); must match
+    #           the file's typecode when opening an existing array
+    # capacity: values to make room for when creating the file
+    # readonly: map the file read-only, so other processes can share it
+    def __init__(self, path, typecode=None, capacity=0, readonly=False):
+        self.__readonly = readonly
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if not exists and readonly:
+            raise FileNotFoundError(path)
+        self.__file = open(path, 'rb' if readonly else ('r+b' if exists else 'w+b'))
+        try:
+            if exists:
+                self.__readHeader(path, typecode)
+            else:
+                self.__typecode = typecode or 'q'
+                self.__itemsize = array(self.__typecode).itemsize
+                self.__length = 0
+                self.__capacity = 0
+                os.ftruncate(self.__file.fileno(), HEADER.size)
+            self.__map()
+            if not exists:
+                self.reserve(capacity)
+                self.__writeHeader()
+        except BaseException:
+            self.__file.close()
+            raise
+
+    # Read and check the header of an existing file
+    def __readHeader(self, path, typecode):
+        magic, code, length, capacity = HEADER.unpack(self.__file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("{} is not a MappedMyArray file".format(path))
+        self.__typecode = code.decode('ascii')
+        if typecode is not None and typecode != self.__typecode:
+            raise ValueError("{} holds typecode {!r}, not {!r}".format(path, self.__typecode, typecode))
+        self.__itemsize = array(self.__typecode).itemsize
+        self.__length = length
+        self.__capacity = capacity
+        if os.path.getsize(path) < HEADER.size + capacity * self.__itemsize:
+            raise ValueError("{} is shorter than its header says".format(path))
+
+    # Map the file and make a typed view of the values after the header
+    def __map(self):
+        access = mmap.ACCESS_READ if self.__readonly else mmap.ACCESS_WRITE
+        self.__mm = mmap.mmap(self.__file.fileno(), 0, access=access)
+        self.__view = memoryview(self.__mm)[HEADER.size:].cast(self.__typecode)
+
+    # Release the view and the map
+    def __unmap(self):
+        self.__view.release()
+        self.__mm.close()
+
+    # Write the length and capacity into the mapped header
+    def __writeHeader(self):
+        HEADER.pack_into(self.__mm, 0, MAGIC, self.__typecode.encode('ascii'),
+                         self.__length, self.__capacity)
+
+    # Raise if the array cannot be changed
+    def __checkWritable(self):
+        if self.__readonly:
+            raise ValueError("array was opened read-only")
+
+    ########
+    # Methods
+    ########
+
+    # Return the current length of the array
+    def length(self):
+        return self.__length
+
+    # Return the number of values the file has room for
+    def capacity(self):
+        return self.__capacity
+
+    # Return the typecode of the values
+    def typecode(self):
+        return self.__typecode
+
+    # Return a list of the current array values
+    def values(self):
+        return self.__view[:self.__length].tolist()
+
+    # Return the value at index idx
+    # Otherwise, do not return anything
+    def get(self, idx):
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds, and
+            return self.__view[idx]          # only return item if in bounds
+
+    # Set the value at index idx
+    def set(self, idx, value):
+        self.__checkWritable()
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds, and
+            self.__view[idx] = value         # only set item if in bounds
+
+    # Make room for at least capacity values: grow the file and map it again
+    def reserve(self, capacity):
+        self.__checkWritable()
+        if capacity > self.__capacity:
+            self.__unmap()
+            os.ftruncate(self.__file.fileno(), HEADER.size + capacity * self.__itemsize)
+            self.__capacity = capacity
+            self.__map()
+            self.__writeHeader()
+
+    # Shrink the file so capacity equals length
+    def shrinkToFit(self):
+        self.__checkWritable()
+        self.__unmap()
+        os.ftruncate(self.__file.fileno(), HEADER.size + self.__length * self.__itemsize)
+        self.__capacity = self.__length
+        self.__map()
+        self.__writeHeader()
+
+    # Insert value to the end of the array
+    def insert(self, value):
+        self.__checkWritable()
+        if self.__length == self.__capacity: # Double the capacity when full
+            self.reserve(self.__capacity * 2 if self.__capacity > 0 else 1)
+        self.__view[self.__length] = value
+        self.__length += 1
+        self.__writeHeader()
+
+    # Insert every value from values at the end of the array,
+    # growing the file at most once
+    def extend(self, values):
+        self.__checkWritable()
+        values = array(self.__typecode, values)
+        end = self.__length + len(values)
+        if end > self.__capacity:
+            self.reserve(max(end, self.__capacity * 2))
+        self.__view[self.__length:end] = memoryview(values)
+        self.__length = end
+        self.__writeHeader()
+
+    # Return the index of value in the array,
+    # or -1 if value is not in the array
+    def search(self, value):
+        for start in range(0, self.__length, BLOCK_SIZE):
+            block = self.__view[start:min(start + BLOCK_SIZE, self.__length)].tolist()
+            try:
+                return start + block.index(value)
+            except ValueError:
+                pass
+        return -1
+
+    # Delete every occurrence of value in the array, in one pass
+    # Returns True if value was deleted, False otherwise
+    def delete(self, value):
+        self.__checkWritable()
+        idx = self.search(value)
+        if idx == -1:
+            return False
+        write = idx
+        for start in range(idx, self.__length, BLOCK_SIZE):
+            kept = array(self.__typecode, [v for v in
+                         self.__view[start:min(start + BLOCK_SIZE, self.__length)].tolist() if v != value])
+            self.__view[write:write + len(kept)] = memoryview(kept)
+            write += len(kept)
+        # Clear the freed slots
+        freed = self.__length - write
+        self.__view[write:self.__length] = memoryview(array(self.__typecode, bytes(freed * self.__itemsize)))
+        self.__length = write
+        self.__writeHeader()
+        return True
+
+    # Print all items in the list
+    def traverse(self):
+        for i in range(self.__length):
+            print(self.__view[i])
+
+    # Return a memoryview over the current values, without copying them.
+    # Release it before the array grows or is closed.
+    def memoryview(self):
+        return self.__view[:self.__length]
+
+    # Write changes to the file
+    def flush(self):
+        if not self.__readonly:
+            self.__mm.flush()
+
+    # Flush and close the file
+    def close(self):
+        if self.__file.closed:
+            return
+        self.flush()
+        self.__unmap()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+if __name__ == '__main__':
+    pass
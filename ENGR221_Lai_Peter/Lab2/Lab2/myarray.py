@@ -4,22 +4,118 @@ Filename: myarray.py
 Description: Implementation of multiple sorting algorithms.
 """
 
+import heapq, sys, time, weakref
+from array import array
+from bisect import bisect_left, insort
+from itertools import compress, islice
+
+# Values per chunk that a snapshot shares or copies as a unit
+SNAPSHOT_CHUNK = 1024
+
 class MyArray():
     # Constructor
-    def __init__(self, initialSizeOrValues):
+    # initialSizeOrValues: the capacity to start with (int) or the values (list)
+    # typecode: if given, values are stored unboxed in an array.array of this
+    #           type (e.g. 'd' for floats, 'q' for 64 bit ints) instead of a list
+    # indexed: if True, keep a hash index from each value to the position
+    #          it occupies (or its sorted positions, if it repeats), so
+    #          search and delete do not scan. Values must be hashable.
+    def __init__(self, initialSizeOrValues, typecode=None, indexed=False):
+        self.__typecode = typecode # Storage type, or None for a list
+        self.__index = {} if indexed else None # value -> position, or sorted list of positions
+        self.__repeated = set() # Values whose index entry is a list
+        self.__snapshots = None # live snapshot -> its saved chunks, once snapshot() is called
 
-        if type(initialSizeOrValues) == int: # Array Initialization
-            self.__a = initialSizeOrValues # Stores list as array
+        if type(initialSizeOrValues) == list: # Array Initialization
+            self.__a = self.__storage(initialSizeOrValues) # Stores list as array
             self.__length = len(initialSizeOrValues) # Sets length to list length
             self.__capacity = self.__length # Sets capacity equal to value set
+            self.__indexFrom(0) # Indexes the starting values
 
         elif type(initialSizeOrValues) == int: # Array Initialization
-            self.__a = [None] * initialSizeOrValues # The array stored as a list
+            self.__a = self.__padding(initialSizeOrValues) # The array stored as a list
             self.__length = 0               # Start with no values in the list
             self.__capacity = initialSizeOrValues # Sets capacity to integer
 
         else:
             print("Invalid") # error message
+
+    # Return storage holding the given values
+    def __storage(self, values):
+        if self.__typecode is None:
+            return list(values)
+        return array(self.__typecode, values)
+
+    # Return count unused slots: None for a list, zeros for a typed array
+    def __padding(self, count):
+        if self.__typecode is None:
+            return [None] * count
+        return array(self.__typecode, bytes(count * array(self.__typecode).itemsize))
+
+    # Before positions start..stop-1 change, save a copy of every chunk
+    # they touch into the snapshots that still share it.
+    # Callers check self.__snapshots first, so arrays without live
+    # snapshots only pay for that check.
+    def __beforeWrite(self, start, stop):
+        if len(self.__snapshots) == 0: # Every snapshot was dropped
+            self.__snapshots = None
+            return
+        for snapshot, saved in self.__snapshots.items():
+            end = min(stop, len(snapshot))
+            if end <= start:
+                continue
+            for chunk in range(start // SNAPSHOT_CHUNK, (end - 1) // SNAPSHOT_CHUNK + 1):
+                if chunk not in saved:
+                    lo = chunk * SNAPSHOT_CHUNK
+                    saved[chunk] = self.__a[lo:min(lo + SNAPSHOT_CHUNK, len(snapshot))]
+
+    # Add position pos to the index entry of value. The entry is the
+    # position itself while value occurs once, and a sorted list of its
+    # positions once it repeats.
+    def __indexAdd(self, value, pos):
+        entry = self.__index.get(value)
+        if entry is None:
+            self.__index[value] = pos
+        elif type(entry) is int:
+            self.__index[value] = [entry, pos] if entry < pos else [pos, entry]
+            self.__repeated.add(value)
+        else:
+            insort(entry, pos)
+
+    # Remove position pos from the index entry of value
+    def __indexRemove(self, value, pos):
+        entry = self.__index[value]
+        if type(entry) is int:
+            del self.__index[value]
+        else:
+            del entry[bisect_left(entry, pos)]
+            if len(entry) == 1: # Back to a single position
+                self.__index[value] = entry[0]
+                self.__repeated.discard(value)
+
+    # Add the values at positions start..length-1 to the value index
+    def __indexFrom(self, start):
+        if self.__index is not None:
+            for i in range(start, self.__length):
+                self.__indexAdd(self.__a[i], i)
+
+    # Update the value index after the values from old position cut on
+    # moved to start..stop-1. Values that occur once get their new position
+    # in place with a single dict update. Repeated values drop their
+    # positions from cut on and get the new ones appended, in order.
+    def __reindexMoved(self, cut, start, stop):
+        index, repeated = self.__index, self.__repeated
+        lists = {value: index[value] for value in repeated}
+        moved = self.__a[start:stop]
+        index.update(zip(moved, range(start, stop)))
+        if not lists:
+            return
+        for value, positions in lists.items():
+            del positions[bisect_left(positions, cut):]
+            index[value] = positions
+        flags = list(map(repeated.__contains__, moved))
+        for value, pos in zip(compress(moved, flags), compress(range(start, stop), flags)):
+            lists[value].append(pos)
     
     ########
     # Methods
@@ -31,7 +127,9 @@ class MyArray():
     
     # Return a list of the current array values
     def values(self):
-        return self.__a[:self.__length]
+        if self.__typecode is None:
+            return self.__a[:self.__length]
+        return self.__a[:self.__length].tolist()
 
     # Return the value at index idx
     # Otherwise, do not return anything
@@ -42,6 +140,11 @@ class MyArray():
     # Set the value at index idx
     def set(self, idx, value):         
       if 0 <= idx and idx < self.__length: # Check if idx is in bounds, and
+         if self.__snapshots is not None:
+             self.__beforeWrite(idx, idx + 1)
+         if self.__index is not None:      # move idx to the new value's positions
+            self.__indexRemove(self.__a[idx], idx)
+            self.__indexAdd(value, idx)
          self.__a[idx] = value               # only set item if in bounds
     
     # Insert value to the end of the array
@@ -49,70 +152,566 @@ class MyArray():
 
         if self.__length == self.__capacity: #checks if array is full
             new_capacity = self.__capacity * 2 if self.__capacity > 0 else 1 #cap is doubled if > 0, otherwise initializes 1
-            self.__a.extend([None] * [new_capacity - self.__capacity]) # expands null capacity
-            self.__capacity = new_capacity # updates capacity
+            self.reserve(new_capacity) # expands null capacity
 
+        if self.__snapshots is not None:
+            self.__beforeWrite(self.__length, self.__length + 1)
         self.__a[self.__length] = value # sets new value at current position
 
         # Increment the length
         self.__length += 1   
+        self.__indexFrom(self.__length - 1)
 
     # Return the index of value in the array, 
     # or -1 if value is not in the array
     def search(self, value):
 
-        # Only search the indices we've inserted
-        for idx in range(self.__length): 
+        # Look the value up in the index if there is one
+        if self.__index is not None:
+            try:
+                entry = self.__index.get(value)
+            except TypeError: # Unhashable values are never in the array
+                return -1
+            if entry is None:
+                return -1
+            return entry if type(entry) is int else entry[0]
 
-            # Check the value at the current index 
-            if self.__a[idx] == value:  
+        # Only search the indices we've inserted
+        # (index scans in C rather than one Python step per value)
+        try:
+            return self.__a.index(value, 0, self.__length)
 
-                # Return the index  
-                return idx  
-            
-        # Return -1 if value was not found             
-        return -1                        
+        # Return -1 if value was not found
+        except (ValueError, TypeError):
+            return -1
 
-    # Delete the first occurrence of value in the array
+    # Delete every occurrence of value in the array
     # Returns True if value was deleted, False otherwise
     def delete(self, value):
+        return self.deleteAll(value) > 0
+
+    ########
+    # Bulk operations
+    ########
+
+    # Make room for at least capacity values without changing the length
+    def reserve(self, capacity):
+        if capacity > self.__capacity:
+            self.__a.extend(self.__padding(capacity - self.__capacity)) # expands null capacity
+            self.__capacity = capacity # updates capacity
+
+    # Release the unused capacity, so capacity equals length
+    def shrinkToFit(self):
+        del self.__a[self.__length:]
+        self.__capacity = self.__length
 
-        deleted = False # sees if deletion was successful
+    # Insert every value from values at the end of the array,
+    # growing the capacity at most once
+    def extend(self, values):
+        values = self.__storage(values)
+        end = self.__length + len(values)
+        if end > self.__capacity:
+            self.reserve(max(end, self.__capacity * 2))
+        if self.__snapshots is not None:
+            self.__beforeWrite(self.__length, end)
+        self.__a[self.__length:end] = values
+        start, self.__length = self.__length, end
+        self.__indexFrom(start)
 
-        i = 0 # establishing search value
+    # Insert values (a list) starting at index idx, shifting the values
+    # after idx once rather than once per inserted value.
+    # idx may be length to insert at the end.
+    def insertAt(self, idx, values):
+        if 0 <= idx and idx <= self.__length: # Check if idx is in bounds
+            values = self.__storage(values)
+            count = len(values)
+            end = self.__length + count
+            if end > self.__capacity:
+                self.reserve(max(end, self.__capacity * 2))
+            if self.__snapshots is not None:
+                self.__beforeWrite(idx, end)
+            # Shift the tail right in one block, then fill the gap
+            self.__a[idx + count:end] = self.__a[idx:self.__length]
+            self.__a[idx:idx + count] = values
+            self.__length = end
+            if self.__index is not None:
+                self.__reindexMoved(idx, idx + count, end)
+                for pos, value in enumerate(values, idx):
+                    self.__indexAdd(value, pos)
 
-        while i < self.__length: # Finds first occurance of value in array
+    # Delete count values starting at index idx, shifting the values after
+    # them once. Returns the number of values deleted.
+    def deleteAt(self, idx, count=1):
+        if 0 <= idx and idx < self.__length and count > 0: # Check if idx is in bounds
+            stop = min(idx + count, self.__length)
+            if self.__snapshots is not None:
+                self.__beforeWrite(idx, self.__length)
+            if self.__index is not None:
+                for pos in range(idx, stop):
+                    self.__indexRemove(self.__a[pos], pos)
+            # Shift the tail left in one block over the deleted values
+            self.__a[idx:self.__length - (stop - idx)] = self.__a[stop:self.__length]
+            removed = self.__truncate(self.__length - (stop - idx))
+            if self.__index is not None:
+                self.__reindexMoved(idx, idx, self.__length)
+            return removed
+        return 0
 
-            if self.__a[i] == value:
+    # Delete every occurrence of value in one pass.
+    # Returns the number of values deleted.
+    def deleteAll(self, value):
 
-                for j in range (i, self.__length - 1):
-                    self.__a[j] = self.__a[j + 1] 
-                self.__a[self.__length - 1] = None #sets ending value to "None"
+        # With an index, move the blocks between the deleted positions
+        if self.__index is not None:
+            return self.__deleteIndexed(value)
 
-                self.__length -= 1 # Reduces array length
-        # Find the index of the value to delete
+        # Find the index of the first value to delete
         idx = self.search(value)
-        
-        # If the value was found
-        if idx != -1: 
+        if idx == -1:
+            return 0
 
-            # Decrement the array length
-            self.__length -= 1
+        # Shift the remaining values left over the deleted ones
+        if self.__snapshots is not None:
+            self.__beforeWrite(idx, self.__length)
+        write = idx
+        for read in range(idx + 1, self.__length):
+            if self.__a[read] != value:
+                self.__a[write] = self.__a[read]
+                write += 1
+        return self.__truncate(write)
 
-            # Shift all the remaining values 
-            for j in range(idx, self.__length):
-                self.__a[j] = self.__a[j+1]
+    # Delete every occurrence of value using the index: the values between
+    # the deleted positions are moved left in blocks, and their stored
+    # positions are shifted left by the number of deleted values before them.
+    # Returns the number of values deleted.
+    def __deleteIndexed(self, value):
+        try:
+            entry = self.__index.pop(value, None)
+        except TypeError: # Unhashable values are never in the array
+            return 0
+        if entry is None:
+            return 0
+        self.__repeated.discard(value)
+        positions = [entry] if type(entry) is int else entry
+        first = positions[0]
+        if self.__snapshots is not None:
+            self.__beforeWrite(first, self.__length)
+        positions.append(self.__length)
+        write = first
+        for deleted, following in zip(positions, positions[1:]):
+            block = following - deleted - 1 # values kept until the next deleted one
+            self.__a[write:write + block] = self.__a[deleted + 1:following]
+            write += block
+        removed = self.__truncate(write)
+        self.__reindexMoved(first, first, write)
+        return removed
 
-            # Return that value was deleted
-            return True
-        
-        # Return False if the value was not found
-        return False
+    # Delete every value for which predicate(value) is true, in one pass.
+    # Returns the number of values deleted.
+    def deleteWhere(self, predicate):
+        if self.__snapshots is not None:
+            self.__beforeWrite(0, self.__length)
+        if self.__index is not None:
+            self.__index = {} # Re-indexed once the kept values are in place
+            self.__repeated = set()
+        write = 0
+        for read in range(self.__length):
+            value = self.__a[read]
+            if not predicate(value):
+                self.__a[write] = value
+                write += 1
+        removed = self.__truncate(write)
+        self.__indexFrom(0)
+        return removed
+
+    # Clear the slots from length down to new_length and shorten the array.
+    # Returns the number of values removed.
+    def __truncate(self, new_length):
+        removed = self.__length - new_length
+        self.__a[new_length:self.__length] = self.__padding(removed)
+        self.__length = new_length
+        return removed
     
     # Print all items in the list
     def traverse(self):
         for i in range(self.__length):
             print(self.__a[i])
 
+    # Return True if the array keeps a value index
+    def indexed(self):
+        return self.__index is not None
+
+    # Return the memory (bytes) used by the value index: the dict and the
+    # stored positions (ints, or lists for repeated values), not counting
+    # the values it shares with the array
+    def indexMemory(self):
+        if self.__index is None:
+            return 0
+        return sys.getsizeof(self.__index) + sum(sys.getsizeof(entry) for entry in self.__index.values())
+
+    ########
+    # Views and iteration
+    ########
+
+    # Number of values, so len(a) works
+    def __len__(self):
+        return self.__length
+
+    # Iterate over the values without copying them
+    def __iter__(self):
+        return islice(self.__a, 0, self.__length)
+
+    # a[i] returns the value at index i (negative counts from the end) and
+    # raises IndexError when out of bounds. a[start:stop:step] returns an
+    # ArrayView over the same storage, without copying.
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return ArrayView(self.__a, range(*idx.indices(self.__length)))
+        if idx < 0:
+            idx += self.__length
+        if 0 <= idx and idx < self.__length:
+            return self.__a[idx]
+        raise IndexError("MyArray index out of range")
+
+    # Return a lazy pipeline applying function to every value
+    def map(self, function):
+        return self[:].map(function)
+
+    # Return a lazy pipeline of the values for which predicate is true
+    def filter(self, predicate):
+        return self[:].filter(predicate)
+
+    # Return True while writes still save chunks for snapshots. Turns
+    # False at the first write after the last snapshot is dropped.
+    def tracksSnapshots(self):
+        return self.__snapshots is not None
+
+    # Return a read-only snapshot of the current values in O(1) time.
+    # The snapshot shares the storage; before the array next changes a
+    # chunk of SNAPSHOT_CHUNK positions the snapshot can see, that chunk is
+    # copied into the snapshot, so memory only grows with the chunks
+    # touched. Writes through memoryview() are not seen by snapshots.
+    def snapshot(self):
+        saved = {}
+        snapshot = ArraySnapshot(self.__a, self.__length, saved)
+        if self.__snapshots is None:
+            self.__snapshots = weakref.WeakKeyDictionary()
+        self.__snapshots[snapshot] = saved
+        return snapshot
+
+    # Return the typecode of a typed array, or None
+    def typecode(self):
+        return self.__typecode
+
+    # Return a memoryview over the current values of a typed array, without
+    # copying them, e.g. for numpy.frombuffer() or writing to a file.
+    # The array cannot grow past its capacity while the view is in use.
+    def memoryview(self):
+        if self.__typecode is None:
+            raise TypeError("only typed MyArrays expose a buffer")
+        return memoryview(self.__a)[:self.__length]
+
+    # Buffer protocol (Python 3.12+): memoryview(a) works directly
+    def __buffer__(self, flags):
+        return self.memoryview()
+
+    # Write the current values of a typed array to a binary file
+    def tofile(self, f):
+        with self.memoryview() as view:
+            f.write(view)
+
+# A MyArray that keeps its values in ascending order. search, insert and
+# delete find positions by bisection, so search takes O(log n) comparisons
+# and insert/delete move the values after the position in one block.
+# Values must be comparable with each other.
+class SortedMyArray(MyArray):
+
+    # Constructor, same arguments as MyArray. A list of values is sorted.
+    def __init__(self, initialSizeOrValues, typecode=None):
+        if type(initialSizeOrValues) == list:
+            initialSizeOrValues = sorted(initialSizeOrValues)
+        super().__init__(initialSizeOrValues, typecode)
+
+    # Return the first index whose value is not less than value
+    def __bisectLeft(self, value):
+        lo, hi = 0, self.length()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.get(mid) < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # Return the first index whose value is greater than value
+    def __bisectRight(self, value):
+        lo, hi = 0, self.length()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if value < self.get(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    # Return True if values (a sorted list) can go at index idx
+    # without breaking the order
+    def __fits(self, idx, values):
+        if idx > 0 and values[0] < self.get(idx - 1):
+            return False
+        return idx >= self.length() or not self.get(idx) < values[-1]
+
+    # Insert value at its place in the order
+    def insert(self, value):
+        super().insertAt(self.__bisectRight(value), [value])
+
+    # Return the index of the first occurrence of value,
+    # or -1 if value is not in the array
+    def search(self, value):
+        idx = self.__bisectLeft(value)
+        if idx < self.length() and self.get(idx) == value:
+            return idx
+        return -1
+
+    # Set the value at index idx, only if the array stays sorted
+    def set(self, idx, value):
+        if 0 <= idx and idx < self.length():
+            if (idx == 0 or not value < self.get(idx - 1)) and \
+               (idx == self.length() - 1 or not self.get(idx + 1) < value):
+                super().set(idx, value)
+
+    # Insert values starting at index idx, only if they are sorted and the
+    # array stays sorted
+    def insertAt(self, idx, values):
+        values = list(values)
+        if values and 0 <= idx and idx <= self.length() and \
+           values == sorted(values) and self.__fits(idx, values):
+            super().insertAt(idx, values)
+
+    # Insert every value from values at its place in the order, merging the
+    # sorted new values with the array in one pass
+    def extend(self, values):
+        values = sorted(values)
+        if not values:
+            return
+        old_length = self.length()
+        if old_length == 0 or not values[0] < self.get(old_length - 1):
+            super().extend(values) # All new values go at the end
+            return
+        merged = heapq.merge(self.values(), values)
+        super().extend(values)
+        for i, value in enumerate(merged):
+            super().set(i, value)
+
+    # Delete every occurrence of value, as one block.
+    # Returns the number of values deleted.
+    def deleteAll(self, value):
+        lo = self.__bisectLeft(value)
+        return self.deleteAt(lo, self.__bisectRight(value) - lo)
+
+    # Return the number of values less than value
+    def countLessThan(self, value):
+        return self.__bisectLeft(value)
+
+    # Return the rank of value: its index if it were inserted before any
+    # equal values (the same as countLessThan)
+    def rank(self, value):
+        return self.__bisectLeft(value)
+
+    # Return the number of occurrences of value
+    def count(self, value):
+        return self.__bisectRight(value) - self.__bisectLeft(value)
+
+    # Return a list of the values v with lo <= v <= hi, in order
+    def valuesBetween(self, lo, hi):
+        return [self.get(i) for i in range(self.__bisectLeft(lo), self.__bisectRight(hi))]
+
+# A view of some of the positions of a MyArray's storage (a range of
+# indices), sharing the storage rather than copying it. The view sees later
+# changes to those positions, and should not be used after the array gets
+# shorter than the view.
+class ArrayView():
+    # Constructor
+    # storage: the list or array.array holding the values
+    # positions: a range of indices into storage
+    def __init__(self, storage, positions:range):
+        self.__storage = storage
+        self.__positions = positions
+
+    # Number of values in the view
+    def __len__(self):
+        return len(self.__positions)
+
+    # Iterate over the values in the view without copying them
+    # (only the view's positions are visited, wherever they start)
+    def __iter__(self):
+        return map(self.__storage.__getitem__, self.__positions)
+
+    # v[i] returns a value; v[start:stop:step] returns a narrower view
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return ArrayView(self.__storage, self.__positions[idx])
+        return self.__storage[self.__positions[idx]]
+
+    # Return a list of the values in the view
+    def values(self):
+        return list(self)
+
+    # Return a lazy pipeline applying function to every value
+    def map(self, function):
+        return ArrayPipeline(self).map(function)
+
+    # Return a lazy pipeline of the values for which predicate is true
+    def filter(self, predicate):
+        return ArrayPipeline(self).filter(predicate)
+
+    def __repr__(self):
+        return "ArrayView({})".format(self.values())
+
+# A read-only snapshot of a MyArray, made by MyArray.snapshot(). Chunks the
+# array has not changed since are read from the shared storage, and chunks
+# it has changed are read from the copies the array saved first.
+class ArraySnapshot():
+    # Constructor
+    # storage: the array's list or array.array
+    # length: the array's length when the snapshot was taken
+    # saved: chunk number -> copy of that chunk, filled in by the array
+    def __init__(self, storage, length, saved:dict):
+        self.__storage = storage
+        self.__length = length
+        self.__saved = saved
+
+    # Return the current length of the snapshot
+    def length(self):
+        return self.__length
+
+    def __len__(self):
+        return self.__length
+
+    # Return the number of chunks copied since the snapshot was taken
+    def savedChunks(self):
+        return len(self.__saved)
+
+    # Return the value at index idx
+    # Otherwise, do not return anything
+    def get(self, idx):
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds
+            chunk = self.__saved.get(idx // SNAPSHOT_CHUNK)
+            if chunk is None:
+                return self.__storage[idx]
+            return chunk[idx % SNAPSHOT_CHUNK]
+
+    # s[i] returns the value at index i (negative counts from the end)
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.__length
+        if 0 <= idx and idx < self.__length:
+            return self.get(idx)
+        raise IndexError("ArraySnapshot index out of range")
+
+    # Iterate over the values chunk by chunk, without copying them
+    def __iter__(self):
+        for lo in range(0, self.__length, SNAPSHOT_CHUNK):
+            chunk = self.__saved.get(lo // SNAPSHOT_CHUNK)
+            hi = min(lo + SNAPSHOT_CHUNK, self.__length)
+            if chunk is None:
+                # Index the chunk directly; islice would step over the first lo values
+                yield from map(self.__storage.__getitem__, range(lo, hi))
+            else:
+                yield from chunk
+
+    # Return a list of the values in the snapshot
+    def values(self):
+        return list(self)
+
+    # Return the index of value in the snapshot,
+    # or -1 if value is not in the snapshot
+    def search(self, value):
+        for idx, found in enumerate(self):
+            if found == value:
+                return idx
+        return -1
+
+    # Print all items in the snapshot
+    def traverse(self):
+        for value in self:
+            print(value)
+
+    # Return a lazy pipeline applying function to every value
+    def map(self, function):
+        return ArrayPipeline(self).map(function)
+
+    # Return a lazy pipeline of the values for which predicate is true
+    def filter(self, predicate):
+        return ArrayPipeline(self).filter(predicate)
+
+# A chain of map and filter steps over a view. Nothing runs until the
+# pipeline is iterated, and values flow through one at a time, so no
+# intermediate lists are made. A pipeline can be iterated more than once.
+class ArrayPipeline():
+    # Constructor
+    # source: an iterable of values (usually an ArrayView)
+    # steps: (map or filter, function) pairs, applied in order
+    def __init__(self, source, steps=()):
+        self.__source = source
+        self.__steps = tuple(steps)
+
+    # Return a pipeline that also applies function to every value
+    def map(self, function):
+        return ArrayPipeline(self.__source, self.__steps + ((map, function),))
+
+    # Return a pipeline that also drops values for which predicate is false
+    def filter(self, predicate):
+        return ArrayPipeline(self.__source, self.__steps + ((filter, predicate),))
+
+    # Run the steps lazily over the source
+    def __iter__(self):
+        values = iter(self.__source)
+        for step, function in self.__steps:
+            values = step(function, values)
+        return values
+
+    # Return a list of the values the pipeline produces
+    def values(self):
+        return list(self)
+
+#####
+# Benchmark
+#####
+
+# Times set() on every position of a
+def timeWrites(a):
+    start_time = time.perf_counter()
+    for i in range(a.length()):
+        a.set(i, i)
+    return time.perf_counter() - start_time
+
+# Times deleteAll(value) for each value in values
+def timeDeletes(a, values):
+    start_time = time.perf_counter()
+    for value in values:
+        a.deleteAll(value)
+    return time.perf_counter() - start_time
+
 if __name__ == '__main__':
-    pass
+    import random
+
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    deletes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print("{} values (seconds)".format(length))
+    # Writes pay for snapshots only while one is alive
+    a = MyArray(list(range(length)))
+    without = timeWrites(a)
+    s = a.snapshot()
+    timeWrites(a) # Saves every chunk into the snapshot
+    live = timeWrites(a)
+    del s
+    dropped = timeWrites(a)
+    print("{:<28} {:>10.4f}".format("writes, no snapshot", without))
+    print("{:<28} {:>10.4f}".format("writes, live snapshot", live))
+    print("{:<28} {:>10.4f}".format("writes, snapshot dropped", dropped))
+    # Indexed deleteAll shifts the stored positions of the moved tail
+    values = random.Random(0).sample(range(length), deletes)
+    for name, indexed in (("deleteAll x{}, plain", False), ("deleteAll x{}, indexed", True)):
+        a = MyArray(list(range(length)), indexed=indexed)
+        print("{:<28} {:>10.4f}".format(name.format(deletes), timeDeletes(a, values)))
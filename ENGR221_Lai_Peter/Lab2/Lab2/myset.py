@@ -0,0 +1,165 @@
+"""
+Author: Peter Lai
+Filename: myset.py
+Description: Implementation of a set as an open-addressing hash table.
+The values are kept in insertion order in a dense entries list, and the
+hash table only stores the position of each entry (like Python's dict), so
+insert, search and delete take O(1) time on average and traverse prints
+the values in the order they were inserted.
+"""
+
+# Table slot markers: never used, or used by an entry that was deleted
+EMPTY = -1
+DUMMY = -2
+# Smallest hash table size (a power of 2)
+MIN_TABLE_SIZE = 8
+# Bits of the hash mixed into each probe, as in CPython
+PERTURB_SHIFT = 5
+HASH_MASK = (1 << 64) - 1
+
+# Placeholder for a deleted entry
+_DELETED = object()
+
+class MySet():
+    # Constructor
+    # values: any iterable of hashable values; duplicates are dropped.
+    # The table is sized for all of them up front, so building a set from
+    # a large iterable never resizes.
+    def __init__(self, values=()):
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        self.__hashes = []          # Hash of each entry, in insertion order
+        self.__values = []          # Value of each entry, or _DELETED
+        self.__size = 0             # Number of values in the set
+        self.__resize(len(values))
+        for value in values:
+            self.insert(value)
+
+    # Rebuild the table with room for at least count values, dropping
+    # deleted entries
+    def __resize(self, count):
+        table_size = MIN_TABLE_SIZE
+        while table_size * 2 < count * 3: # Keep the table at most 2/3 full
+            table_size *= 2
+        if self.__size < len(self.__values):
+            live = [i for i, value in enumerate(self.__values) if value is not _DELETED]
+            self.__hashes = [self.__hashes[i] for i in live]
+            self.__values = [self.__values[i] for i in live]
+        self.__table = [EMPTY] * table_size
+        mask = table_size - 1
+        for entry, h in enumerate(self.__hashes):
+            perturb = h & HASH_MASK
+            slot = perturb & mask
+            while self.__table[slot] != EMPTY:
+                perturb >>= PERTURB_SHIFT
+                slot = (slot * 5 + perturb + 1) & mask
+            self.__table[slot] = entry
+
+    # Find value (with hash h) in the table
+    # Returns (slot, entry): the slot holding value and its entry index, or
+    # the slot to insert value into and -1 if value is not in the set
+    def __lookup(self, value, h):
+        mask = len(self.__table) - 1
+        perturb = h & HASH_MASK
+        slot = perturb & mask
+        free = -1
+        while True:
+            entry = self.__table[slot]
+            if entry == EMPTY:
+                return (slot if free == -1 else free), -1
+            if entry == DUMMY:
+                if free == -1:
+                    free = slot
+            elif self.__hashes[entry] == h:
+                found = self.__values[entry]
+                if found is value or found == value:
+                    return slot, entry
+            perturb >>= PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+    ########
+    # Methods
+    ########
+
+    # Return the number of values in the set
+    def size(self):
+        return self.__size
+
+    # Return a list of the values in the set, in insertion order
+    def vals(self):
+        return [value for value in self.__values if value is not _DELETED]
+
+    # Return True if value is in the set, False otherwise
+    def search(self, value):
+        return self.__lookup(value, hash(value))[1] != -1
+
+    # Insert value into the set if it is not already there
+    def insert(self, value):
+        h = hash(value)
+        slot, entry = self.__lookup(value, h)
+        if entry != -1:
+            return
+        # Every entry, deleted or not, fills a slot
+        if (len(self.__values) + 1) * 3 > len(self.__table) * 2:
+            self.__resize(2 * (self.__size + 1))
+            slot, _ = self.__lookup(value, h)
+        self.__table[slot] = len(self.__values)
+        self.__hashes.append(h)
+        self.__values.append(value)
+        self.__size += 1
+
+    # Delete value from the set
+    # Returns True if value was deleted, False otherwise
+    def delete(self, value):
+        slot, entry = self.__lookup(value, hash(value))
+        if entry == -1:
+            return False
+        self.__table[slot] = DUMMY
+        self.__values[entry] = _DELETED
+        self.__size -= 1
+        return True
+
+    # Print all values in the set, in insertion order
+    def traverse(self):
+        for value in self.__values:
+            if value is not _DELETED:
+                print(value)
+
+    ########
+    # Set algebra
+    # Each operation returns a new MySet and iterates the smaller operand
+    ########
+
+    # Return a set of the values in this set or other
+    def union(self, other):
+        larger, smaller = (self, other) if self.__size >= other.size() else (other, self)
+        result = larger.copy()
+        for value in smaller.vals():
+            result.insert(value)
+        return result
+
+    # Return a set of the values in both this set and other
+    def intersection(self, other):
+        larger, smaller = (self, other) if self.__size >= other.size() else (other, self)
+        return MySet([value for value in smaller.vals() if larger.search(value)])
+
+    # Return a set of the values in this set but not in other
+    def difference(self, other):
+        if self.__size <= other.size():
+            return MySet([value for value in self.vals() if not other.search(value)])
+        result = self.copy()
+        for value in other.vals():
+            result.delete(value)
+        return result
+
+    # Return a copy of the set, copying the table rather than rehashing
+    def copy(self):
+        result = MySet()
+        result.__hashes = self.__hashes[:]
+        result.__values = self.__values[:]
+        result.__table = self.__table[:]
+        result.__size = self.__size
+        return result
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,210 @@
+"""
+Author: Peter Lai
+Filename: sparsearray.py
+Description: A MyArray for arrays that are mostly holes (None). While few
+slots hold values, only those are stored, as a sorted array of their indices
+and a list of their values, so memory grows with the values rather than the
+length. When enough slots fill up the array switches to a plain list, and
+back again if it empties out.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+
+# Switch to sparse storage when less than this fraction of slots hold values
+SPARSE_FILL = 1 / 8
+# Switch to a plain list when more than this fraction of slots hold values
+DENSE_FILL = 1 / 2
+# Short arrays always use a plain list
+MIN_SPARSE_LENGTH = 64
+
+class SparseMyArray():
+    # Constructor
+    # initialSizeOrValues: the number of slots (int), which all start as
+    #                      holes and take no memory, or the values (list),
+    #                      where None values are holes
+    def __init__(self, initialSizeOrValues):
+        self.__dense = None             # List of every slot, or None when sparse
+        self.__indices = array('q')     # Sparse: sorted indices of the values
+        self.__values = []              # Sparse: the values at those indices
+
+        if type(initialSizeOrValues) == list: # Array Initialization
+            self.__length = len(initialSizeOrValues)
+            self.__count = sum(1 for v in initialSizeOrValues if v is not None)
+            self.__dense = list(initialSizeOrValues)
+            self.__checkFill()
+
+        elif type(initialSizeOrValues) == int: # Array Initialization
+            self.__length = initialSizeOrValues # Every slot is a hole
+            self.__count = 0
+            self.__checkFill()
+
+        else:
+            print("Invalid") # error message
+
+    # Switch storage if the fraction of slots holding values calls for it.
+    # The gap between the two limits keeps the array from switching back
+    # and forth on every set.
+    def __checkFill(self):
+        if self.__dense is None:
+            if self.__count > self.__length * DENSE_FILL or self.__length < MIN_SPARSE_LENGTH:
+                self.__toDense()
+        elif self.__count < self.__length * SPARSE_FILL and self.__length >= MIN_SPARSE_LENGTH:
+            self.__toSparse()
+
+    # Move the values into a plain list
+    def __toDense(self):
+        dense = [None] * self.__length
+        for idx, value in zip(self.__indices, self.__values):
+            dense[idx] = value
+        self.__dense = dense
+        self.__indices = array('q')
+        self.__values = []
+
+    # Move the values out of the plain list, dropping the holes
+    def __toSparse(self):
+        self.__indices = array('q', [i for i, v in enumerate(self.__dense) if v is not None])
+        self.__values = [self.__dense[i] for i in self.__indices]
+        self.__dense = None
+
+    # Return the position of index idx in the sparse arrays,
+    # and whether a value is stored there
+    def __find(self, idx):
+        pos = bisect_left(self.__indices, idx)
+        return pos, pos < len(self.__indices) and self.__indices[pos] == idx
+
+    ########
+    # Methods
+    ########
+
+    # Return the current length of the array, holes included
+    def length(self):
+        return self.__length
+
+    def __len__(self):
+        return self.__length
+
+    # Return the number of slots holding a value
+    def count(self):
+        return self.__count
+
+    # Return True if the array is using sparse storage
+    def isSparse(self):
+        return self.__dense is None
+
+    # Return a list of every slot, with None for holes
+    def values(self):
+        if self.__dense is not None:
+            return self.__dense[:]
+        return [self.get(i) for i in range(self.__length)] if self.__count else [None] * self.__length
+
+    # Iterate over the values, skipping holes
+    def __iter__(self):
+        if self.__dense is not None:
+            return (v for v in self.__dense if v is not None)
+        return iter(self.__values)
+
+    # Iterate over (index, value) pairs, skipping holes
+    def items(self):
+        if self.__dense is not None:
+            return ((i, v) for i, v in enumerate(self.__dense) if v is not None)
+        return zip(self.__indices, self.__values)
+
+    # Return the value at index idx (None for a hole)
+    # Otherwise, do not return anything
+    def get(self, idx):
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds
+            if self.__dense is not None:
+                return self.__dense[idx]
+            pos, found = self.__find(idx)
+            if found:
+                return self.__values[pos]
+
+    # Set the value at index idx; setting None makes the slot a hole
+    def set(self, idx, value):
+        if 0 <= idx and idx < self.__length: # Check if idx is in bounds
+            if self.__dense is not None:
+                old = self.__dense[idx]
+                self.__count += (value is not None) - (old is not None)
+                self.__dense[idx] = value
+            else:
+                pos, found = self.__find(idx)
+                if found and value is None: # Remove the value
+                    del self.__indices[pos]
+                    del self.__values[pos]
+                    self.__count -= 1
+                elif found:
+                    self.__values[pos] = value
+                elif value is not None: # Fill the hole
+                    self.__indices.insert(pos, idx)
+                    self.__values.insert(pos, value)
+                    self.__count += 1
+            self.__checkFill()
+
+    # Insert value to the end of the array
+    def insert(self, value):
+        self.__length += 1
+        if self.__dense is not None:
+            self.__dense.append(None)
+        self.set(self.__length - 1, value)
+
+    # Return the index of value in the array,
+    # or -1 if value is not in the array
+    def search(self, value):
+        if self.__dense is not None:
+            try:
+                return self.__dense.index(value)
+            except ValueError:
+                return -1
+        if value is None: # Find the first hole
+            for expected, idx in enumerate(self.__indices):
+                if idx != expected:
+                    return expected
+            return len(self.__indices) if len(self.__indices) < self.__length else -1
+        for pos, found in enumerate(self.__values):
+            if found == value:
+                return self.__indices[pos]
+        return -1
+
+    # Delete every occurrence of value in the array, moving the slots
+    # after each one left, as MyArray does
+    # Returns True if value was deleted, False otherwise
+    def delete(self, value):
+        if self.search(value) == -1:
+            return False
+        if self.__dense is not None:
+            self.__dense = [v for v in self.__dense if v != value]
+            self.__length = len(self.__dense)
+            self.__count = sum(1 for v in self.__dense if v is not None)
+        elif value is None: # Deleting the holes leaves only the values
+            self.__indices = array('q', range(self.__count))
+            self.__length = self.__count
+        else:
+            indices, values = array('q'), []
+            removed = 0
+            for idx, found in zip(self.__indices, self.__values):
+                if found == value:
+                    removed += 1
+                else:
+                    indices.append(idx - removed)
+                    values.append(found)
+            self.__indices, self.__values = indices, values
+            self.__length -= removed
+            self.__count -= removed
+        self.__checkFill()
+        return True
+
+    # Print every value in the array, skipping holes
+    def traverse(self):
+        for value in self:
+            print(value)
+
+    # Return the memory (bytes) used by the storage, not counting the values
+    def memoryUsage(self):
+        if self.__dense is not None:
+            return sys.getsizeof(self.__dense)
+        return sys.getsizeof(self.__indices) + sys.getsizeof(self.__values)
+
+if __name__ == '__main__':
+    pass
@@ -1,6 +1,6 @@
 import pytest # type: ignore
 
-from ..myarray import MyArray
+from ..myarray import ArrayView, MyArray, SortedMyArray
 
 @pytest.mark.arraytest1
 def test_init_array_len(len=0):
@@ -34,4 +34,320 @@ def test_delete_array():
 def test_delete_array_absent():
     a = MyArray(['E', 'N', 'G', 'R', 2, 2, 1])
     a.delete(0)
-    assert (a.values() == ['E', 'N', 'G', 'R', 2, 2, 1] and a.length() == 7)
\ No newline at end of file
+    assert (a.values() == ['E', 'N', 'G', 'R', 2, 2, 1] and a.length() == 7)
+
+@pytest.mark.arraytest4
+def test_typed_array_api():
+    a = MyArray([1.5, 2.5, 3.5], typecode='d')
+    a.insert(4.5)
+    a.set(0, 0.5)
+    assert (a.values() == [0.5, 2.5, 3.5, 4.5] and a.length() == 4 and
+            a.get(1) == 2.5 and a.search(3.5) == 2 and a.search('x') == -1)
+
+@pytest.mark.arraytest4
+def test_typed_array_delete():
+    a = MyArray([1, 2, 2, 3], typecode='q')
+    a.delete(2)
+    assert (a.values() == [1, 3] and a.length() == 2 and a.typecode() == 'q')
+
+@pytest.mark.arraytest4
+def test_typed_array_capacity():
+    a = MyArray(4, typecode='i')
+    for i in range(10):
+        a.insert(i)
+    assert (a.values() == list(range(10)) and a.length() == 10)
+
+@pytest.mark.arraytest4
+def test_typed_array_memoryview():
+    a = MyArray(8, typecode='d')
+    a.insert(1.0)
+    a.insert(2.0)
+    view = a.memoryview()
+    # Only the current values are visible, and writes go to the array
+    view[0] = 7.0
+    assert (view.tolist() == [7.0, 2.0] and a.get(0) == 7.0 and view.nbytes == 16)
+
+@pytest.mark.arraytest4
+def test_typed_array_numpy():
+    np = pytest.importorskip("numpy")
+    a = MyArray([3, 1, 2], typecode='q')
+    values = np.frombuffer(a.memoryview(), dtype=np.int64)
+    values.sort()
+    assert a.values() == [1, 2, 3]
+
+@pytest.mark.arraytest4
+def test_typed_array_tofile(tmp_path):
+    a = MyArray([1.0, 2.0], typecode='d')
+    with open(tmp_path / "values.bin", 'wb') as f:
+        a.tofile(f)
+    assert (tmp_path / "values.bin").read_bytes() == a.memoryview().tobytes()
+
+@pytest.mark.arraytest4
+def test_untyped_array_no_buffer():
+    with pytest.raises(TypeError):
+        MyArray([1, 2]).memoryview()
+
+@pytest.mark.arraytest5
+def test_extend_array():
+    a = MyArray(['E', 'N'])
+    a.extend(iter(['G', 'R']))
+    a.extend([])
+    assert (a.values() == ['E', 'N', 'G', 'R'] and a.length() == 4)
+
+@pytest.mark.arraytest5
+def test_insert_at_array():
+    a = MyArray([1, 2, 5])
+    a.insertAt(2, [3, 4])
+    a.insertAt(0, [0])
+    a.insertAt(6, [6])
+    a.insertAt(99, [7])
+    assert (a.values() == [0, 1, 2, 3, 4, 5, 6] and a.length() == 7)
+
+@pytest.mark.arraytest5
+def test_delete_all_array():
+    a = MyArray([2, 1, 2, 3, 2])
+    assert (a.deleteAll(2) == 3 and a.values() == [1, 3] and a.deleteAll(9) == 0)
+
+@pytest.mark.arraytest5
+def test_delete_where_array():
+    a = MyArray(list(range(10)))
+    assert (a.deleteWhere(lambda v: v % 3 == 0) == 4 and a.values() == [1, 2, 4, 5, 7, 8])
+
+@pytest.mark.arraytest5
+def test_reserve_shrink_array():
+    a = MyArray([1, 2, 3])
+    a.reserve(100)
+    for v in range(4, 50):
+        a.insert(v)
+    a.shrinkToFit()
+    a.insert(50)
+    assert (a.values() == list(range(1, 51)) and a.length() == 50)
+
+@pytest.mark.arraytest5
+def test_bulk_typed_array():
+    a = MyArray(0, typecode='q')
+    a.extend(range(6))
+    a.insertAt(3, [10, 11])
+    a.deleteWhere(lambda v: v % 2 == 1)
+    assert a.values() == [0, 2, 10, 4]
+
+@pytest.mark.arraytest6
+def test_sorted_init_insert_array():
+    a = SortedMyArray([5, 1, 4])
+    for v in [3, 0, 6, 4]:
+        a.insert(v)
+    assert (a.values() == [0, 1, 3, 4, 4, 5, 6] and a.length() == 7)
+
+@pytest.mark.arraytest6
+def test_sorted_search_array():
+    a = SortedMyArray([2, 2, 2, 7, 9])
+    assert (a.search(2) == 0 and a.search(9) == 4 and a.search(3) == -1 and a.search(10) == -1)
+
+@pytest.mark.arraytest6
+def test_sorted_delete_array():
+    a = SortedMyArray([3, 1, 2, 2, 2, 5])
+    assert (a.delete(2) and not a.delete(4) and a.values() == [1, 3, 5] and a.length() == 3)
+
+@pytest.mark.arraytest6
+def test_sorted_rank_range_array():
+    a = SortedMyArray(list(range(0, 20, 2)))
+    assert (a.countLessThan(7) == 4 and a.rank(8) == 4 and a.count(8) == 1
+            and a.valuesBetween(5, 12) == [6, 8, 10, 12] and a.valuesBetween(30, 40) == [])
+
+@pytest.mark.arraytest6
+def test_sorted_keeps_order_array():
+    a = SortedMyArray([1, 3, 5])
+    a.set(1, 9)
+    a.insertAt(0, [7])
+    a.set(1, 4)
+    a.insertAt(3, [6, 8])
+    assert a.values() == [1, 4, 5, 6, 8]
+
+@pytest.mark.arraytest6
+def test_sorted_extend_array():
+    a = SortedMyArray([1, 5, 9], typecode='q')
+    a.extend([10, 11])
+    a.extend([8, 0, 5])
+    assert (a.values() == [0, 1, 5, 5, 8, 9, 10, 11] and a.search(8) == 4)
+
+@pytest.mark.arraytest5
+def test_delete_at_array():
+    a = MyArray(list(range(6)))
+    assert (a.deleteAt(1, 2) == 2 and a.deleteAt(3, 10) == 1 and a.deleteAt(9) == 0
+            and a.values() == [0, 3, 4])
+
+@pytest.mark.arraytest7
+def test_indexed_search_array():
+    a = MyArray(['E', 'N', 'G', 'R', 2, 2, 1], indexed=True)
+    a.insert('E')
+    a.set(2, 'N')
+    assert (a.search('E') == 0 and a.search(2) == 4 and a.search('G') == -1
+            and a.search([1]) == -1 and a.search('N') == 1)
+
+@pytest.mark.arraytest7
+def test_indexed_delete_array():
+    a = MyArray(['E', 'N', 'G', 'R', 2, 2, 1], indexed=True)
+    assert (a.delete(2) and not a.delete(3) and a.values() == ['E', 'N', 'G', 'R', 1]
+            and a.search(1) == 4 and a.search('R') == 3)
+
+@pytest.mark.arraytest7
+def test_indexed_matches_scan_array():
+    plain = MyArray(0)
+    indexed = MyArray(0, indexed=True)
+    for a in (plain, indexed):
+        a.extend([v % 7 for v in range(50)])
+        a.insertAt(3, [5, 5, 9])
+        a.deleteAll(5)
+        a.deleteAt(10, 4)
+        a.deleteWhere(lambda v: v == 3)
+        a.set(0, 9)
+        a.insert(6)
+    assert (indexed.values() == plain.values()
+            and all(indexed.search(v) == plain.search(v) for v in range(11)))
+
+@pytest.mark.arraytest7
+def test_index_memory_array():
+    a = MyArray(list(range(100)), indexed=True)
+    assert (a.indexed() and a.indexMemory() > 0 and MyArray([1]).indexMemory() == 0)
+
+@pytest.mark.arraytest7
+def test_index_memory_distinct_array():
+    # A value seen once stores its position, not a set of positions
+    a = MyArray(list(range(100000)), indexed=True)
+    assert a.indexMemory() < 100 * 100000
+
+@pytest.mark.arraytest7
+def test_indexed_repeated_positions_array():
+    a = MyArray([3, 1, 3, 2, 3], indexed=True)
+    a.deleteAt(0)
+    a.insertAt(1, [2, 3])
+    a.set(0, 4)
+    assert (a.values() == [4, 2, 3, 3, 2, 3] and a.search(3) == 2 and a.search(2) == 1
+            and a.deleteAll(3) == 3 and a.search(2) == 1 and a.values() == [4, 2, 2])
+
+@pytest.mark.arraytest7
+def test_indexed_block_deletes_array():
+    # After deletes that move blocks, every stored position is where its value is
+    plain = MyArray([v % 50 for v in range(2000)] + list(range(100, 1100)))
+    indexed = MyArray(plain.values(), indexed=True)
+    for a in (plain, indexed):
+        for value in (7, 150, 0, 49, 1099, 8):
+            a.deleteAll(value)
+        a.deleteAt(300, 25)
+        a.insertAt(10, [150, 7, 2000])
+    values = plain.values()
+    assert (indexed.values() == values
+            and all(indexed.search(v) == values.index(v) for v in set(values))
+            and all(indexed.search(v) == -1 for v in (0, 49, 1099, 8, 3000)))
+    # Deleting a repeated value removes exactly its stored positions
+    for value in (1, 150, 500, 7):
+        assert indexed.deleteAll(value) == plain.deleteAll(value)
+        assert indexed.values() == plain.values()
+
+@pytest.mark.arraytest8
+def test_iter_len_array():
+    a = MyArray(10)
+    a.extend(['E', 'N', 'G'])
+    assert (len(a) == 3 and list(a) == ['E', 'N', 'G'] and a[0] == 'E' and a[-1] == 'G')
+
+@pytest.mark.arraytest8
+def test_getitem_bounds_array():
+    a = MyArray([1, 2, 3])
+    with pytest.raises(IndexError):
+        a[3]
+    with pytest.raises(IndexError):
+        a[-4]
+
+@pytest.mark.arraytest8
+def test_slice_view_array():
+    a = MyArray(list(range(10)))
+    v = a[2:9:2]
+    w = v[::-1]
+    a.set(4, 'x')
+    assert (isinstance(v, ArrayView) and len(v) == 4 and v.values() == [2, 'x', 6, 8]
+            and w.values() == [8, 6, 'x', 2] and w[1] == 6 and v[1:][-1] == 8
+            and a[20:].values() == [])
+
+@pytest.mark.arraytest8
+def test_view_at_end_of_large_array():
+    # Iterating a view only visits the view's positions
+    a = MyArray(list(range(1600000)), typecode='q')
+    v = a[1599990:]
+    a.set(1599999, -1)
+    assert (list(v)[-1] == -1 and list(v[::-1])[:2] == [-1, 1599998]
+            and list(a[1599991::3]) == [1599991, 1599994, 1599997])
+
+@pytest.mark.arraytest8
+def test_pipeline_array():
+    a = MyArray(list(range(10)), typecode='q')
+    evens = a.filter(lambda v: v % 2 == 0)
+    squares = evens.map(lambda v: v * v)
+    assert (squares.values() == [0, 4, 16, 36, 64] and list(squares) == [0, 4, 16, 36, 64]
+            and a[5:].map(str).values() == ['5', '6', '7', '8', '9'] and evens.values() == [0, 2, 4, 6, 8])
+
+@pytest.mark.arraytest9
+def test_snapshot_unchanged_array():
+    a = MyArray(list(range(5000)))
+    s = a.snapshot()
+    a.set(10, 'x')
+    a.insert(5000)
+    a.insertAt(0, [-1])
+    a.delete(4000)
+    assert (s.values() == list(range(5000)) and len(s) == 5000 and s.get(10) == 10
+            and s[-1] == 4999 and s.search(4000) == 4000 and a.get(11) == 'x')
+
+@pytest.mark.arraytest9
+def test_snapshot_copies_touched_chunks_array():
+    a = MyArray(list(range(10000)), typecode='q')
+    s = a.snapshot()
+    a.extend(range(100))
+    t = a.snapshot()
+    a.set(0, -1)
+    a.set(1, -2)
+    a.set(9000, -3)
+    assert (s.savedChunks() == 2 and t.savedChunks() == 2 and s.get(0) == 0
+            and t.length() == 10100 and t.get(10050) == 50 and a.get(9000) == -3)
+
+@pytest.mark.arraytest9
+def test_snapshot_after_deletes_array():
+    a = MyArray(list(range(3000)), indexed=True)
+    s = a.snapshot()
+    a.deleteWhere(lambda v: v % 2 == 0)
+    a.shrinkToFit()
+    for v in range(5):
+        a.insert(v)
+    u = a.snapshot()
+    a.deleteAt(0, 1500)
+    assert (s.values() == list(range(3000)) and a.values() == [0, 1, 2, 3, 4]
+            and u.values()[:3] == [1, 3, 5] and u.length() == 1505
+            and s.filter(lambda v: v > 2995).values() == [2996, 2997, 2998, 2999])
+
+@pytest.mark.arraytest9
+def test_snapshot_free_writes_array():
+    # Writes only save chunks while a snapshot is alive
+    a = MyArray(list(range(5000)))
+    a.set(0, -1)
+    assert not a.tracksSnapshots()
+    s = a.snapshot()
+    a.set(1, -2)
+    a.set(2, -3)
+    t = a.snapshot()
+    del t
+    a.set(3000, -4)
+    saved = s.savedChunks()
+    del s
+    assert (saved == 2 and a.tracksSnapshots())
+    a.set(4000, -5) # The first write after the last snapshot is dropped clears the registry
+    assert not a.tracksSnapshots()
+    u = a.snapshot()
+    a.set(4001, -6)
+    a.set(4002, -7)
+    assert (u.savedChunks() == 1 and u.get(4001) == 4001 and u.get(4000) == -5)
+
+@pytest.mark.arraytest9
+def test_snapshot_iter_large_array():
+    a = MyArray(list(range(1600000)), typecode='q')
+    s = a.snapshot()
+    a.set(1599999, -1)
+    assert (sum(s) == 1599999 * 1600000 // 2 and s.search(1599998) == 1599998
+            and s.values()[-1] == 1599999)
@@ -0,0 +1,77 @@
+import random
+
+import pytest # type: ignore
+
+from ..editarray import ChunkedMyArray, GapMyArray, cursorEdits, randomEdits
+
+EDIT_ARRAYS = [GapMyArray, ChunkedMyArray]
+
+# Runs random edits on make(values) and on a plain list, and checks they agree
+def checkAgainstList(make, values, steps, seed=0):
+    rng = random.Random(seed)
+    a = make(list(values))
+    expected = list(values)
+    for step in range(steps):
+        choice = rng.randrange(5)
+        idx = rng.randint(0, len(expected))
+        if choice == 0:
+            a.insertAt(idx, [step, -step])
+            expected[idx:idx] = [step, -step]
+        elif choice == 1:
+            count = rng.randint(1, 300)
+            assert a.deleteAt(idx, count) == len(expected[idx:idx + count])
+            del expected[idx:idx + count]
+        elif choice == 2:
+            a.insert(step)
+            expected.append(step)
+        elif choice == 3 and idx < len(expected):
+            a.set(idx, 'x')
+            expected[idx] = 'x'
+        else:
+            assert a.get(idx) == (expected[idx] if idx < len(expected) else None)
+    assert (a.values() == expected and a.length() == len(expected))
+
+@pytest.mark.edittest1
+@pytest.mark.parametrize("make", EDIT_ARRAYS)
+def test_edit_init(make):
+    a = make(['E', 'N', 'G', 'R', 2, 2, 1])
+    b = make(0)
+    b.insert('Hello')
+    assert (a.values() == ['E', 'N', 'G', 'R', 2, 2, 1] and a.length() == 7
+            and b.values() == ['Hello'] and b.length() == 1)
+
+@pytest.mark.edittest1
+@pytest.mark.parametrize("make", EDIT_ARRAYS)
+def test_edit_random_ops(make):
+    checkAgainstList(make, range(1000), 2000)
+
+@pytest.mark.edittest1
+@pytest.mark.parametrize("make", EDIT_ARRAYS)
+def test_edit_search_delete(make):
+    a = make(['E', 'N', 'G', 'R', 2, 2, 1])
+    a.insertAt(3, ['N'])
+    assert (a.search(2) == 5 and a.search('N') == 1 and a.search(0) == -1
+            and a.delete(2) and not a.delete(0) and a.values() == ['E', 'N', 'G', 'N', 'R', 1])
+
+@pytest.mark.edittest1
+@pytest.mark.parametrize("make", EDIT_ARRAYS)
+def test_edit_workloads(make):
+    a = make(list(range(5000)))
+    cursorEdits(a, 500, random.Random(1))
+    randomEdits(a, 500, random.Random(2))
+    assert a.length() == 5500
+
+@pytest.mark.edittest1
+def test_gap_cursor():
+    a = GapMyArray(list(range(10)))
+    a.insertAt(4, ['a'])
+    a.deleteAt(2)
+    assert (a.cursor() == 2 and a.values() == [0, 1, 3, 'a', 4, 5, 6, 7, 8, 9])
+
+@pytest.mark.edittest1
+def test_chunked_sizes():
+    a = ChunkedMyArray(list(range(100000)))
+    chunks = a.chunkCount()
+    a.deleteAt(0, 90000)
+    assert (chunks <= 2 * 317 and a.chunkCount() <= 2 * (10000 // 100 + 1)
+            and a.values() == list(range(90000, 100000)))
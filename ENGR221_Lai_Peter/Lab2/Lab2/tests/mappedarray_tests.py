@@ -0,0 +1,51 @@
+import pytest # type: ignore
+
+from ..mappedarray import MappedMyArray
+
+@pytest.mark.mappedtest1
+def test_mapped_insert_get(tmp_path):
+    with MappedMyArray(str(tmp_path / "a.bin"), 'q') as a:
+        for v in range(100):
+            a.insert(v * 3)
+        a.set(5, -1)
+        a.set(500, 7)
+        assert (a.length() == 100 and a.capacity() == 128 and a.get(5) == -1
+                and a.get(99) == 297 and a.get(100) is None)
+
+@pytest.mark.mappedtest1
+def test_mapped_persists(tmp_path):
+    path = str(tmp_path / "a.bin")
+    with MappedMyArray(path, 'd', capacity=4) as a:
+        a.extend([1.5, 2.5, 3.5, 4.5, 5.5])
+    with MappedMyArray(path) as a:
+        assert (a.typecode() == 'd' and a.values() == [1.5, 2.5, 3.5, 4.5, 5.5])
+
+@pytest.mark.mappedtest1
+def test_mapped_search_delete(tmp_path):
+    with MappedMyArray(str(tmp_path / "a.bin"), 'i') as a:
+        a.extend([4, 2, 7, 2, 9, 2])
+        assert (a.search(7) == 2 and a.search(8) == -1 and a.delete(2)
+                and not a.delete(8) and a.values() == [4, 7, 9])
+        a.shrinkToFit()
+        assert a.capacity() == 3
+
+@pytest.mark.mappedtest1
+def test_mapped_readonly_concurrent(tmp_path):
+    path = str(tmp_path / "a.bin")
+    with MappedMyArray(path, 'q') as a:
+        a.extend(range(1000))
+    with MappedMyArray(path, readonly=True) as r1, MappedMyArray(path, readonly=True) as r2:
+        assert (r1.get(999) == 999 and r2.values() == list(range(1000)))
+        with pytest.raises(ValueError):
+            r1.insert(1)
+
+@pytest.mark.mappedtest1
+def test_mapped_bad_file(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"not an array" * 4)
+    with pytest.raises(ValueError):
+        MappedMyArray(str(path))
+    with MappedMyArray(str(tmp_path / "b.bin"), 'q') as a:
+        a.insert(1)
+    with pytest.raises(ValueError):
+        MappedMyArray(str(tmp_path / "b.bin"), 'd')
@@ -57,4 +57,31 @@ def test_traverse_set(capfd):
     s = MySet(['E', 'N', 'G', 'R', 2, 1])
     s.traverse()
     out, err = capfd.readouterr()
-    assert out == "E\nN\nG\nR\n2\n1\n"
\ No newline at end of file
+    assert out == "E\nN\nG\nR\n2\n1\n"
+
+@pytest.mark.settest6
+def test_union_set():
+    s = MySet([1, 2, 3]).union(MySet([3, 4]))
+    assert (s.size() == 4 and set(s.vals()) == set([1, 2, 3, 4]))
+
+@pytest.mark.settest6
+def test_intersection_set():
+    s = MySet(['E', 'N', 'G', 'R']).intersection(MySet(['G', 'E', 0]))
+    assert (s.size() == 2 and set(s.vals()) == set(['E', 'G']))
+
+@pytest.mark.settest6
+def test_difference_set():
+    a = MySet(range(10))
+    b = MySet([2, 4, 6, 20])
+    assert (set(a.difference(b).vals()) == set([0, 1, 3, 5, 7, 8, 9])
+            and set(b.difference(a).vals()) == set([20]))
+
+@pytest.mark.settest6
+def test_large_set():
+    s = MySet(v % 5000 for v in range(20000))
+    for v in range(0, 5000, 2):
+        s.delete(v)
+    for v in range(5000, 6000):
+        s.insert(v)
+    assert (s.size() == 3500 and s.search(4999) and not s.search(4998)
+            and s.vals()[:3] == [1, 3, 5])
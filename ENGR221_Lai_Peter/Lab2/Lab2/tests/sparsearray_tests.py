@@ -0,0 +1,73 @@
+import random
+
+import pytest # type: ignore
+
+from ..sparsearray import SparseMyArray
+
+@pytest.mark.sparsetest1
+def test_sparse_init():
+    a = SparseMyArray(1000000)
+    b = SparseMyArray(['E', None, 'G'])
+    assert (a.length() == 1000000 and a.count() == 0 and a.isSparse() and a.get(5) is None
+            and list(a) == [] and b.values() == ['E', None, 'G'] and not b.isSparse())
+
+@pytest.mark.sparsetest1
+def test_sparse_get_set():
+    a = SparseMyArray(1000)
+    a.set(10, 'x')
+    a.set(3, 'y')
+    a.set(10, 'z')
+    a.set(2000, 'w')
+    a.set(3, None)
+    assert (a.get(10) == 'z' and a.get(3) is None and a.get(2000) is None
+            and a.count() == 1 and list(a.items()) == [(10, 'z')])
+
+@pytest.mark.sparsetest1
+def test_sparse_memory():
+    a = SparseMyArray(1000000)
+    for idx in range(0, 1000000, 100):
+        a.set(idx, idx)
+    dense = SparseMyArray(list(range(1000000)))
+    assert (a.isSparse() and a.count() == 10000 and not dense.isSparse()
+            and a.memoryUsage() < dense.memoryUsage() // 40 and sum(a) == sum(range(0, 1000000, 100)))
+
+@pytest.mark.sparsetest1
+def test_sparse_switches():
+    a = SparseMyArray(200)
+    for idx in range(150):
+        a.set(idx, idx)
+    filled = a.isSparse()
+    for idx in range(145):
+        a.set(idx, None)
+    assert (not filled and a.isSparse() and list(a) == [145, 146, 147, 148, 149])
+
+@pytest.mark.sparsetest1
+def test_sparse_matches_list():
+    rng = random.Random(0)
+    a = SparseMyArray(500)
+    expected = [None] * 500
+    for step in range(3000):
+        idx = rng.randrange(520)
+        value = rng.choice([None, None, step % 7])
+        a.set(idx, value)
+        if idx < len(expected):
+            expected[idx] = value
+        if step % 500 == 0:
+            a.insert(step)
+            expected.append(step)
+        if step % 700 == 0:
+            a.delete(3)
+            expected = [v for v in expected if v != 3]
+    assert (a.values() == expected and a.length() == len(expected)
+            and list(a) == [v for v in expected if v is not None]
+            and a.search(5) == (expected.index(5) if 5 in expected else -1)
+            and a.search(None) == expected.index(None))
+
+@pytest.mark.sparsetest1
+def test_sparse_delete():
+    a = SparseMyArray(100)
+    a.set(10, 'a')
+    a.set(20, 'b')
+    a.set(30, 'a')
+    assert (a.delete('a') and not a.delete('c') and a.length() == 98 and a.get(19) == 'b'
+            and a.delete(None) and a.values() == ['b'])
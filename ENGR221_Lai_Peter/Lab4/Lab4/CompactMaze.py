@@ -0,0 +1,308 @@
+"""
+CompactMaze.py
+A Maze stored in flat byte arrays instead of one Tile object per cell.
+Cells are numbered row * num_cols + col. Three bytearrays of one byte per
+cell hold the cost of each cell (0 for a wall), whether it was visited, and
+the direction the search came from, so a maze takes 3 bytes per cell.
+
+Existing callers such as MazeSolver still work: maze.contents[row][col],
+maze.start and maze.goal return Tile-like facades over the arrays. solve()
+and solveAStar() search the cell numbers directly, without making facades.
+"""
+
+import itertools, math
+from array import array
+
+from .SearchStructures import Queue, PriorityQueue
+
+# Moves as (row change, col change): N, S, E, W, then NE, NW, SE, SW.
+# previous holds the index of the move that reached a cell, plus 1.
+MOVES = [(-1,0),(1,0),(0,1),(0,-1),(-1,1),(-1,-1),(1,1),(1,-1)]
+ORTHOGONAL_MOVES = 4
+# The characters a maze_spec may use
+CELL_CHARACTERS = b"_#SG123456789"
+# Cell costs by maze_spec character; 0 is a wall
+CELL_COSTS = bytes.maketrans(CELL_CHARACTERS, bytes([1, 0, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+
+# Maze to traverse, stored in flat arrays
+class CompactMaze():
+    # Constructor
+    # maze_spec: a list of strings specifying the maze, as for Maze
+    def __init__(self, maze_spec):
+        self.num_rows = None    # Number of rows in the maze (int)
+        self.num_cols = None    # Number of columns in the maze (int)
+        self.cells = None       # Cost of each cell, 0 for a wall (bytearray)
+        self.visited = None     # 1 for each visited cell (bytearray)
+        self.previous = None    # Move that reached each cell, plus 1 (bytearray)
+        self.start_id = None    # The starting cell (int)
+        self.goal_id = None     # The goal cell (int)
+        self.min_cost = 1       # The lowest cost of moving onto a cell (int)
+        self.nodes_expanded = 0 # Cells expanded by the last solve (int)
+        self.initializeMaze(maze_spec)
+
+    # Initializes the arrays from the maze_spec
+    def initializeMaze(self, maze_spec):
+        self.num_rows = len(maze_spec)
+        self.num_cols = len(maze_spec[0])
+        cells = bytearray()
+        for i, row in enumerate(maze_spec):
+            row = row.encode('ascii', 'replace')
+            # translate would keep any other character as its byte value
+            if row.translate(None, CELL_CHARACTERS):
+                valid = CELL_CHARACTERS.decode('ascii')
+                unknown = next(char for char in maze_spec[i] if char not in valid)
+                raise ValueError("maze row {} has unknown character {!r}, expected one of {}".format(
+                    i, unknown, valid))
+            # Start and goal tiles
+            if b'S' in row:
+                self.start_id = i * self.num_cols + row.index(b'S')
+            if b'G' in row:
+                self.goal_id = i * self.num_cols + row.index(b'G')
+            cells += row.translate(CELL_COSTS)
+        self.cells = cells
+        self.visited = bytearray(len(cells))
+        self.previous = bytearray(len(cells))
+        self.min_cost = min((cost for cost in range(1, 10) if cost in cells), default=1)
+
+    # Start and goal as Tile facades
+    @property
+    def start(self):
+        return None if self.start_id is None else CompactTile(self, self.start_id)
+
+    @property
+    def goal(self):
+        return None if self.goal_id is None else CompactTile(self, self.goal_id)
+
+    # The maze as rows of Tile facades, like Maze.contents
+    @property
+    def contents(self):
+        return TileGrid(self)
+
+    # Mark every cell as not visited, with no previous cell
+    def resetTiles(self):
+        self.visited = bytearray(len(self.cells))
+        self.previous = bytearray(len(self.cells))
+        self.nodes_expanded = 0
+
+    # Return the cell the search came from to reach cell, or None
+    def previousId(self, cell):
+        move = self.previous[cell]
+        if move == 0:
+            return None
+        dr, dc = MOVES[move - 1]
+        return cell - dr * self.num_cols - dc
+
+    # Generate the base maze as a list of lists of characters
+    # (Only contains blank tiles, weighted tiles and walls, not start or goal)
+    def makeMazeBase(self):
+        names = ["#", "_"] + [str(cost) for cost in range(2, 10)]
+        cols = self.num_cols
+        return [[names[cost] for cost in self.cells[row * cols:(row + 1) * cols]]
+                for row in range(self.num_rows)]
+
+    ########
+    # Searching the cells directly
+    ########
+
+    # Search from start to goal with the given search structure (Stack, Queue
+    # or PriorityQueue), expanding cells in the same order as MazeSolver.solve.
+    # Returns the goal cell, or None if there is no path.
+    def solve(self, searchStructure=Queue):
+        self.resetTiles()
+        cells, visited, previous = self.cells, self.visited, self.previous
+        rows, cols = self.num_rows, self.num_cols
+        ss = searchStructure()
+        ss.add(self.start_id)
+        while not ss.isEmpty():
+            current = ss.remove()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            self.nodes_expanded += 1
+            if current == self.goal_id:
+                return current
+            row, col = divmod(current, cols)
+            for move in range(ORTHOGONAL_MOVES):
+                dr, dc = MOVES[move]
+                if 0 <= row + dr < rows and 0 <= col + dc < cols:
+                    neighbor = current + dr * cols + dc
+                    if cells[neighbor] and not visited[neighbor]:
+                        previous[neighbor] = move + 1
+                        ss.add(neighbor)
+        return None
+
+    # Find the cheapest path with A* search, as MazeSolver.solveAStar does.
+    # The costs found so far take 8 more bytes per cell while it runs.
+    # heuristic: "manhattan" (4 directions) or "octile" (8 directions)
+    # Returns the goal cell, or None if there is no path.
+    def solveAStar(self, heuristic:str="manhattan"):
+        if heuristic not in ("manhattan", "octile"):
+            raise ValueError("unknown heuristic {!r}, expected manhattan or octile".format(heuristic))
+        moves = 8 if heuristic == "octile" else ORTHOGONAL_MOVES
+        self.resetTiles()
+        cells, visited, previous = self.cells, self.visited, self.previous
+        rows, cols = self.num_rows, self.num_cols
+        goal_row, goal_col = divmod(self.goal_id, cols)
+        diagonal_extra = (math.sqrt(2) - 1) * self.min_cost
+        scale = self.min_cost
+
+        # Heuristic estimate of the cost from (row, col) to the goal
+        def estimate(row, col):
+            dr, dc = abs(row - goal_row), abs(col - goal_col)
+            if moves == ORTHOGONAL_MOVES:
+                return scale * (dr + dc)
+            return scale * max(dr, dc) + diagonal_extra * min(dr, dc)
+
+        # Cheapest known cost to reach each cell, flat like the other arrays
+        best = array('d', [math.inf]) * len(cells)
+        best[self.start_id] = 0
+        order = itertools.count() # Prefer the newest cell on full ties
+        h = estimate(*divmod(self.start_id, cols))
+        frontier = PriorityQueue()
+        frontier.add(self.start_id, (h, h, 0))
+        while not frontier.isEmpty():
+            current = frontier.remove()
+            visited[current] = 1
+            self.nodes_expanded += 1
+            if current == self.goal_id:
+                return current
+            row, col = divmod(current, cols)
+            for move in range(moves):
+                dr, dc = MOVES[move]
+                if not (0 <= row + dr < rows and 0 <= col + dc < cols):
+                    continue
+                neighbor = current + dr * cols + dc
+                if not cells[neighbor] or visited[neighbor]:
+                    continue
+                step = cells[neighbor]
+                if dr and dc:
+                    # No squeezing diagonally between two walls
+                    if not cells[current + dr * cols] or not cells[current + dc]:
+                        continue
+                    step *= math.sqrt(2)
+                cost = best[current] + step
+                if cost < best[neighbor]:
+                    best[neighbor] = cost
+                    previous[neighbor] = move + 1
+                    h = estimate(row + dr, col + dc)
+                    frontier.add(neighbor, (cost + h, h, -next(order)))
+        return None
+
+    # Return the cells on the path from start to goal, or [] if there is none
+    def getPathIds(self):
+        path = []
+        current = self.goal_id
+        while current is not None:
+            path.append(current)
+            current = self.previousId(current)
+        path.reverse()
+        return path if path and path[0] == self.start_id else []
+
+# A Tile facade over one cell of a CompactMaze. Facades are made on demand,
+# so two facades of the same cell compare equal.
+class CompactTile():
+    __slots__ = ('__maze', '__id')
+
+    # Constructor
+    def __init__(self, maze, cell):
+        self.__maze = maze  # The CompactMaze holding the cell
+        self.__id = cell    # The cell number (int)
+
+    # Return the cell number
+    def getId(self):
+        return self.__id
+
+    # Return the row
+    def getRow(self):
+        return self.__id // self.__maze.num_cols
+
+    # Return the col
+    def getCol(self):
+        return self.__id % self.__maze.num_cols
+
+    # Return whether the Tile is a wall
+    def isWall(self):
+        return self.__maze.cells[self.__id] == 0
+
+    # Return the cost of moving onto this Tile
+    def getCost(self):
+        return self.__maze.cells[self.__id]
+
+    # Return whether we have visited this Tile
+    def visited(self):
+        return self.__maze.visited[self.__id] == 1
+
+    # Return the previous Tile
+    def getPrevious(self):
+        cell = self.__maze.previousId(self.__id)
+        return None if cell is None else CompactTile(self.__maze, cell)
+
+    # Mark this Tile as visited
+    def visit(self):
+        self.__maze.visited[self.__id] = 1
+
+    # Set the previous Tile, which must be a neighbour of this one (or None)
+    def setPrevious(self, previous):
+        if previous is None:
+            self.__maze.previous[self.__id] = 0
+            return
+        move = (self.getRow() - previous.getRow(), self.getCol() - previous.getCol())
+        if move not in MOVES:
+            raise ValueError("previous Tile must be next to this Tile")
+        self.__maze.previous[self.__id] = MOVES.index(move) + 1
+
+    # Mark this Tile as not visited, with no previous Tile
+    def reset(self):
+        self.__maze.visited[self.__id] = 0
+        self.__maze.previous[self.__id] = 0
+
+    def __eq__(self, other):
+        return isinstance(other, CompactTile) and self.__id == other.__id and self.__maze is other.__maze
+
+    def __hash__(self):
+        return hash(self.__id)
+
+    # Print out the values of this Tile
+    def printAttributes(self):
+        previous = self.getPrevious()
+        print("row: {}, col: {}, isWall: {}, cost: {}, visited: {}, previous: {}".format(
+                    self.getRow(), self.getCol(), self.isWall(), self.getCost(), self.visited(),
+                    None if previous is None else (previous.getRow(), previous.getCol())))
+
+# Rows of Tile facades, so maze.contents[row][col] works as it does for Maze
+class TileGrid():
+    def __init__(self, maze):
+        self.__maze = maze
+
+    def __len__(self):
+        return self.__maze.num_rows
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.__maze.num_rows:
+            raise IndexError("maze row out of range")
+        return TileRow(self.__maze, row)
+
+    def __iter__(self):
+        for row in range(self.__maze.num_rows):
+            yield TileRow(self.__maze, row)
+
+# One row of Tile facades
+class TileRow():
+    def __init__(self, maze, row):
+        self.__maze = maze
+        self.__start = row * maze.num_cols # Cell number of the first column
+
+    def __len__(self):
+        return self.__maze.num_cols
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.__maze.num_cols:
+            raise IndexError("maze col out of range")
+        return CompactTile(self.__maze, self.__start + col)
+
+    def __iter__(self):
+        for col in range(self.__maze.num_cols):
+            yield CompactTile(self.__maze, self.__start + col)
+
+if __name__ == "__main__":
+    pass
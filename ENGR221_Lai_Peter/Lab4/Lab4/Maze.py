@@ -9,13 +9,17 @@ from .Tile import Tile
 # Maze to traverse
 class Maze():
     # Constructor
-    # maze_spec: a list of strings specifying the maze
+    # maze_spec: a list of strings specifying the maze. '_' is a blank tile,
+    #            '#' a wall, 'S' the start and 'G' the goal. A digit 1-9 is
+    #            a blank tile that costs that much to move onto (blank
+    #            tiles cost 1).
     def __init__(self, maze_spec):
         self.num_rows = None    # Number of rows in the maze (int)
         self.num_cols = None    # Number of columns in the maze (int)
         self.contents = None    # The contents of the maze (Tile[][])
         self.start = None       # The starting location (Tile)
         self.goal = None         # The goal location (Tile)
+        self.min_cost = 1       # The lowest cost of moving onto a tile (int)
         self.initializeMaze(maze_spec)  # Iniitalizes the maze using the given specification
 
     # Initializes the Maze from the maze_spec
@@ -45,6 +49,18 @@ class Maze():
                 elif char == 'G':
                     self.contents[i][j] = Tile(i, j, False)
                     self.goal = self.contents[i][j]
+                # A weighted tile
+                elif char.isdigit() and char != '0':
+                    self.contents[i][j] = Tile(i, j, False, int(char))
+        # The lowest cost, so A* heuristics never overestimate
+        self.min_cost = min((tile.getCost() for row in self.contents for tile in row
+                             if tile is not None and not tile.isWall()), default=1)
+
+    # Mark every tile as not visited, with no previous tile
+    def resetTiles(self):
+        for row in self.contents:
+            for tile in row:
+                tile.reset()
 
     # Generate the base maze as a list of lists of characters
     # (Only contains blank tiles and walls, not start or goal)
@@ -59,6 +75,9 @@ class Maze():
                 # If the tile is a wall, change the maze_list character
                 if tile.isWall():
                     maze_list[row][col] = "#"
+                # Weighted tiles show their cost
+                elif tile.getCost() != 1:
+                    maze_list[row][col] = str(tile.getCost())
         # Return the completed base maze
         return maze_list
         
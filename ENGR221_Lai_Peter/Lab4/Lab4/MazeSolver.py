@@ -2,29 +2,53 @@
 Name: Peter Lai
 Description: Solving Mazes
 """
-from SearchStructures import Stack, Queue
-from Maze import Maze
+import itertools, math
+
+from .SearchStructures import Stack, Queue, PriorityQueue
+from .Maze import Maze
+
+# Moves to the 4 neighbouring tiles: N, S, E, W
+ORTHOGONAL = [(-1,0),(1,0),(0,1),(0,-1)]
+# Moves to the 4 diagonal tiles: NE, NW, SE, SW
+DIAGONAL = [(-1,1),(-1,-1),(1,1),(1,-1)]
+
+# Manhattan distance between two tiles, for moves in 4 directions
+def manhattanDistance(tile, goal) -> float:
+    return abs(tile.getRow() - goal.getRow()) + abs(tile.getCol() - goal.getCol())
+
+# Octile distance between two tiles, for moves in 8 directions where a
+# diagonal move costs sqrt(2)
+def octileDistance(tile, goal) -> float:
+    dr = abs(tile.getRow() - goal.getRow())
+    dc = abs(tile.getCol() - goal.getCol())
+    return max(dr, dc) + (math.sqrt(2) - 1) * min(dr, dc)
+
+# A* heuristics by name: (heuristic, moves allowed)
+HEURISTICS = {
+    "manhattan": (manhattanDistance, ORTHOGONAL),
+    "octile": (octileDistance, ORTHOGONAL + DIAGONAL),
+}
 
 class MazeSolver:
     # Constructor
     # Inputs:
-    #   maze: The maze to solve (Maze)
-    #   searchStructure: The search structure class to use (Stack or Queue)
-    def __init__(self, maze, searchStructure):
+    #   maze: The maze to solve (Maze or CompactMaze)
+    #   searchStructure: The search structure class to use (Stack, Queue
+    #                    or PriorityQueue, which solve() uses like a Queue)
+    def __init__(self, maze, searchStructure=Queue):
         self.maze = maze             # The maze to solve
         self.ss = searchStructure()  # Initialize a searchStructure object
+        self.nodes_expanded = 0      # Tiles expanded by the last solve
 
     def tileIsVisitable(self, row:int, col:int) -> bool:
-        if 0 <= row < self.maze.num_rows and 0 <= self.maze.num_cols:
-            tile = self.maxe.contents[row][col]
-            return not tile.isWall() and not tile.visited
+        if 0 <= row < self.maze.num_rows and 0 <= col < self.maze.num_cols:
+            tile = self.maze.contents[row][col]
+            return not tile.isWall() and not tile.visited()
         return False
-    
+
     def resetVisited(self):
-        for row in self.maze.contents:
-            for title in row:
-                title.visited = False
-                title.setPrevious(None)
+        self.maze.resetTiles()
+        self.nodes_expanded = 0
 
     def solve(self):
         self.resetVisited()
@@ -32,25 +56,81 @@ class MazeSolver:
 
         while not self.ss.isEmpty():
             current = self.ss.remove()
-            current.visited = True
+            if current.visited(): # Already expanded through another path
+                continue
+            current.visit()
+            self.nodes_expanded += 1
 
             if current == self.maze.goal:
                 return current
-            
+
             row, col = current.getRow(), current.getCol()
-            directions = [(-1,0),(1,0),(0,1),(0,-1)] #N, S, E, W
+            directions = ORTHOGONAL #N, S, E, W
 
             for dr, dc in directions:
                 if self.tileIsVisitable(row + dr, col + dc):
                     neighbor = self.maze.contents[row + dr][col + dc]
                     neighbor.setPrevious(current)
                     self.ss.add(neighbor)
-        
+
+        return None
+
+    # Find the cheapest path with A* search, where moving onto a tile costs
+    # the tile's cost (times sqrt(2) for a diagonal move).
+    # heuristic: "manhattan" (4 directions) or "octile" (8 directions;
+    #            diagonal moves may not cut past a wall's corner)
+    # Among tiles with the same estimated total cost, the one closest to the
+    # goal is expanded first. Returns the goal Tile, or None if there is no path.
+    def solveAStar(self, heuristic:str="manhattan"):
+        if heuristic not in HEURISTICS:
+            raise ValueError("unknown heuristic {!r}, expected one of {}".format(
+                heuristic, ", ".join(HEURISTICS)))
+        estimate, moves = HEURISTICS[heuristic]
+        self.resetVisited()
+        start, goal = self.maze.start, self.maze.goal
+        # Scale the heuristic so it never overestimates on weighted tiles
+        scale = self.maze.min_cost
+        best = {start: 0} # Cheapest known cost to reach each tile
+        order = itertools.count() # Prefer the newest tile on full ties
+        h = scale * estimate(start, goal)
+        frontier = PriorityQueue()
+        frontier.add(start, (h, h, 0))
+
+        while not frontier.isEmpty():
+            current = frontier.remove()
+            current.visit()
+            self.nodes_expanded += 1
+
+            if current == goal:
+                return current
+
+            row, col = current.getRow(), current.getCol()
+            for dr, dc in moves:
+                if not self.tileIsVisitable(row + dr, col + dc):
+                    continue
+                # No squeezing diagonally between two walls
+                if dr and dc and (self.maze.contents[row + dr][col].isWall() or
+                                  self.maze.contents[row][col + dc].isWall()):
+                    continue
+                neighbor = self.maze.contents[row + dr][col + dc]
+                step = neighbor.getCost() * (math.sqrt(2) if dr and dc else 1)
+                cost = best[current] + step
+                if cost < best.get(neighbor, math.inf):
+                    best[neighbor] = cost
+                    neighbor.setPrevious(current)
+                    h = scale * estimate(neighbor, goal)
+                    # Lowers the priority if neighbor is already waiting
+                    frontier.add(neighbor, (cost + h, h, -next(order)))
+
         return None
 
+    # Return the number of tiles expanded by the last solve
+    def getNodesExpanded(self) -> int:
+        return self.nodes_expanded
+
     def getPath(self):
         path = []
-        tile = self.maze.goal
+        current = self.maze.goal
 
         while current is not None:
             path.insert(0, current) # insert to maintain correct order
@@ -58,15 +138,25 @@ class MazeSolver:
 
         return path if path and path[0] == self.maze.start else [] # Return path if valid
 
+    # Return the total cost of moving along the path (0 if there is none)
+    def getPathCost(self) -> float:
+        path = self.getPath()
+        cost = 0
+        for previous, tile in zip(path, path[1:]):
+            diagonal = previous.getRow() != tile.getRow() and previous.getCol() != tile.getCol()
+            cost += tile.getCost() * (math.sqrt(2) if diagonal else 1)
+        return cost
+
     # Print the maze with the path of the found solution
     # from Start to Goal. If there is no solution, just
     # print the original maze.
-    def printSolution(self):
+    # report: also print the path length and cost and the nodes expanded
+    def printSolution(self, report:bool=False):
         # Get the solution for the maze from the maze itself
         solution = self.getPath()
         # A list of strings representing the maze
         output = self.maze.makeMazeBase() # gets base representation of maze
-        # For all of the tiles that are part of the path, 
+        # For all of the tiles that are part of the path,
         # mark it with a *
         for tile in solution:
             output[tile.getRow()][tile.getCol()] = '*' # Mark path tiles
@@ -78,12 +168,16 @@ class MazeSolver:
         for row in output:
             print(row)
 
-   
+        if report:
+            print("path length: {}, path cost: {:g}, nodes expanded: {}".format(
+                len(solution), self.getPathCost(), self.nodes_expanded))
+
+
 
 if __name__ == "__main__":
     # The maze to solve
     maze = Maze(["____",
-                 "S##E",
+                 "S##G",
                  "__#_",
                  "____"])
     # Initialize the MazeSolver to be solved with a Stack
@@ -91,4 +185,7 @@ if __name__ == "__main__":
     # Solve the maze
     solver.solve()
     # Print the solution found
-    solver.printSolution()
\ No newline at end of file
+    solver.printSolution()
+    # Solve it again with A*
+    solver.solveAStar("manhattan")
+    solver.printSolution(report=True)
@@ -11,7 +11,7 @@ class Stack():
 
     # Returns True if the Stack is empty, or False if it is not empty
     def isEmpty(self):
-        return len(self.items) == 0
+        return len(self.__items) == 0
 
     # For a Stack, this should "push" item to the top of the Stack
     def add(self, item):
@@ -24,24 +24,138 @@ class Stack():
             return self.__items.pop()
         return None # If stack is empty 
     
-# Implementation of a Queue
+# Smallest number of slots in a Queue's ring buffer
+MIN_QUEUE_CAPACITY = 8
+
+# Implementation of a Queue as a ring buffer: the items wrap around a
+# fixed-size list, so add and remove take O(1) time (amortized for add,
+# which doubles the list when it is full) and nothing is ever shifted
 class Queue():
     def __init__(self):
-        self.__items = []
+        self.__items = [None] * MIN_QUEUE_CAPACITY
+        self.__head = 0     # Index of the item at the front
+        self.__size = 0     # Number of items in the Queue
 
     # Returns True if the Queue is empty, or False if it is not empty
     def isEmpty(self):
-        return len(self.__items) == 0
+        return self.__size == 0
 
     # For a Queue, this should "enqueue" item to the end of the Queue
     def add(self, item):
-        self.__items.append(item)
+        capacity = len(self.__items)
+        if self.__size == capacity: # Full: unwrap the items into a list twice as long
+            self.__items = self.__items[self.__head:] + self.__items[:self.__head] + \
+                           [None] * capacity
+            self.__head = 0
+            capacity *= 2
+        self.__items[(self.__head + self.__size) % capacity] = item
+        self.__size += 1
 
     # For a Queue, this should "dequeue" an item from the Queue
     # and return it
     def remove(self):
         if not self.isEmpty():
-                return self.__items.pop()
+            item = self.__items[self.__head]
+            self.__items[self.__head] = None # Drop the reference
+            self.__head = (self.__head + 1) % len(self.__items)
+            self.__size -= 1
+            return item
         return None #if empty
-    
-    
\ No newline at end of file
+
+# Implementation of a Priority Queue as a binary heap. remove returns the
+# item with the lowest priority (the first one added among equals). Each
+# item's position in the heap is kept in a dict, so the priority of an item
+# already in the queue can be lowered in O(log n) time. Items must be hashable.
+class PriorityQueue():
+    def __init__(self):
+        self.__heap = []        # [priority, order added, item] entries
+        self.__positions = {}   # item -> index of its entry in the heap
+        self.__added = 0        # Number of adds, to break ties in order
+
+    # Returns True if the Priority Queue is empty, or False if it is not empty
+    def isEmpty(self):
+        return len(self.__heap) == 0
+
+    # Returns True if item is in the Priority Queue
+    def contains(self, item):
+        return item in self.__positions
+
+    # Returns the priority of item, or None if it is not in the Priority Queue
+    def getPriority(self, item):
+        if item in self.__positions:
+            return self.__heap[self.__positions[item]][0]
+        return None
+
+    # Add item with the given priority. If item is already in the Priority
+    # Queue, its priority is lowered to priority (a higher one is ignored).
+    def add(self, item, priority=0):
+        if item in self.__positions:
+            self.decreaseKey(item, priority)
+            return
+        self.__heap.append([priority, self.__added, item])
+        self.__added += 1
+        self.__positions[item] = len(self.__heap) - 1
+        self.__siftUp(len(self.__heap) - 1)
+
+    # Lower the priority of item, which must be in the Priority Queue.
+    # Returns True if the priority was lowered.
+    def decreaseKey(self, item, priority):
+        idx = self.__positions[item]
+        if not priority < self.__heap[idx][0]:
+            return False
+        self.__heap[idx][0] = priority
+        self.__siftUp(idx)
+        return True
+
+    # Remove the item with the lowest priority and return it
+    def remove(self):
+        if self.isEmpty():
+            return None
+        last = self.__heap.pop()
+        if not self.__heap:
+            del self.__positions[last[2]]
+            return last[2]
+        top = self.__heap[0]
+        del self.__positions[top[2]]
+        # Move the last entry to the root and sift it down
+        self.__heap[0] = last
+        self.__positions[last[2]] = 0
+        self.__siftDown(0)
+        return top[2]
+
+    # Move the entry at idx up until its parent is not larger
+    def __siftUp(self, idx):
+        heap = self.__heap
+        entry = heap[idx]
+        while idx > 0:
+            parent = (idx - 1) // 2
+            if not self.__less(entry, heap[parent]):
+                break
+            heap[idx] = heap[parent]
+            self.__positions[heap[idx][2]] = idx
+            idx = parent
+        heap[idx] = entry
+        self.__positions[entry[2]] = idx
+
+    # Move the entry at idx down until its children are not smaller
+    def __siftDown(self, idx):
+        heap = self.__heap
+        entry = heap[idx]
+        while True:
+            child = 2 * idx + 1
+            if child >= len(heap):
+                break
+            if child + 1 < len(heap) and self.__less(heap[child + 1], heap[child]):
+                child += 1
+            if not self.__less(heap[child], entry):
+                break
+            heap[idx] = heap[child]
+            self.__positions[heap[idx][2]] = idx
+            idx = child
+        heap[idx] = entry
+        self.__positions[entry[2]] = idx
+
+    # Order entries by priority, then by the order they were added
+    # (the items themselves are never compared)
+    def __less(self, a, b):
+        return a[0] < b[0] or (not b[0] < a[0] and a[1] < b[1])
@@ -7,10 +7,11 @@ Adapted from UCSD CSE12
 # A single unit in a maze
 class Tile:
     # Constructor
-    def __init__(self, row, col, isWall):
+    def __init__(self, row, col, isWall, cost=1):
         self.__row = row            # row of the Tile (int)
         self.__col = col            # col of the Tile (int)
         self.__isWall = isWall  # Whether the Tile is a wall (bool)
+        self.__cost = cost      # Cost of moving onto this Tile (number)
         self.__visited = False  # Whether we have visited this Tile (bool)
         self.__previous = None  # The Tile we visited prior to this one (Tile)
     
@@ -25,6 +26,10 @@ class Tile:
     # Return whether the Tile is a wall
     def isWall(self):
         return self.__isWall 
+
+    # Return the cost of moving onto this Tile
+    def getCost(self):
+        return self.__cost
     
     # Return whether we have visited this Tile
     def visited(self):
@@ -42,8 +47,13 @@ class Tile:
     def setPrevious(self, previous):
         self.__previous = previous
 
+    # Mark this Tile as not visited, with no previous Tile
+    def reset(self):
+        self.__visited = False
+        self.__previous = None
+
     # Print out the values of this Tile
     def printAttributes(self):
-        print("row: {}, col: {}, isWall: {}, visited: {}, previous: {}".format(
-                    self.__row, self.__col, self.__isWall, 
+        print("row: {}, col: {}, isWall: {}, cost: {}, visited: {}, previous: {}".format(
+                    self.__row, self.__col, self.__isWall, self.__cost,
                     self.__visited, self.__previous))
\ No newline at end of file
@@ -0,0 +1,112 @@
+import tracemalloc
+
+import pytest
+
+from ..SearchStructures import Stack, Queue, PriorityQueue
+from ..Maze import Maze
+from ..CompactMaze import CompactMaze, CompactTile
+from ..MazeSolver import MazeSolver
+
+BIG_MAZE = ["##____#_##",
+            "#____##__#",
+            "_S#_______",
+            "__##_____#",
+            "____####__",
+            "#____##___",
+            "#__##___#_",
+            "___##___##",
+            "#___#__G__",
+            "_______###"]
+
+WEIGHTED_MAZE = ["S_3_____",
+                 "_#9##_#_",
+                 "_#1__5#_",
+                 "__1#___G"]
+
+# Returns what printSolution prints after solving maze_class(spec)
+def printedSolution(capfd, maze_class, spec, solve):
+    solver = MazeSolver(maze_class(spec), Queue)
+    solve(solver)
+    solver.printSolution(report=True)
+    out, _ = capfd.readouterr()
+    return out
+
+# MazeSolver gives the same results on a CompactMaze through the Tile facade
+@pytest.mark.compact_maze
+@pytest.mark.parametrize("spec", [BIG_MAZE, WEIGHTED_MAZE, ["S#", "#G"]])
+@pytest.mark.parametrize("solve", [
+    lambda solver: solver.solve(),
+    lambda solver: solver.solveAStar("manhattan"),
+    lambda solver: solver.solveAStar("octile"),
+])
+def test_compact_maze_solver(capfd, spec, solve):
+    assert (printedSolution(capfd, CompactMaze, spec, solve)
+            == printedSolution(capfd, Maze, spec, solve))
+
+# The direct cell searches match MazeSolver on a Maze
+@pytest.mark.compact_maze
+@pytest.mark.parametrize("spec", [BIG_MAZE, WEIGHTED_MAZE])
+def test_compact_maze_direct_solve(spec):
+    maze = Maze(spec)
+    compact = CompactMaze(spec)
+    for structure in (Stack, Queue, PriorityQueue):
+        solver = MazeSolver(maze, structure)
+        solver.solve()
+        compact.solve(structure)
+        assert ([t.getRow() * maze.num_cols + t.getCol() for t in solver.getPath()] == compact.getPathIds()
+                and solver.getNodesExpanded() == compact.nodes_expanded)
+    for heuristic in ("manhattan", "octile"):
+        solver = MazeSolver(maze)
+        solver.solveAStar(heuristic)
+        compact.solveAStar(heuristic)
+        assert ([t.getRow() * maze.num_cols + t.getCol() for t in solver.getPath()] == compact.getPathIds()
+                and solver.getNodesExpanded() == compact.nodes_expanded)
+
+# The Tile facade reads and writes the maze's arrays
+@pytest.mark.compact_maze
+def test_compact_tile_facade():
+    maze = CompactMaze(WEIGHTED_MAZE)
+    tile = maze.contents[1][2]
+    tile.visit()
+    tile.setPrevious(maze.contents[0][2])
+    start = maze.start
+    assert (tile.getCost() == 9 and not tile.isWall() and maze.contents[1][1].isWall()
+            and tile.visited() and tile.getPrevious() == maze.contents[0][2]
+            and (start.getRow(), start.getCol()) == (0, 0) and start == CompactTile(maze, 0)
+            and len(maze.contents) == 4 and len(maze.contents[0]) == 8 and maze.min_cost == 1)
+    with pytest.raises(ValueError):
+        tile.setPrevious(maze.goal)
+    tile.reset()
+    assert not tile.visited() and tile.getPrevious() is None
+
+# Characters outside _#SG1-9 are rejected instead of becoming odd costs
+@pytest.mark.compact_maze
+@pytest.mark.parametrize("spec", [["S_E", "__G"], ["S_x", "__G"], ["S_é", "__G"], ["S_0", "__G"]])
+def test_compact_maze_unknown_character(spec):
+    with pytest.raises(ValueError, match="row 0"):
+        CompactMaze(spec)
+
+# A large open maze takes 3 bytes per cell and solves without Tile objects
+@pytest.mark.compact_maze
+def test_compact_maze_large():
+    size = 300
+    spec = ["S" + "_" * (size - 1)] + ["_" * size] * (size - 2) + ["_" * (size - 1) + "G"]
+    maze = CompactMaze(spec)
+    assert (maze.solveAStar() == size * size - 1 and len(maze.getPathIds()) == 2 * size - 1
+            and maze.nodes_expanded == 2 * size - 1
+            and len(maze.cells) + len(maze.visited) + len(maze.previous) == 3 * size * size)
+
+# A* keeps its costs in a flat array, not a Python object per reached cell
+@pytest.mark.compact_maze
+def test_compact_maze_astar_memory():
+    size = 80
+    spec = ["S" + "_" * (size - 1)] + ["_" * size] * (size - 3) + ["#" * size, "_" * (size - 1) + "G"]
+    maze = CompactMaze(spec)
+    tracemalloc.start()
+    try:
+        result = maze.solveAStar()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert (result is None and maze.nodes_expanded == size * (size - 2)
+            and peak < 40 * size * size)
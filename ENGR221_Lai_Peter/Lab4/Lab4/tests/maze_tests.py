@@ -1,6 +1,6 @@
-#import pytest
+import pytest
 
-from ..SearchStructures import Stack, Queue 
+from ..SearchStructures import Stack, Queue, PriorityQueue
 from ..Maze import Maze
 from ..MazeSolver import MazeSolver
 
@@ -118,4 +118,85 @@ def test_maze_big_queue(capfd):
             "['#', '_', '*', '#', '#', '_', '_', '_', '#', '_']\n" + \
             "['_', '_', '*', '#', '#', '_', '_', '_', '#', '#']\n" + \
             "['#', '_', '*', '*', '#', '_', '*', 'G', '_', '_']\n" + \
-            "['_', '_', '_', '*', '*', '*', '*', '#', '#', '#']\n"
\ No newline at end of file
+            "['_', '_', '_', '*', '*', '*', '*', '#', '#', '#']\n"
+
+def test_maze_med_priority_queue(capfd):
+    maze = Maze(["____",
+                 "S##G",
+                 "__#_",
+                 "____"])
+    # With every priority equal, a PriorityQueue searches like a Queue
+    solver = MazeSolver(maze, PriorityQueue)
+    solver.solve()
+    solver.printSolution()
+    out, _ = capfd.readouterr()
+    assert out == "['*', '*', '*', '*']\n" + \
+                  "['S', '#', '#', 'G']\n" + \
+                  "['_', '_', '#', '_']\n" + \
+                  "['_', '_', '_', '_']\n"
+
+
+#####
+# A* tests
+#####
+
+def test_maze_astar_med(capfd):
+    maze = Maze(["____",
+                 "S##G",
+                 "__#_",
+                 "____"])
+    solver = MazeSolver(maze)
+    assert solver.solveAStar() == maze.goal
+    solver.printSolution(report=True)
+    out, _ = capfd.readouterr()
+    assert out == "['*', '*', '*', '*']\n" + \
+                  "['S', '#', '#', 'G']\n" + \
+                  "['_', '_', '#', '_']\n" + \
+                  "['_', '_', '_', '_']\n" + \
+                  "path length: 6, path cost: 5, nodes expanded: 8\n"
+
+def test_maze_astar_expands_less():
+    maze = Maze(["S_________",
+                 "__________",
+                 "__________",
+                 "__________",
+                 "_________G"])
+    solver = MazeSolver(maze)
+    solver.solveAStar()
+    # Ties go toward the goal, so only the tiles on one shortest path are expanded
+    assert (len(solver.getPath()) == 14 and solver.getNodesExpanded() == 14)
+
+def test_maze_astar_weighted(capfd):
+    maze = Maze(["S99G",
+                 "____"])
+    solver = MazeSolver(maze)
+    solver.solveAStar()
+    solver.printSolution()
+    out, _ = capfd.readouterr()
+    assert (out == "['S', '9', '9', 'G']\n['*', '*', '*', '*']\n"
+            and solver.getPathCost() == 5)
+
+def test_maze_astar_octile():
+    maze = Maze(["S___#",
+                 "_____",
+                 "_____",
+                 "#____",
+                 "____G"])
+    solver = MazeSolver(maze)
+    solver.solveAStar("octile")
+    # Diagonal moves may not squeeze between two walls
+    corner = MazeSolver(Maze(["S#",
+                              "#G"]))
+    assert (len(solver.getPath()) == 5 and abs(solver.getPathCost() - 4 * 2 ** 0.5) < 1e-9
+            and corner.solveAStar("octile") is None)
+
+def test_maze_astar_no_solution():
+    maze = Maze(["_#__",
+                 "S##G",
+                 "__#_",
+                 "__#_"])
+    solver = MazeSolver(maze)
+    assert (solver.solveAStar() is None and solver.getPath() == []
+            and solver.getNodesExpanded() == 6)
+    with pytest.raises(ValueError):
+        solver.solveAStar("euclid")
@@ -1,6 +1,6 @@
 import pytest
 
-from ..SearchStructures import Stack, Queue 
+from ..SearchStructures import Stack, Queue, PriorityQueue
 
 #####
 # Stack tests
@@ -98,4 +98,87 @@ def test_queue_order():
     while not q.isEmpty():
         items_removed.append(q.remove())
     # Check that items were removed in FIFO order
-    assert items_removed == [0, 1, 2, 3, 4]
\ No newline at end of file
+    assert items_removed == [0, 1, 2, 3, 4]
+
+# Check that Queue keeps FIFO order while its ring buffer wraps around and grows
+@pytest.mark.queue
+def test_queue_wraparound():
+    # Create new queue
+    q = Queue()
+    items_removed = []
+    expected = []
+    # Interleave adds and removes so the front moves around the buffer
+    for i in range(100):
+        q.add(i)
+        q.add(-i)
+        expected += [i, -i]
+        items_removed.append(q.remove())
+    # Remove the rest of the items
+    while not q.isEmpty():
+        items_removed.append(q.remove())
+    # Check that items were removed in FIFO order, and remove() on empty returns None
+    assert items_removed == expected and q.remove() is None
+
+#####
+# Priority Queue tests
+#####
+
+# PriorityQueue isEmpty() functionality for empty priority queue
+@pytest.mark.priority_queue
+def test_priority_queue_isempty():
+    # Create a new priority queue
+    pq = PriorityQueue()
+    # isEmpty() should return true, and remove() should return None
+    assert pq.isEmpty() and pq.remove() is None
+
+# Check that PriorityQueue removes the lowest priority first,
+# and equal priorities in the order they were added
+@pytest.mark.priority_queue
+def test_priority_queue_order():
+    # Create new priority queue
+    pq = PriorityQueue()
+    # Add items with priorities
+    for item, priority in [("c", 3), ("a", 1), ("d", 3), ("b", 2), ("e", 5), ("z", 0)]:
+        pq.add(item, priority)
+    items_removed = []
+    # Remove items from the priority queue
+    while not pq.isEmpty():
+        items_removed.append(pq.remove())
+    # Check that items were removed by priority
+    assert items_removed == ["z", "a", "b", "c", "d", "e"]
+
+# Check decreaseKey() and that add() on an item already queued lowers its priority
+@pytest.mark.priority_queue
+def test_priority_queue_decrease_key():
+    # Create new priority queue
+    pq = PriorityQueue()
+    for i in range(10):
+        pq.add(i, 10 + i)
+    # Lower two priorities; a higher one is ignored
+    lowered = pq.decreaseKey(7, 1)
+    pq.add(4, 5)
+    pq.add(0, 50)
+    assert (lowered and not pq.decreaseKey(7, 3) and pq.getPriority(0) == 10
+            and pq.contains(4) and not pq.contains(10))
+    items_removed = []
+    while not pq.isEmpty():
+        items_removed.append(pq.remove())
+    assert items_removed == [7, 4, 0, 1, 2, 3, 5, 6, 8, 9]
+
+# Check PriorityQueue against sorting on random priorities
+@pytest.mark.priority_queue
+def test_priority_queue_random():
+    import random
+    rng = random.Random(0)
+    pq = PriorityQueue()
+    priorities = {}
+    for i in range(500):
+        priorities[i] = rng.randrange(1000)
+        pq.add(i, priorities[i])
+    for i in rng.sample(range(500), 200):
+        priorities[i] = min(priorities[i], rng.randrange(1000))
+        pq.decreaseKey(i, priorities[i])
+    items_removed = []
+    while not pq.isEmpty():
+        items_removed.append(pq.remove())
+    assert items_removed == sorted(range(500), key=lambda i: priorities[i])